@@ -0,0 +1,52 @@
+"""Benchmark for the application of abjad attachments on leaves.
+
+Applies attachments which add many indicators (glissandi, bend afters,
+ornamentations, string contact points and some lilypond literals) on
+notes, as it's common for indicator-dense scores. The notes are created
+before the time is measured. Run from the repository root:
+
+    python3 benchmarks/attachment_benchmark.py
+"""
+
+import time
+
+import abjad
+
+from mutwo import abjad_parameters
+
+N_LEAVES = 2000
+
+
+def make_attachment_tuple() -> tuple[abjad_parameters.abc.AbjadAttachment, ...]:
+    return (
+        abjad_parameters.Glissando(True),
+        abjad_parameters.BendAfter(bend_amount=2),
+        abjad_parameters.Ornamentation(direction="up", n_times=2),
+        abjad_parameters.StringContactPoint("sul tasto"),
+        abjad_parameters.Prall(True),
+        abjad_parameters.NaturalHarmonic(True),
+        abjad_parameters.DurationLineDashed(True),
+    )
+
+
+def apply_attachments(
+    attachment: abjad_parameters.abc.AbjadAttachment, leaf_list: list[abjad.Leaf]
+):
+    if isinstance(attachment, abjad_parameters.abc.ToggleAttachment):
+        for leaf in leaf_list:
+            attachment.process_leaf(leaf, None)
+    else:
+        for leaf in leaf_list:
+            attachment.process_leaf(leaf)
+
+
+if __name__ == "__main__":
+    total_duration = 0
+    for attachment in make_attachment_tuple():
+        leaf_list = [abjad.Note("c'", abjad.Duration(1, 4)) for _ in range(N_LEAVES)]
+        start = time.perf_counter()
+        apply_attachments(attachment, leaf_list)
+        duration = time.perf_counter() - start
+        total_duration += duration
+        print(f"{type(attachment).__name__}: {duration:.3f}s")
+    print(f"all attachments: {total_duration:.3f}s for {N_LEAVES} leaves")
@@ -0,0 +1,88 @@
+"""Benchmark for the memory which is needed by the abjad attachments of a voice.
+
+Creates the attachments of a large voice (each note has a dynamic, an
+articulation and a fermata and each bar has a tempo) once with shared
+attachments (see :meth:`mutwo.abjad_parameters.abc.AbjadAttachment.intern`)
+and once with a new attachment for each event. Also prints the size of
+single attachments. Run from the repository root:
+
+    python3 benchmarks/attachment_memory_benchmark.py
+"""
+
+import sys
+import tracemalloc
+
+from mutwo import abjad_parameters
+from mutwo import core_events
+from mutwo import music_events
+
+N_NOTES = 20000
+DYNAMIC_TUPLE = ("pp", "p", "mp", "mf", "f")
+ARTICULATION_TUPLE = (".", ">", "-")
+
+
+def make_sequential_event() -> core_events.SequentialEvent:
+    sequential_event = core_events.SequentialEvent([])
+    for nth_note in range(N_NOTES):
+        note_like = music_events.NoteLike(
+            "c", 0.25, volume=DYNAMIC_TUPLE[nth_note % len(DYNAMIC_TUPLE)]
+        )
+        playing_indicator_collection = note_like.playing_indicator_collection
+        playing_indicator_collection.articulation.name = ARTICULATION_TUPLE[
+            nth_note % len(ARTICULATION_TUPLE)
+        ]
+        playing_indicator_collection.fermata.type = "fermata"
+        sequential_event.append(note_like)
+    return sequential_event
+
+
+def make_attachment_list(
+    sequential_event: core_events.SequentialEvent, is_shared: bool
+) -> list[dict[str, abjad_parameters.abc.AbjadAttachment]]:
+    attachment_list = []
+    for nth_note, note_like in enumerate(sequential_event):
+        attachment_class_to_argument_dict = {
+            abjad_parameters.Articulation: (
+                note_like.playing_indicator_collection.articulation.get_arguments_dict()
+            ),
+            abjad_parameters.Fermata: (
+                note_like.playing_indicator_collection.fermata.get_arguments_dict()
+            ),
+            abjad_parameters.Dynamic: {"dynamic_indicator": note_like.volume.name},
+        }
+        if nth_note % 4 == 0:
+            attachment_class_to_argument_dict[abjad_parameters.Tempo] = {
+                "units_per_minute": 60
+            }
+        attachment_list.append(
+            {
+                attachment_class.get_class_name(): (
+                    attachment_class.intern(**argument_dict)
+                    if is_shared
+                    else attachment_class(**argument_dict)
+                )
+                for attachment_class, argument_dict in attachment_class_to_argument_dict.items()
+            }
+        )
+    return attachment_list
+
+
+def measure(sequential_event: core_events.SequentialEvent, is_shared: bool) -> int:
+    tracemalloc.start()
+    attachment_list = make_attachment_list(sequential_event, is_shared)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del attachment_list
+    return memory
+
+
+if __name__ == "__main__":
+    sequential_event = make_sequential_event()
+    for name, is_shared in (("new attachments", False), ("shared attachments", True)):
+        memory = measure(sequential_event, is_shared)
+        print(f"{name}: {memory / 1024 ** 2:.2f} MiB for {N_NOTES} notes")
+    print(
+        "size of one attachment: "
+        f"Dynamic {sys.getsizeof(abjad_parameters.Dynamic())} bytes, "
+        f"Tempo {sys.getsizeof(abjad_parameters.Tempo())} bytes"
+    )
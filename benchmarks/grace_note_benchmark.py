@@ -0,0 +1,45 @@
+"""Benchmark for the conversion of grace notes.
+
+Converts a voice in which each note has grace notes and after grace
+notes (as it's common for ornament-heavy repertoire). Run from the
+repository root:
+
+    python3 benchmarks/grace_note_benchmark.py
+"""
+
+import time
+
+from mutwo import abjad_converters
+from mutwo import core_events
+from mutwo import music_events
+
+N_NOTES = 200
+PITCH_TUPLE = ("c", "d", "e", "f", "g", "a", "b")
+
+
+def make_sequential_event() -> core_events.SequentialEvent:
+    sequential_event = core_events.SequentialEvent([])
+    for nth_note in range(N_NOTES):
+        note_like = music_events.NoteLike(PITCH_TUPLE[nth_note % 7], 0.5)
+        note_like.grace_note_sequential_event = core_events.SequentialEvent(
+            [
+                music_events.NoteLike(PITCH_TUPLE[(nth_note + 1) % 7], 0.0625),
+                music_events.NoteLike(PITCH_TUPLE[(nth_note + 2) % 7], 0.0625),
+            ]
+        )
+        note_like.after_grace_note_sequential_event = core_events.SequentialEvent(
+            [music_events.NoteLike(PITCH_TUPLE[(nth_note + 3) % 7], 0.0625)]
+        )
+        sequential_event.append(note_like)
+    return sequential_event
+
+
+if __name__ == "__main__":
+    converter = abjad_converters.SequentialEventToAbjadVoice(
+        abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+    )
+    sequential_event = make_sequential_event()
+    start = time.perf_counter()
+    converter.convert(sequential_event)
+    duration = time.perf_counter() - start
+    print(f"convert voice: {duration:.3f}s for {N_NOTES} notes with grace notes")
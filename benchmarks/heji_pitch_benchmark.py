@@ -0,0 +1,53 @@
+"""Benchmark for :class:`mutwo.abjad_converters.MutwoPitchToHEJIAbjadPitch`.
+
+Converts many just intonation pitches which only use a small set
+of different ratios (as it's common for just intonation scores).
+Needs 'mutwo.ext-ekmelily'. Run from the repository root:
+
+    python3 benchmarks/heji_pitch_benchmark.py
+"""
+
+import itertools
+import time
+
+from mutwo import abjad_converters
+from mutwo import music_parameters
+
+N_PITCHES = 100000
+RATIO_TUPLE = (
+    "1/1",
+    "9/8",
+    "5/4",
+    "4/3",
+    "3/2",
+    "5/3",
+    "7/4",
+    "15/8",
+    "7/6",
+    "11/8",
+    "13/8",
+    "3/4",
+    "5/8",
+    "9/4",
+)
+
+
+def convert(converter, pitch_list) -> float:
+    start = time.perf_counter()
+    for pitch in pitch_list:
+        converter.convert(pitch)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    pitch_list = [
+        music_parameters.JustIntonationPitch(ratio)
+        for ratio in itertools.islice(itertools.cycle(RATIO_TUPLE), N_PITCHES)
+    ]
+    uncached = convert(
+        abjad_converters.MutwoPitchToHEJIAbjadPitch(cache_size=None), pitch_list
+    )
+    cached = convert(abjad_converters.MutwoPitchToHEJIAbjadPitch(), pitch_list)
+    print(f"without cache: {uncached:.3f}s for {N_PITCHES} pitches")
+    print(f"with cache: {cached:.3f}s for {N_PITCHES} pitches")
+    print(f"speedup: {uncached / cached:.2f}x")
@@ -0,0 +1,43 @@
+"""Benchmark for the time which is needed to import :mod:`mutwo.abjad_converters`.
+
+Each statement runs in a fresh python interpreter, so that
+already imported modules don't distort the result. Run from the
+repository root:
+
+    python3 benchmarks/import_benchmark.py
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+N_REPETITIONS = 5
+
+STATEMENT_TUPLE = (
+    # Baseline: mutwo dependencies which are always imported
+    "from mutwo import core_converters, music_parameters",
+    "from mutwo import abjad_converters",
+    "from mutwo import abjad_converters; abjad_converters.MutwoLyricToAbjadString",
+    "from mutwo import abjad_converters; abjad_converters.MutwoPitchToAbjadPitch",
+    "from mutwo import abjad_converters; "
+    "abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer",
+    "from mutwo import abjad_converters; abjad_converters.SequentialEventToAbjadVoice",
+)
+
+
+def measure(statement: str) -> float:
+    duration_list = []
+    for _ in range(N_REPETITIONS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        duration_list.append(time.perf_counter() - start)
+    return statistics.median(duration_list)
+
+
+if __name__ == "__main__":
+    empty_interpreter_duration = measure("pass")
+    print(f"empty interpreter: {empty_interpreter_duration * 1000:.1f} ms")
+    for statement in STATEMENT_TUPLE:
+        duration = measure(statement) - empty_interpreter_duration
+        print(f"{duration * 1000:8.1f} ms  {statement}")
@@ -0,0 +1,61 @@
+"""Microbenchmark for the patched `abjad.LeafMaker._make_tied_leaf`.
+
+Run from the repository root:
+
+    python3 benchmarks/leaf_maker_benchmark.py
+"""
+
+import timeit
+
+import abjad
+
+from mutwo_third_party import abjad as abjad_patch
+
+N_REPETITIONS = 5
+N_CALLS = 2000
+
+DURATION_TUPLE = tuple(
+    abjad.Duration(numerator, denominator)
+    for numerator, denominator in (
+        (1, 4),
+        (3, 8),
+        (5, 16),
+        (7, 8),
+        (5, 4),
+        (11, 8),
+        (17, 4),
+        (37, 4),
+    )
+)
+FORBIDDEN_DURATION = abjad.Duration(8, 1)
+
+
+def make_tied_leaves():
+    for duration in DURATION_TUPLE:
+        abjad.LeafMaker._make_tied_leaf(
+            abjad.Note,
+            duration,
+            forbidden_duration=FORBIDDEN_DURATION,
+            pitches=0,
+        )
+
+
+def make_tied_leaves_without_cache():
+    abjad_patch._make_written_duration_tuple.cache_clear()
+    make_tied_leaves()
+
+
+def benchmark(function) -> float:
+    return min(
+        timeit.repeat(
+            function, number=N_CALLS // len(DURATION_TUPLE), repeat=N_REPETITIONS
+        )
+    )
+
+
+if __name__ == "__main__":
+    cold = benchmark(make_tied_leaves_without_cache)
+    warm = benchmark(make_tied_leaves)
+    print(f"cold partition table: {cold:.4f}s for {N_CALLS} leaves")
+    print(f"warm partition table: {warm:.4f}s for {N_CALLS} leaves")
+    print(f"speedup: {cold / warm:.2f}x")
@@ -0,0 +1,62 @@
+"""Benchmark for the startup time of :class:`mutwo.abjad_converters.SequentialEventToAbjadVoice`.
+
+Measures (1) how long it takes to import the module which defines the
+voice converter in a fresh python interpreter and (2) how long it takes
+to initialise a voice converter with its default arguments. Pass a
+number of milliseconds to exit with an error if the import takes longer
+(e.g. to detect regressions in CI). Run from the repository root:
+
+    python3 benchmarks/startup_benchmark.py [maximum_import_milliseconds]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+N_REPETITIONS = 5
+N_INITIALISATIONS = 100
+
+BASE_STATEMENT = (
+    "import abjad, abjadext.nauert, expenvelope, ranges, mutwo.music_converters"
+)
+IMPORT_STATEMENT = (
+    f"{BASE_STATEMENT}; from mutwo.abjad_converters.events import building"
+)
+
+
+def measure_import(statement: str) -> float:
+    duration_list = []
+    for _ in range(N_REPETITIONS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        duration_list.append(time.perf_counter() - start)
+    return statistics.median(duration_list)
+
+
+def measure_initialisation() -> float:
+    from mutwo import abjad_converters
+
+    return (
+        min(
+            timeit.repeat(
+                abjad_converters.SequentialEventToAbjadVoice,
+                number=N_INITIALISATIONS,
+                repeat=N_REPETITIONS,
+            )
+        )
+        / N_INITIALISATIONS
+    )
+
+
+if __name__ == "__main__":
+    # Only measure the time which is spent in this package and
+    # not the time which is spent to import its dependencies.
+    import_duration = measure_import(IMPORT_STATEMENT) - measure_import(BASE_STATEMENT)
+    print(f"import voice converter module: {import_duration * 1000:.1f} ms")
+    initialisation_duration = measure_initialisation()
+    print(f"initialise voice converter: {initialisation_duration * 1000:.2f} ms")
+
+    if len(sys.argv) > 1 and import_duration * 1000 > float(sys.argv[1]):
+        sys.exit(f"Import took longer than {sys.argv[1]} ms!")
@@ -0,0 +1,41 @@
+"""Benchmark for the conversion of tempo envelopes with many tempo points.
+
+Converts tempo envelopes of increasing size (as they are common for
+tempo data from performance tracking) with
+:class:`mutwo.abjad_converters.ComplexTempoEnvelopeToAbjadAttachmentTempo`.
+As the conversion needs linear time, the time per tempo point should
+stay roughly the same for all sizes. Run from the repository root:
+
+    python3 benchmarks/tempo_envelope_benchmark.py
+"""
+
+import random
+import time
+
+import expenvelope
+
+from mutwo import abjad_converters
+
+N_TEMPO_POINTS_TUPLE = (1000, 2000, 4000, 8000, 16000)
+TEMPO_TUPLE = (56, 60, 60, 60, 72, 90)
+
+
+def make_tempo_envelope(n_tempo_points: int) -> expenvelope.Envelope:
+    random.seed(n_tempo_points)
+    return expenvelope.Envelope.from_levels_and_durations(
+        levels=[random.choice(TEMPO_TUPLE) for _ in range(n_tempo_points)],
+        durations=[random.choice((0, 0.5, 1)) for _ in range(n_tempo_points - 1)],
+    )
+
+
+if __name__ == "__main__":
+    converter = abjad_converters.ComplexTempoEnvelopeToAbjadAttachmentTempo()
+    for n_tempo_points in N_TEMPO_POINTS_TUPLE:
+        tempo_envelope = make_tempo_envelope(n_tempo_points)
+        start = time.perf_counter()
+        converter.convert(tempo_envelope)
+        duration = time.perf_counter() - start
+        print(
+            f"{n_tempo_points} tempo points: {duration:.3f}s "
+            f"({duration / n_tempo_points * 1e6:.1f}µs per tempo point)"
+        )
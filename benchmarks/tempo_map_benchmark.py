@@ -0,0 +1,62 @@
+"""Benchmark for sharing the tempos of a score between its voices.
+
+Creates the voice converters of a score with many voices and a tempo
+envelope with many tempo points (as it's common for tempo data from
+performance tracking). Without a tempo map each voice converter
+converts the tempo envelope itself. With a shared
+:class:`mutwo.abjad_converters.AbjadTempoMap` the tempo envelope is
+converted once, only the first voice prints tempos and all other voices
+skip tempos. Run from the repository root:
+
+    python3 benchmarks/tempo_map_benchmark.py
+"""
+
+import random
+import time
+
+import expenvelope
+
+from mutwo import abjad_converters
+
+N_VOICES = 16
+N_TEMPO_POINTS = 4000
+TEMPO_TUPLE = (56, 60, 60, 60, 72, 90)
+
+
+def make_tempo_envelope() -> expenvelope.Envelope:
+    random.seed(N_TEMPO_POINTS)
+    return expenvelope.Envelope.from_levels_and_durations(
+        levels=[random.choice(TEMPO_TUPLE) for _ in range(N_TEMPO_POINTS)],
+        durations=[random.choice((0, 0.5, 1)) for _ in range(N_TEMPO_POINTS - 1)],
+    )
+
+
+def make_converter_list(
+    tempo_envelope: expenvelope.Envelope, is_shared: bool
+) -> list[abjad_converters.SequentialEventToAbjadVoice]:
+    quantizer = abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(
+        tempo_envelope=tempo_envelope
+    )
+    if not is_shared:
+        return [
+            abjad_converters.SequentialEventToAbjadVoice(quantizer)
+            for _ in range(N_VOICES)
+        ]
+    tempo_map = abjad_converters.AbjadTempoMap(tempo_envelope)
+    return [
+        abjad_converters.SequentialEventToAbjadVoice(quantizer, tempo_map=tempo_map)
+    ] + [
+        abjad_converters.SequentialEventToAbjadVoice(
+            quantizer, tempo_envelope_to_abjad_attachment_tempo=None
+        )
+        for _ in range(N_VOICES - 1)
+    ]
+
+
+if __name__ == "__main__":
+    tempo_envelope = make_tempo_envelope()
+    for name, is_shared in (("tempos per voice", False), ("shared tempo map", True)):
+        start = time.perf_counter()
+        make_converter_list(tempo_envelope, is_shared)
+        duration = time.perf_counter() - start
+        print(f"{name}: {duration:.3f}s for {N_VOICES} voices")
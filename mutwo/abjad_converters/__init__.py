@@ -20,20 +20,56 @@ If one wants to build complete scores from within mutwo, the module offers the
    parts of your music.
 """
 
-# Apply monkey patch
-from mutwo_third_party import abjad
+import importlib
+import typing
 
-from . import configurations
+from . import events as _events
+from . import parameters as _parameters
 
-from .process_container_routines import *
+# Force flat structure
+del events, parameters
 
-from .parameters import *
-from .events import *
+# Submodules are only imported when one of their objects is used the
+# first time, so that importing this package is cheap. Heavy dependencies
+# (abjad, nauert, expenvelope, ranges, ekmelily) and the abjad monkey patch
+# are therefore loaded on demand.
+_ATTRIBUTE_NAME_TO_MODULE_NAME_DICT = {
+    "configurations": None,
+    **{
+        attribute_name: "process_container_routines"
+        for attribute_name in (
+            "ProcessAbjadContainerRoutine",
+            "AddDurationLineEngraver",
+            "PrepareForDurationLineBasedNotation",
+            "AddInstrumentName",
+            "AddAccidentalStyle",
+            "SetStaffSize",
+        )
+    },
+    **{attribute_name: "parameters" for attribute_name in _parameters.__all__},
+    **{
+        attribute_name: "daemons"
+        for attribute_name in ("AbjadConversionDaemon", "AbjadConversionClient")
+    },
+    **{attribute_name: "events" for attribute_name in _events.__all__},
+}
+
+__all__ = tuple(_ATTRIBUTE_NAME_TO_MODULE_NAME_DICT)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name = _ATTRIBUTE_NAME_TO_MODULE_NAME_DICT[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if module_name is None:
+        attribute = importlib.import_module(f".{name}", __name__)
+    else:
+        attribute = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Next time the attribute is found without calling '__getattr__'
+    globals()[name] = attribute
+    return attribute
 
-# Force flat structure
-del events, parameters, process_container_routines
 
-# Remove unused third party import
-# XXX: We have to import it because otherwise the
-# monkey patches won't be applied.
-del abjad
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,17 @@
+"""Placeholder for default arguments (only for internal usage)."""
+
+
+class _DefaultArgument(object):
+    """Placeholder for arguments which default to a newly created object.
+
+    Only for internal usage within the converters of this package, for
+    arguments where ``None`` already has a different meaning. The default
+    object is created when initialising the converter (and not when
+    importing the module), so that converters don't share it.
+    """
+
+    def __repr__(self) -> str:
+        return "DEFAULT"
+
+
+_DEFAULT = _DefaultArgument()
@@ -1,18 +1,36 @@
 """Configure :mod:`mutwo.abjad_converters`.
 """
 
-import inspect
-
 from mutwo import abjad_parameters
 
-DEFAULT_ABJAD_ATTACHMENT_CLASS_TUPLE = tuple(
-    cls
-    for _, cls in inspect.getmembers(abjad_parameters, inspect.isclass)
-    if not inspect.isabstract(cls)
-    and abjad_parameters.abc.AbjadAttachment in inspect.getmro(cls)
+DEFAULT_ABJAD_ATTACHMENT_CLASS_TUPLE = (
+    abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple()
 )
 """Default value for argument `abjad_attachment_classes` in
-:class:`~mutwo.abjad_converters.SequentialEventToAbjadVoiceConverter`."""
+:class:`~mutwo.abjad_converters.SequentialEventToAbjadVoiceConverter`.
+Contains all registered attachment classes (including the classes of
+attachment plugins), see
+:meth:`mutwo.abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple`."""
+
+DEFAULT_DAEMON_CONVERTER_FACTORY_DICT = {
+    "voice": "mutwo.abjad_converters:SequentialEventToAbjadVoice",
+}
+"""Default value for argument `converter_factory_dict` in
+:class:`~mutwo.abjad_converters.AbjadConversionDaemon`. Maps converter
+names to import paths (`module:object`) of converter classes or
+converter instances."""
+
+DEFAULT_DAEMON_MAXIMUM_JOB_COUNT_PER_WORKER = 100
+"""Default value for argument `maximum_job_count_per_worker` in
+:class:`~mutwo.abjad_converters.AbjadConversionDaemon`. After a worker
+process converted this many objects it is replaced by a new worker
+process, so that the memory usage of the daemon doesn't grow forever."""
+
+DEFAULT_DAEMON_MAXIMUM_REQUEST_SIZE = 64 * 1024 * 1024
+"""Default value for argument `maximum_request_size` in
+:class:`~mutwo.abjad_converters.AbjadConversionDaemon`. Larger requests
+(in bytes) are rejected before they are received, so that clients can't
+make the daemon allocate arbitrary much memory."""
 
 # Cleanup
-del abjad_parameters, inspect
+del abjad_parameters
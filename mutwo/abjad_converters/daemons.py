@@ -0,0 +1,622 @@
+"""Convert mutwo events in a long running local process.
+
+Importing abjad and initialising the converters takes a considerable
+amount of time. Scripts which are called many times (e.g. by an editor
+plugin) can therefore send their events to an
+:class:`AbjadConversionDaemon` which keeps its converters (and their
+caches) warm in a pool of worker processes. The daemon can be started
+and used from the command line:
+
+.. code-block:: sh
+
+    python3 -m mutwo.abjad_converters.daemons serve /tmp/mutwo-abjad.socket
+    python3 -m mutwo.abjad_converters.daemons convert /tmp/mutwo-abjad.socket my_event.pickle
+
+**Warning:** The daemon receives pickled objects. Unpickling data from
+untrusted sources can execute arbitrary code, therefore the daemon only
+listens on a unix socket (which only the current user can access) or on
+a loopback address. Because all local users can connect to a loopback
+address, clients of a TCP socket additionally need to know a secret key
+(see argument ``authkey`` of :class:`AbjadConversionDaemon`):
+
+.. code-block:: sh
+
+    python3 -m mutwo.abjad_converters.daemons serve localhost:8000 --authkey-file ~/.mutwo-key
+    python3 -m mutwo.abjad_converters.daemons convert localhost:8000 my_event.pickle --authkey-file ~/.mutwo-key
+"""
+
+import argparse
+import hmac
+import importlib
+import ipaddress
+import multiprocessing
+import multiprocessing.pool
+import os
+import pickle
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import typing
+
+import abjad  # type: ignore
+
+# Unlike 'pickle', 'cloudpickle' can also serialise objects which
+# contain lambda functions (e.g. the envelopes of mutwo pitches).
+try:
+    from cloudpickle import dumps as _dumps_request  # type: ignore
+except ImportError:
+    from pickle import dumps as _dumps_request
+
+from mutwo import core_converters
+
+__all__ = ("AbjadConversionDaemon", "AbjadConversionClient")
+
+
+Address = typing.Union[str, tuple[str, int]]
+ConverterFactory = typing.Union[str, typing.Callable[[], core_converters.abc.Converter]]
+
+
+class ConversionDaemonError(Exception):
+    def __init__(self, message: str):
+        super().__init__(f"Conversion failed: {message}")
+
+
+class MessageTooLargeError(ConnectionError):
+    def __init__(self, n_bytes: int, maximum_size: int):
+        super().__init__(
+            f"Message with {n_bytes} bytes is larger than the "
+            f"maximum size of {maximum_size} bytes."
+        )
+
+
+# Each message starts with the size of its content in bytes.
+_HEADER = struct.Struct("!Q")
+# Size of the random challenges and of their answers in the authentication
+_AUTHENTICATION_MESSAGE_SIZE = 32
+
+
+def _send_message(connection: socket.socket, data: bytes):
+    connection.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _receive_exactly(connection: socket.socket, n_bytes: int) -> bytes:
+    data = bytearray()
+    while len(data) < n_bytes:
+        chunk = connection.recv(n_bytes - len(data))
+        if not chunk:
+            raise ConnectionError("Connection has been closed.")
+        data.extend(chunk)
+    return bytes(data)
+
+
+def _receive_message(
+    connection: socket.socket, maximum_size: typing.Optional[int] = None
+) -> bytes:
+    (n_bytes,) = _HEADER.unpack(_receive_exactly(connection, _HEADER.size))
+    # The size is checked before the content is received, so that
+    # a client can't make the daemon allocate arbitrary much memory.
+    if maximum_size is not None and n_bytes > maximum_size:
+        # The content is skipped, so that the connection can still be used.
+        n_remaining_bytes = n_bytes
+        while n_remaining_bytes > 0:
+            n_remaining_bytes -= len(
+                _receive_exactly(connection, min(n_remaining_bytes, 65536))
+            )
+        raise MessageTooLargeError(n_bytes, maximum_size)
+    return _receive_exactly(connection, n_bytes)
+
+
+def _get_authentication_digest(authkey: bytes, role: bytes, challenge: bytes) -> bytes:
+    return hmac.new(authkey, role + challenge, "sha256").digest()
+
+
+def _authenticate(connection: socket.socket, authkey: bytes, is_daemon: bool):
+    # Both sides prove that they know the key by answering a random
+    # challenge of the other side, so that clients also can't be fooled
+    # by another process which listens on the address of the daemon.
+    # The role is part of the answer, so that a challenge can't simply
+    # be sent back to get its answer.
+    own_role, other_role = (
+        (b"daemon", b"client") if is_daemon else (b"client", b"daemon")
+    )
+    challenge = os.urandom(_AUTHENTICATION_MESSAGE_SIZE)
+    _send_message(connection, challenge)
+    other_challenge = _receive_message(connection, _AUTHENTICATION_MESSAGE_SIZE)
+    _send_message(
+        connection, _get_authentication_digest(authkey, own_role, other_challenge)
+    )
+    answer = _receive_message(connection, _AUTHENTICATION_MESSAGE_SIZE)
+    if not hmac.compare_digest(
+        answer, _get_authentication_digest(authkey, other_role, challenge)
+    ):
+        raise multiprocessing.AuthenticationError(
+            "Authentication failed: the other side uses a different key."
+        )
+
+
+def _parse_address(address: str) -> Address:
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def _is_loopback_host(host: str) -> bool:
+    try:
+        address_info_list = socket.getaddrinfo(host, None)
+    except socket.gaierror:
+        return False
+    return bool(address_info_list) and all(
+        ipaddress.ip_address(address_info[4][0]).is_loopback
+        for address_info in address_info_list
+    )
+
+
+def _make_converter(
+    converter_factory: ConverterFactory,
+) -> core_converters.abc.Converter:
+    if isinstance(converter_factory, str):
+        module_name, _, object_path = converter_factory.partition(":")
+        converter_factory = importlib.import_module(module_name)
+        for attribute_name in object_path.split("."):
+            converter_factory = getattr(converter_factory, attribute_name)
+    if isinstance(converter_factory, core_converters.abc.Converter):
+        return converter_factory
+    return converter_factory()
+
+
+# Converters of the current worker process
+_converter_dict: dict[str, core_converters.abc.Converter] = {}
+
+
+def _initialize_worker(converter_factory_dict: dict[str, ConverterFactory]):
+    # The daemon process stops its workers when it's interrupted.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _converter_dict.update(
+        {
+            converter_name: _make_converter(converter_factory)
+            for converter_name, converter_factory in converter_factory_dict.items()
+        }
+    )
+
+
+def _convert_in_worker(request: bytes) -> bytes:
+    try:
+        converter_name, object_to_convert = pickle.loads(request)
+        try:
+            converter = _converter_dict[converter_name]
+        except KeyError:
+            raise KeyError(
+                f"Unknown converter '{converter_name}'. Available converters "
+                f"are: {', '.join(_converter_dict)}."
+            )
+        converted_object = converter.convert(object_to_convert)
+        if not isinstance(converted_object, str):
+            converted_object = abjad.lilypond(converted_object)
+        response = (True, converted_object)
+    except Exception as exception:
+        response = (False, f"{type(exception).__name__}: {exception}")
+    return pickle.dumps(response)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        conversion_daemon = self.server.conversion_daemon
+        if conversion_daemon._authkey is not None:
+            try:
+                _authenticate(self.request, conversion_daemon._authkey, True)
+            except (ConnectionError, multiprocessing.AuthenticationError):
+                return
+        # One connection can be used for many requests.
+        while True:
+            try:
+                request = _receive_message(
+                    self.request, conversion_daemon._maximum_request_size
+                )
+            except MessageTooLargeError as error:
+                response = pickle.dumps((False, f"{type(error).__name__}: {error}"))
+            except ConnectionError:
+                return
+            else:
+                response = conversion_daemon._process_request(request)
+            _send_message(self.request, response)
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+
+
+class AbjadConversionDaemon(object):
+    """Convert mutwo objects to LilyPond code in warm worker processes.
+
+    :param address: A path for a unix socket or a tuple with host and port
+        of a TCP socket. If the port is 0, a free port is chosen (see
+        :attr:`address`). Because the daemon unpickles all requests, the
+        host of a TCP socket has to be a loopback address (e.g.
+        ``"127.0.0.1"`` or ``"localhost"``) and an ``authkey`` is needed.
+    :type address: typing.Union[str, tuple[str, int]]
+    :param converter_factory_dict: Maps converter names (which are sent
+        by the client) to converter classes, converter instances or
+        functions which return a converter. Instead of an object an import
+        path (`module:object`) can be used. Each worker process creates its
+        converters once when it's started. Default to
+        :const:`mutwo.abjad_converters.configurations.DEFAULT_DAEMON_CONVERTER_FACTORY_DICT`.
+    :type converter_factory_dict: typing.Optional[dict[str, typing.Union[str, typing.Callable[[], core_converters.abc.Converter]]]]
+    :param n_workers: How many worker processes convert objects at the
+        same time. Default to the number of CPUs.
+    :type n_workers: typing.Optional[int]
+    :param maximum_in_flight_job_count: How many requests are converted or
+        wait for a free worker at the same time. Further requests are blocked
+        until one of the running jobs is finished. Default to twice the
+        number of workers.
+    :type maximum_in_flight_job_count: typing.Optional[int]
+    :param maximum_job_count_per_worker: After how many conversions a worker
+        process is replaced by a new one. Set to 0 to never replace
+        worker processes. Default to
+        :const:`mutwo.abjad_converters.configurations.DEFAULT_DAEMON_MAXIMUM_JOB_COUNT_PER_WORKER`.
+    :type maximum_job_count_per_worker: typing.Optional[int]
+    :param authkey: Secret key which clients need to know to send requests
+        (see argument ``authkey`` of :class:`AbjadConversionClient`). It's
+        needed for TCP sockets, because other users of the same machine
+        can connect to them. For unix sockets it's optional. Default to
+        ``None``.
+    :type authkey: typing.Optional[bytes]
+    :param maximum_request_size: Requests which are larger (in bytes) are
+        rejected. Default to
+        :const:`mutwo.abjad_converters.configurations.DEFAULT_DAEMON_MAXIMUM_REQUEST_SIZE`.
+    :type maximum_request_size: typing.Optional[int]
+
+    The converters return abjad objects which are sent back to the client
+    as LilyPond code (converters which return strings are sent back
+    unchanged).
+
+    **Example:**
+
+    >>> from mutwo import abjad_converters
+    >>> with abjad_converters.AbjadConversionDaemon("/tmp/mutwo.socket"):
+    ...     # The daemon runs in the background until the block is left
+    ...     pass
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        converter_factory_dict: typing.Optional[dict[str, ConverterFactory]] = None,
+        n_workers: typing.Optional[int] = None,
+        maximum_in_flight_job_count: typing.Optional[int] = None,
+        maximum_job_count_per_worker: typing.Optional[int] = None,
+        authkey: typing.Optional[bytes] = None,
+        maximum_request_size: typing.Optional[int] = None,
+    ):
+        from mutwo import abjad_converters
+
+        if not isinstance(address, str):
+            if not _is_loopback_host(address[0]):
+                raise ValueError(
+                    f"Can't listen on '{address[0]}': the daemon only accepts "
+                    "requests from loopback addresses, because requests are "
+                    "unpickled (which can execute arbitrary code)."
+                )
+            if not authkey:
+                raise ValueError(
+                    "TCP sockets need an 'authkey': all local users can "
+                    "connect to loopback addresses, but requests are "
+                    "unpickled (which can execute arbitrary code)."
+                )
+        if converter_factory_dict is None:
+            converter_factory_dict = (
+                abjad_converters.configurations.DEFAULT_DAEMON_CONVERTER_FACTORY_DICT
+            )
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if maximum_in_flight_job_count is None:
+            maximum_in_flight_job_count = n_workers * 2
+        if maximum_job_count_per_worker is None:
+            maximum_job_count_per_worker = (
+                abjad_converters.configurations.DEFAULT_DAEMON_MAXIMUM_JOB_COUNT_PER_WORKER
+            )
+        if maximum_request_size is None:
+            maximum_request_size = (
+                abjad_converters.configurations.DEFAULT_DAEMON_MAXIMUM_REQUEST_SIZE
+            )
+
+        self._address = address
+        self._authkey = authkey
+        self._maximum_request_size = maximum_request_size
+        self._converter_factory_dict = dict(converter_factory_dict)
+        self._n_workers = n_workers
+        # 'multiprocessing' expects 'None' to never replace workers
+        self._maximum_job_count_per_worker = maximum_job_count_per_worker or None
+        self._in_flight_job_semaphore = threading.BoundedSemaphore(
+            maximum_in_flight_job_count
+        )
+        self._pool: typing.Optional[multiprocessing.pool.Pool] = None
+        self._server: typing.Optional[socketserver.BaseServer] = None
+        self._server_thread: typing.Optional[threading.Thread] = None
+
+    def __enter__(self) -> "AbjadConversionDaemon":
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def _make_server(self) -> socketserver.BaseServer:
+        if isinstance(self._address, str):
+            # Only the current user should be allowed to send objects:
+            # the socket is already created without permissions for
+            # others (changing them after binding would leave a gap).
+            previous_umask = os.umask(0o177)
+            try:
+                server = socketserver.ThreadingUnixStreamServer(
+                    self._address, _RequestHandler
+                )
+            finally:
+                os.umask(previous_umask)
+        else:
+            server = _ThreadingTCPServer(self._address, _RequestHandler)
+        server.daemon_threads = True
+        server.conversion_daemon = self
+        return server
+
+    def _process_request(self, request: bytes) -> bytes:
+        with self._in_flight_job_semaphore:
+            try:
+                return self._pool.apply(_convert_in_worker, (request,))
+            # For instance if a worker process has been killed
+            except Exception as exception:
+                return pickle.dumps((False, f"{type(exception).__name__}: {exception}"))
+
+    @property
+    def address(self) -> Address:
+        """The address on which the daemon listens."""
+
+        if self._server is not None:
+            return self._server.server_address
+        return self._address
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    def start(self) -> "AbjadConversionDaemon":
+        """Start worker processes and listen for requests in a background thread."""
+
+        if self.is_running:
+            raise RuntimeError("Daemon is already running.")
+        # Start the pool before any threads exist, so that the
+        # worker processes can be safely forked.
+        self._pool = multiprocessing.Pool(
+            self._n_workers,
+            initializer=_initialize_worker,
+            initargs=(self._converter_factory_dict,),
+            maxtasksperchild=self._maximum_job_count_per_worker,
+        )
+        try:
+            self._server = self._make_server()
+        except Exception:
+            self._pool.terminate()
+            self._pool = None
+            raise
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._server_thread.start()
+        return self
+
+    def stop(self):
+        """Stop listening for requests and stop all worker processes."""
+
+        if not self.is_running:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join()
+        self._pool.terminate()
+        self._pool.join()
+        if isinstance(self._address, str):
+            try:
+                os.remove(self._address)
+            except FileNotFoundError:
+                pass
+        self._pool = self._server = self._server_thread = None
+
+    def serve_forever(self):
+        """Start the daemon and block until the process is interrupted."""
+
+        self.start()
+        try:
+            self._server_thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+class AbjadConversionClient(object):
+    """Send mutwo objects to an :class:`AbjadConversionDaemon`.
+
+    :param address: The address of the daemon.
+    :type address: typing.Union[str, tuple[str, int]]
+    :param timeout: How many seconds the client waits for a response
+        before it raises an error. Default to ``None`` (wait forever).
+    :type timeout: typing.Optional[float]
+    :param authkey: The secret key of the daemon. It's needed for TCP
+        sockets. Default to ``None``.
+    :type authkey: typing.Optional[bytes]
+
+    The client keeps its connection open, so that many objects can be
+    converted without connecting again. Requests of one client are sent
+    one after another: to send concurrent requests use one client per
+    thread.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        timeout: typing.Optional[float] = None,
+        authkey: typing.Optional[bytes] = None,
+    ):
+        # Responses are unpickled, too: the client only trusts daemons
+        # which can prove that they know the key.
+        if not isinstance(address, str) and not authkey:
+            raise ValueError("TCP sockets need an 'authkey'.")
+        self._address = address
+        self._timeout = timeout
+        self._authkey = authkey
+        self._connection: typing.Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "AbjadConversionClient":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _connect(self) -> socket.socket:
+        if self._connection is None:
+            if isinstance(self._address, str):
+                connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            else:
+                connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            connection.settimeout(self._timeout)
+            try:
+                connection.connect(self._address)
+                if self._authkey is not None:
+                    _authenticate(connection, self._authkey, False)
+            except Exception:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        """Close the connection to the daemon."""
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def convert(
+        self, object_to_convert: typing.Any, converter_name: str = "voice"
+    ) -> str:
+        """Convert object with a converter of the daemon.
+
+        :param object_to_convert: The object (e.g. a
+            :class:`mutwo.core_events.SequentialEvent`) which shall be converted.
+            It needs to be picklable. If `cloudpickle` is installed, it is
+            used instead of `pickle` (this is necessary for objects which
+            contain lambda functions, for instance mutwo pitches).
+        :param converter_name: The name of the converter which shall be
+            used (a key of the daemons `converter_factory_dict`). Default
+            to "voice".
+        :type converter_name: str
+        :return: LilyPond code of the converted object.
+        """
+
+        request = _dumps_request((converter_name, object_to_convert))
+        with self._lock:
+            connection = self._connect()
+            try:
+                _send_message(connection, request)
+                response = _receive_message(connection)
+            except Exception:
+                # The connection may contain half of a message now
+                self.close()
+                raise
+        is_successful, content = pickle.loads(response)
+        if not is_successful:
+            raise ConversionDaemonError(content)
+        return content
+
+
+def main(argument_sequence: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Command line interface of the daemon and the client."""
+
+    parser = argparse.ArgumentParser(
+        prog="python3 -m mutwo.abjad_converters.daemons",
+        description="Convert mutwo events to LilyPond code in a warm process.",
+    )
+    subparser_collection = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparser_collection.add_parser("serve", help="start daemon")
+    serve_parser.add_argument("address", help="unix socket path or HOST:PORT")
+    serve_parser.add_argument(
+        "--converter",
+        action="append",
+        metavar="NAME=MODULE:OBJECT",
+        help="converter which is available to clients (can be repeated)",
+    )
+    serve_parser.add_argument("--workers", type=int, help="number of processes")
+    serve_parser.add_argument(
+        "--max-in-flight-jobs", type=int, help="number of concurrent jobs"
+    )
+    serve_parser.add_argument(
+        "--max-jobs-per-worker",
+        type=int,
+        help="replace worker processes after this many jobs",
+    )
+    serve_parser.add_argument(
+        "--max-request-size", type=int, help="maximum size of requests in bytes"
+    )
+
+    convert_parser = subparser_collection.add_parser(
+        "convert", help="convert pickled objects and print LilyPond code"
+    )
+    convert_parser.add_argument("address", help="unix socket path or HOST:PORT")
+    convert_parser.add_argument("path", nargs="+", help="file with pickled object")
+    convert_parser.add_argument("--converter", default="voice", help="name")
+    convert_parser.add_argument("--timeout", type=float, help="in seconds")
+    for subparser in (serve_parser, convert_parser):
+        subparser.add_argument(
+            "--authkey-file",
+            help="file with secret key (needed for TCP sockets)",
+        )
+
+    arguments = parser.parse_args(argument_sequence)
+    address = _parse_address(arguments.address)
+    authkey = None
+    if arguments.authkey_file:
+        with open(arguments.authkey_file, "rb") as authkey_file:
+            authkey = authkey_file.read().strip()
+
+    if arguments.command == "serve":
+        converter_factory_dict = None
+        if arguments.converter:
+            converter_factory_dict = dict(
+                converter.split("=", 1) for converter in arguments.converter
+            )
+        # Stop workers and remove the socket file if the
+        # daemon is terminated (e.g. by a service manager).
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        AbjadConversionDaemon(
+            address,
+            converter_factory_dict,
+            arguments.workers,
+            arguments.max_in_flight_jobs,
+            arguments.max_jobs_per_worker,
+            authkey,
+            arguments.max_request_size,
+        ).serve_forever()
+        return 0
+
+    with AbjadConversionClient(address, arguments.timeout, authkey) as client:
+        for path in arguments.path:
+            with open(path, "rb") as pickled_object_file:
+                object_to_convert = pickle.load(pickled_object_file)
+            try:
+                print(client.convert(object_to_convert, arguments.converter))
+            except ConversionDaemonError as error:
+                print(f"{path}: {error}", file=sys.stderr)
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Import the module again, so that worker processes find
+    # the functions of this module by their module name.
+    from mutwo.abjad_converters import daemons
+
+    sys.exit(daemons.main())
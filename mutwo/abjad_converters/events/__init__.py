@@ -1,7 +1,47 @@
-from .quantization import *
-from .building import *
+import importlib
+import typing
 
-from .quantization import __all__ as _all_quantization
-from .building import __all__ as _all_building
+# Submodules are only imported when one of their classes is used
+# the first time, so that importing this package doesn't import
+# abjad, nauert, expenvelope and ranges.
+_MODULE_NAME_TO_ATTRIBUTE_NAME_TUPLE_DICT = {
+    "quantization": (
+        "SequentialEventToQuantizedAbjadContainer",
+        "NauertSequentialEventToQuantizedAbjadContainer",
+        "NauertSequentialEventToDurationLineBasedQuantizedAbjadContainer",
+        "LeafMakerSequentialEventToQuantizedAbjadContainer",
+        "LeafMakerSequentialEventToDurationLineBasedQuantizedAbjadContainer",
+    ),
+    "building": (
+        "ComplexEventToAbjadContainer",
+        "SequentialEventToAbjadVoice",
+        "IncrementalSequentialEventToAbjadVoice",
+        "NestedComplexEventToAbjadContainer",
+        "NestedComplexEventToComplexEventToAbjadContainers",
+        "CycleBasedNestedComplexEventToComplexEventToAbjadContainers",
+        "TagBasedNestedComplexEventToComplexEventToAbjadContainers",
+    ),
+}
 
-__all__ = _all_quantization + _all_building
+_ATTRIBUTE_NAME_TO_MODULE_NAME_DICT = {
+    attribute_name: module_name
+    for module_name, attribute_name_tuple in _MODULE_NAME_TO_ATTRIBUTE_NAME_TUPLE_DICT.items()
+    for attribute_name in attribute_name_tuple
+}
+
+__all__ = tuple(_ATTRIBUTE_NAME_TO_MODULE_NAME_DICT)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name = _ATTRIBUTE_NAME_TO_MODULE_NAME_DICT[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attribute = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Next time the attribute is found without calling '__getattr__'
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,21 +1,43 @@
 """Module to build complex multi-level abjad based scores from mutwo events."""
 
 import abc
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import dataclasses
+import hashlib
 import inspect
 import itertools
+import multiprocessing
+import io
+import os
+import pickle
+import sys
+import types
 import typing
+import warnings
+import weakref
 
 try:
     import quicktions as fractions  # type: ignore
 except ImportError:
     import fractions  # type: ignore
 
+# Unlike 'pickle', 'cloudpickle' can also serialise objects which
+# contain lambda functions (e.g. the envelopes of mutwo pitches).
+try:
+    from cloudpickle import dumps as _dumps_for_worker  # type: ignore
+except ImportError:
+    from pickle import dumps as _dumps_for_worker
+
 import abjad  # type: ignore
 
 from mutwo import abjad_converters
 from mutwo import abjad_parameters
 from mutwo import core_converters
 from mutwo import core_events
+from mutwo import core_parameters
 from mutwo import core_utilities
 from mutwo import music_converters
 from mutwo import music_parameters
@@ -24,14 +46,19 @@ from ..parameters import MutwoPitchToAbjadPitch
 from ..parameters import MutwoVolumeToAbjadAttachmentDynamic
 from ..parameters import TempoEnvelopeToAbjadAttachmentTempo
 from ..parameters import ComplexTempoEnvelopeToAbjadAttachmentTempo
+from ..parameters import AbjadTempoMap
 from ..parameters import MutwoLyricToAbjadString
 
+from .._defaults import _DEFAULT
+from .._defaults import _DefaultArgument
+
 from .quantization import SequentialEventToQuantizedAbjadContainer
 from .quantization import NauertSequentialEventToQuantizedAbjadContainer
 
 from .quantization import (
     NauertSequentialEventToDurationLineBasedQuantizedAbjadContainer,
 )
+from .quantization import LeafMakerSequentialEventToQuantizedAbjadContainer
 from .quantization import (
     LeafMakerSequentialEventToDurationLineBasedQuantizedAbjadContainer,
 )
@@ -40,6 +67,7 @@ from .quantization import (
 __all__ = (
     "ComplexEventToAbjadContainer",
     "SequentialEventToAbjadVoice",
+    "IncrementalSequentialEventToAbjadVoice",
     "NestedComplexEventToAbjadContainer",
     "NestedComplexEventToComplexEventToAbjadContainers",
     "CycleBasedNestedComplexEventToComplexEventToAbjadContainers",
@@ -47,6 +75,367 @@ __all__ = (
 )
 
 
+# Converters (and for forked workers also the events) of a worker
+# process of '_convert_in_worker_processes'
+_worker_converter_tuple: tuple[core_converters.abc.Converter, ...] = ()
+_worker_complex_event_tuple: tuple[core_events.abc.ComplexEvent, ...] = ()
+
+
+def _initialize_worker(
+    converter_tuple: typing.Union[tuple[core_converters.abc.Converter, ...], bytes],
+    complex_event_tuple: tuple[core_events.abc.ComplexEvent, ...],
+):
+    global _worker_converter_tuple, _worker_complex_event_tuple
+    # Workers which aren't forked receive pickled converters.
+    if isinstance(converter_tuple, bytes):
+        converter_tuple = pickle.loads(converter_tuple)
+    _worker_converter_tuple = converter_tuple
+    _worker_complex_event_tuple = complex_event_tuple
+
+
+def _convert_in_worker(
+    converter_index: int, complex_event: typing.Union[int, bytes]
+) -> abjad.Container:
+    # Forked workers already know all events (and only receive their
+    # index), other workers receive each event pickled with its job.
+    if isinstance(complex_event, int):
+        complex_event = _worker_complex_event_tuple[complex_event]
+    else:
+        complex_event = pickle.loads(complex_event)
+    return _worker_converter_tuple[converter_index].convert(complex_event)
+
+
+def _convert_in_current_process(
+    converter_and_complex_event_tuple: tuple[
+        tuple[core_converters.abc.Converter, core_events.abc.ComplexEvent], ...
+    ],
+) -> typing.Iterator[typing.Union[abjad.Container, Exception]]:
+    for converter, complex_event in converter_and_complex_event_tuple:
+        try:
+            abjad_container = converter.convert(complex_event)
+        except Exception as exception:
+            yield exception
+        else:
+            yield abjad_container
+
+
+def _convert_in_worker_processes(
+    converter_and_complex_event_tuple: tuple[
+        tuple[core_converters.abc.Converter, core_events.abc.ComplexEvent], ...
+    ],
+    n_workers: typing.Optional[int],
+    multiprocessing_context: typing.Optional[
+        multiprocessing.context.BaseContext
+    ] = None,
+) -> typing.Iterator[typing.Union[abjad.Container, Exception]]:
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(converter_and_complex_event_tuple))
+
+    if n_workers <= 1:
+        yield from _convert_in_current_process(converter_and_complex_event_tuple)
+        return
+
+    # Workers which are forked receive converters and events without
+    # pickling them (converters and events can contain lambda functions).
+    # Forking is only safe on Linux: on macOS system libraries may crash
+    # in forked processes, so there the default start method is used.
+    if multiprocessing_context is None:
+        if sys.platform.startswith("linux"):
+            multiprocessing_context = multiprocessing.get_context("fork")
+        else:
+            multiprocessing_context = multiprocessing.get_context()
+    is_forked = multiprocessing_context.get_start_method() == "fork"
+
+    # Each converter is only sent once to each worker.
+    converter_list: list[core_converters.abc.Converter] = []
+    converter_id_to_converter_index: dict[int, int] = {}
+    converter_index_list: list[int] = []
+    for converter, _ in converter_and_complex_event_tuple:
+        try:
+            converter_index = converter_id_to_converter_index[id(converter)]
+        except KeyError:
+            converter_index = len(converter_list)
+            converter_id_to_converter_index[id(converter)] = converter_index
+            converter_list.append(converter)
+        converter_index_list.append(converter_index)
+
+    if is_forked:
+        initargs = (
+            tuple(converter_list),
+            tuple(
+                complex_event for _, complex_event in converter_and_complex_event_tuple
+            ),
+        )
+    else:
+        try:
+            initargs = (_dumps_for_worker(tuple(converter_list)), ())
+        except Exception as exception:
+            warnings.warn(
+                f"Can't send converters to worker processes ({exception}), "
+                "therefore all events are converted in the current process."
+            )
+            yield from _convert_in_current_process(converter_and_complex_event_tuple)
+            return
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        n_workers,
+        mp_context=multiprocessing_context,
+        initializer=_initialize_worker,
+        initargs=initargs,
+    )
+    try:
+        future_list = []
+        for index, (converter_index, (_, complex_event)) in enumerate(
+            zip(converter_index_list, converter_and_complex_event_tuple)
+        ):
+            if is_forked:
+                job = index
+            else:
+                try:
+                    job = _dumps_for_worker(complex_event)
+                except Exception as exception:
+                    future = concurrent.futures.Future()
+                    future.set_exception(exception)
+                    future_list.append(future)
+                    continue
+            future_list.append(
+                executor.submit(_convert_in_worker, converter_index, job)
+            )
+        for future in future_list:
+            exception = future.exception()
+            if exception is None:
+                yield future.result()
+            else:
+                yield exception
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+# A converter can't convert two events at the same time (it
+# isn't thread safe), therefore each converter has its own lock.
+# Locks can only be used by one event loop, so each event loop
+# (e.g. of each call of 'asyncio.run') has its own locks.
+_loop_to_converter_to_conversion_lock: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    weakref.WeakKeyDictionary[core_converters.abc.Converter, asyncio.Lock],
+] = weakref.WeakKeyDictionary()
+
+
+def _get_conversion_lock(converter: core_converters.abc.Converter) -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    try:
+        converter_to_conversion_lock = _loop_to_converter_to_conversion_lock[loop]
+    except KeyError:
+        converter_to_conversion_lock = weakref.WeakKeyDictionary()
+        _loop_to_converter_to_conversion_lock[loop] = converter_to_conversion_lock
+    try:
+        return converter_to_conversion_lock[converter]
+    except KeyError:
+        conversion_lock = converter_to_conversion_lock[converter] = asyncio.Lock()
+        return conversion_lock
+
+
+async def _run_in_executor(
+    executor: typing.Optional[concurrent.futures.Executor],
+    semaphore: typing.Optional[asyncio.Semaphore],
+    function: typing.Callable[..., typing.Any],
+    *argument,
+) -> typing.Any:
+    if semaphore is not None:
+        async with semaphore:
+            return await _run_in_executor(executor, None, function, *argument)
+    future = asyncio.get_running_loop().run_in_executor(executor, function, *argument)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # A running function can't be stopped: wait until it's finished,
+        # so that the converter isn't used by two conversions at once.
+        await asyncio.wait((future,))
+        raise
+
+
+class _ContentHashPickler(pickle.Pickler):
+    """Pickler which describes the content of mutwo events.
+
+    Functions (e.g. lambda functions of envelopes) can't be pickled,
+    therefore they are identified by their id. Events with equal, but
+    not identical functions therefore have a different hash. Because
+    the id of a function can be reused as soon as the function doesn't
+    exist anymore, the pickler collects all hashed functions: whoever
+    keeps the hash also needs to keep these functions alive (see
+    :class:`_ResultCache`).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.function_list: list[types.FunctionType] = []
+
+    def persistent_id(self, object_: typing.Any) -> typing.Any:
+        if isinstance(object_, types.FunctionType):
+            self.function_list.append(object_)
+            return ("function", id(object_))
+        if isinstance(object_, types.MethodType):
+            return ("method", object_.__func__, object_.__self__)
+        return None
+
+
+def _get_content_hash(
+    object_: typing.Any,
+) -> tuple[typing.Optional[bytes], tuple[types.FunctionType, ...]]:
+    # Return the hash and the functions which are identified by their id
+    # in the hash (they need to be kept alive as long as the hash is used).
+    file = io.BytesIO()
+    pickler = _ContentHashPickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        pickler.dump(object_)
+    # Objects which can't be pickled can't be cached
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None, ()
+    return (
+        hashlib.blake2b(file.getvalue(), digest_size=16).digest(),
+        tuple(pickler.function_list),
+    )
+
+
+def _estimate_abjad_container_memory(abjad_container: abjad.Container) -> int:
+    memory = 0
+    for component in abjad.iterate(abjad_container).components():
+        memory += sys.getsizeof(component)
+        for wrapper in abjad.get.wrappers(component):
+            memory += sys.getsizeof(wrapper) + sys.getsizeof(wrapper.indicator)
+    return memory
+
+
+class ResultCacheInfo(typing.NamedTuple):
+    """Statistics of the result cache of a converter."""
+
+    hit_count: int
+    miss_count: int
+    entry_count: int
+    memory: int
+
+
+class _ResultCache(object):
+    """Bounded mapping which forgets the least recently used results.
+
+    The cache is full if it either contains ``maxsize`` entries or if the
+    estimated memory of all entries is bigger than ``maximum_memory``.
+    Each entry keeps the functions of its key alive, so that their ids
+    (which are part of the key) can't be reused by other functions.
+    """
+
+    def __init__(
+        self, maxsize: typing.Optional[int], maximum_memory: typing.Optional[int]
+    ):
+        self._maxsize = maxsize
+        self._maximum_memory = maximum_memory
+        self._data: collections.OrderedDict = collections.OrderedDict()
+        self._configuration_tuple: tuple[typing.Any, ...] = ()
+        self.clear()
+
+    def set_configuration(self, configuration_tuple: tuple[typing.Any, ...]):
+        # Results of a converter with a different configuration are invalid
+        if len(configuration_tuple) != len(self._configuration_tuple) or any(
+            configuration is not previous_configuration
+            for configuration, previous_configuration in zip(
+                configuration_tuple, self._configuration_tuple
+            )
+        ):
+            self._data.clear()
+            self._memory = 0
+            self._configuration_tuple = configuration_tuple
+
+    def get(self, key: typing.Hashable) -> typing.Optional[abjad.Container]:
+        try:
+            abjad_container, *_ = self._data[key]
+        except KeyError:
+            self._miss_count += 1
+            return None
+        self._hit_count += 1
+        self._data.move_to_end(key)
+        return abjad_container
+
+    def set(
+        self,
+        key: typing.Hashable,
+        abjad_container: abjad.Container,
+        function_tuple: tuple[types.FunctionType, ...] = (),
+    ):
+        memory = _estimate_abjad_container_memory(abjad_container)
+        # Results which are bigger than the complete cache are never stored
+        if self._maximum_memory is not None and memory > self._maximum_memory:
+            return
+        if key in self._data:
+            self._memory -= self._data.pop(key)[1]
+        self._data[key] = (abjad_container, memory, function_tuple)
+        self._memory += memory
+        while (self._maxsize is not None and len(self._data) > self._maxsize) or (
+            self._maximum_memory is not None and self._memory > self._maximum_memory
+        ):
+            self._memory -= self._data.popitem(last=False)[1][1]
+
+    def clear(self):
+        self._data.clear()
+        self._memory = 0
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @property
+    def info(self) -> ResultCacheInfo:
+        return ResultCacheInfo(
+            self._hit_count, self._miss_count, len(self._data), self._memory
+        )
+
+
+# The default arguments of the converters are module level functions
+# (and not lambda functions), so that converters can be pickled (e.g.
+# to send them to worker processes which aren't forked).
+
+
+def _get_no_name(_: core_events.abc.ComplexEvent) -> None:
+    return None
+
+
+def _get_tag(complex_event: core_events.abc.ComplexEvent) -> str:
+    return complex_event.tag
+
+
+def _get_empty_sequential_event(
+    _: core_events.SimpleEvent,
+) -> core_events.SequentialEvent:
+    return core_events.SequentialEvent([])
+
+
+class _IsSimpleEventRest(object):
+    """Default of argument 'is_simple_event_rest': events without pitches are rests."""
+
+    def __init__(
+        self,
+        simple_event_to_pitch_list: typing.Callable[
+            [core_events.SimpleEvent], list[music_parameters.abc.Pitch]
+        ],
+    ):
+        self._simple_event_to_pitch_list = simple_event_to_pitch_list
+
+    def __call__(self, simple_event: core_events.SimpleEvent) -> bool:
+        pitch_list = core_utilities.call_function_except_attribute_error(
+            self._simple_event_to_pitch_list, simple_event, []
+        )
+        return not bool(pitch_list)
+
+
+class ChildConversionError(Exception):
+    """A child of a nested event couldn't be converted in a worker process."""
+
+    def __init__(self, nth_child: int, child: core_events.abc.ComplexEvent):
+        super().__init__(
+            f"Couldn't convert child {nth_child} (tag: "
+            f"'{getattr(child, 'tag', None)}') in a worker process."
+        )
+        self.nth_child = nth_child
+
+
 class ComplexEventToAbjadContainer(core_converters.abc.Converter):
     def __init__(
         self,
@@ -147,6 +536,151 @@ class ComplexEventToAbjadContainer(core_converters.abc.Converter):
         self._post_process_abjad_container(complex_event_to_convert, abjad_container)
         return abjad_container
 
+    async def _afill_abjad_container(
+        self,
+        abjad_container_to_fill: abjad.Container,
+        complex_event_to_convert: core_events.abc.ComplexEvent,
+        executor: typing.Optional[concurrent.futures.Executor],
+        semaphore: typing.Optional[asyncio.Semaphore],
+    ):
+        await _run_in_executor(
+            executor,
+            semaphore,
+            self._fill_abjad_container,
+            abjad_container_to_fill,
+            complex_event_to_convert,
+        )
+
+    async def aconvert(
+        self,
+        complex_event_to_convert: core_events.abc.ComplexEvent,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        semaphore: typing.Optional[asyncio.Semaphore] = None,
+    ) -> abjad.Container:
+        """Convert event without blocking the running event loop.
+
+        :param complex_event_to_convert: The event which shall be converted.
+        :type complex_event_to_convert: core_events.abc.ComplexEvent
+        :param executor: The executor which runs the conversion steps
+            (making the container, pre-processing, filling and
+            post-processing the container). The steps change the same
+            abjad container, therefore the executor needs to run them in the
+            current process (e.g. :class:`concurrent.futures.ThreadPoolExecutor`).
+            Default to ``None`` (the default executor of the event loop).
+        :type executor: typing.Optional[concurrent.futures.Executor]
+        :param semaphore: Limits how many conversion steps run at the same
+            time. Share one semaphore between many conversions to keep the
+            event loop responsive. Default to ``None`` (no limit).
+        :type semaphore: typing.Optional[asyncio.Semaphore]
+
+        If the conversion is cancelled, the currently running step is
+        finished, but no further step is started. Conversions with the same
+        converter run one after another.
+
+        **Example:**
+
+        >>> import asyncio
+        >>> from mutwo import abjad_converters
+        >>> from mutwo import core_events
+        >>> from mutwo import music_events
+        >>> converter = abjad_converters.SequentialEventToAbjadVoice(
+        ...     abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        ... )
+        >>> sequential_event = core_events.SequentialEvent(
+        ...     [music_events.NoteLike("c", 1)]
+        ... )
+        >>> abjad_voice = asyncio.run(converter.aconvert(sequential_event))
+        """
+
+        async with _get_conversion_lock(self):
+            abjad_container = await _run_in_executor(
+                executor,
+                semaphore,
+                self._make_empty_abjad_container,
+                complex_event_to_convert,
+            )
+            await _run_in_executor(
+                executor,
+                semaphore,
+                self._pre_process_abjad_container,
+                complex_event_to_convert,
+                abjad_container,
+            )
+            await self._afill_abjad_container(
+                abjad_container, complex_event_to_convert, executor, semaphore
+            )
+            await _run_in_executor(
+                executor,
+                semaphore,
+                self._post_process_abjad_container,
+                complex_event_to_convert,
+                abjad_container,
+            )
+        return abjad_container
+
+    def convert_many(
+        self,
+        complex_event_iterable: typing.Iterable[core_events.abc.ComplexEvent],
+        n_workers: typing.Optional[int] = None,
+        multiprocessing_context: typing.Optional[
+            multiprocessing.context.BaseContext
+        ] = None,
+    ) -> typing.Iterator[typing.Union[abjad.Container, Exception]]:
+        """Convert many independent events in parallel worker processes.
+
+        :param complex_event_iterable: The events which shall be converted.
+        :type complex_event_iterable: typing.Iterable[core_events.abc.ComplexEvent]
+        :param n_workers: How many worker processes convert events at the
+            same time. If set to 1, all events are converted in the current
+            process. Default to the number of CPUs.
+        :type n_workers: typing.Optional[int]
+        :param multiprocessing_context: The context (start method) of the
+            worker processes, e.g. ``multiprocessing.get_context("spawn")``.
+            If set to ``None`` the "fork" start method is used on Linux
+            and the default start method of the platform otherwise.
+            Default to ``None``.
+        :type multiprocessing_context: typing.Optional[multiprocessing.context.BaseContext]
+        :return: Yields the converted abjad containers in the order of the
+            events (and not in the order in which the workers finish them):
+            a container is yielded as soon as it and all containers before it
+            are ready. If an event couldn't be converted, the raised exception
+            is yielded instead of a container (so that the remaining events
+            are still converted).
+
+        Each worker process receives a copy of the converter when it is
+        started, and then converts many events with the same converter (and
+        its caches). If the workers are forked nothing needs to be pickled.
+        Otherwise the converter is pickled once for each worker and each
+        event is pickled with its job (with `cloudpickle` if it is installed,
+        because mutwo pitches contain lambda functions). If the converter
+        can't be pickled, a warning is shown and all events are converted in
+        the current process.
+
+        **Example:**
+
+        >>> from mutwo import abjad_converters
+        >>> from mutwo import core_events
+        >>> from mutwo import music_events
+        >>> converter = abjad_converters.SequentialEventToAbjadVoice(
+        ...     abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        ... )
+        >>> sequential_event_list = [
+        ...     core_events.SequentialEvent([music_events.NoteLike(pitch, 1)])
+        ...     for pitch in "c d e".split()
+        ... ]
+        >>> for abjad_voice in converter.convert_many(sequential_event_list):
+        ...     print(type(abjad_voice).__name__)
+        Voice
+        Voice
+        Voice
+        """
+
+        return _convert_in_worker_processes(
+            tuple((self, complex_event) for complex_event in complex_event_iterable),
+            n_workers,
+            multiprocessing_context,
+        )
+
 
 class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
     """Convert :class:`~mutwo.core_events.SequentialEvent` to :class:`abjad.Voice`.
@@ -154,6 +688,7 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
     :param sequential_event_to_quantized_abjad_container: Class which
         defines how the Mutwo data will be quantized. See
         :class:`SequentialEventToQuantizedAbjadContainer` for more information.
+        Default to a new :class:`NauertSequentialEventToQuantizedAbjadContainer`.
     :type sequential_event_to_quantized_abjad_container: SequentialEventToQuantizedAbjadContainer, optional
     :param simple_event_to_pitch_list: Function to extract from a
         :class:`mutwo.core_events.SimpleEvent` a tuple that contains pitch objects
@@ -263,11 +798,14 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         to convert :class:`mutwo.music_parameters.abc.Volume` objects to
         :class:`mutwo.converters.frontends.abjad_parameters.Dynamic` objects.
         See :class:`MutwoVolumeToAbjadAttachmentDynamic` for more information.
+        Set to ``None`` if no dynamics shall be notated.
     :type mutwo_volume_to_abjad_attachment_dynamic: MutwoVolumeToAbjadAttachmentDynamic, optional
     :param tempo_envelope_to_abjad_attachment_tempo: Class which defines how
         to convert tempo envelopes to
         :class:`mutwo.converters.frontends.abjad_parameters.Tempo` objects.
         See :class:`TempoEnvelopeToAbjadAttachmentTempo` for more information.
+        Default to a new :class:`ComplexTempoEnvelopeToAbjadAttachmentTempo`.
+        Set to ``None`` if no tempos shall be notated.
     :type tempo_envelope_to_abjad_attachment_tempo: TempoEnvelopeToAbjadAttachmentTempo, optional
     :param mutwo_lyric_to_abjad_string: Callable which defines how
         to convert :class:`mutwo.music_parameters.abc.Lyric` to a string.
@@ -281,6 +819,36 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         rests that last a complete bar with multimeasure rests (rests with uppercase
         "R" in Lilypond). Default to ``True``.
     :type write_multimeasure_rests: bool
+    :param cache_size: If set to a positive integer, the converter memorizes
+        up to ``cache_size`` converted voices. If the same event is converted
+        again (for instance a doubled part or a repeated section), a copy
+        of the memorized voice is returned instead of converting the event
+        again. Events are identified by a hash of their content. Least
+        recently used voices are forgotten first. The cache is cleared as
+        soon as another object is assigned to an attribute of the
+        converter. If an attribute is changed in place, call
+        :meth:`clear_cache`. Default to ``None`` (no cache).
+    :type cache_size: typing.Optional[int]
+    :param cache_memory_limit: If set, the memorized voices are forgotten
+        (starting with the least recently used voice) as soon as their
+        estimated memory exceeds ``cache_memory_limit`` bytes. If
+        ``cache_memory_limit`` is set, but ``cache_size`` isn't, the cache
+        is only limited by its memory. Default to ``None``.
+    :type cache_memory_limit: typing.Optional[int]
+    :param tempo_map: If set, the converter takes its tempos from the
+        tempo map instead of converting the tempo envelope of its
+        quantizer with ``tempo_envelope_to_abjad_attachment_tempo``. This is
+        useful for scores with many voices: the tempo envelope is
+        converted only once and its tempos are shared by all voices.
+        Voices which don't need to print tempos (usually all voices of a
+        score except one) shouldn't get a tempo map and should set
+        ``tempo_envelope_to_abjad_attachment_tempo`` to ``None``, so that
+        they skip tempos entirely. The tempo envelope of the tempo map has
+        to be equal to the tempo envelope of the quantizer and
+        ``tempo_envelope_to_abjad_attachment_tempo`` can't be set together
+        with a tempo map (otherwise a ``ValueError`` is raised). Default
+        to ``None``.
+    :type tempo_map: typing.Optional[AbjadTempoMap]
     """
 
     ExtractedData = tuple[
@@ -297,44 +865,56 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
 
     def __init__(
         self,
-        sequential_event_to_quantized_abjad_container: SequentialEventToQuantizedAbjadContainer = NauertSequentialEventToQuantizedAbjadContainer(),
-        simple_event_to_pitch_list: typing.Callable[
-            [core_events.SimpleEvent], list[music_parameters.abc.Pitch]
-        ] = music_converters.SimpleEventToPitchList(),
-        simple_event_to_volume: typing.Callable[
-            [core_events.SimpleEvent], music_parameters.abc.Volume
-        ] = music_converters.SimpleEventToVolume(),
-        simple_event_to_grace_note_sequential_event: typing.Callable[
-            [core_events.SimpleEvent],
-            core_events.SequentialEvent[core_events.SimpleEvent],
-        ] = music_converters.SimpleEventToGraceNoteSequentialEvent(),
-        simple_event_to_after_grace_note_sequential_event: typing.Callable[
-            [core_events.SimpleEvent],
-            core_events.SequentialEvent[core_events.SimpleEvent],
-        ] = music_converters.SimpleEventToAfterGraceNoteSequentialEvent(),
-        simple_event_to_playing_indicator_collection: typing.Callable[
-            [core_events.SimpleEvent],
-            music_parameters.PlayingIndicatorCollection,
-        ] = music_converters.SimpleEventToPlayingIndicatorCollection(),
-        simple_event_to_notation_indicator_collection: typing.Callable[
-            [core_events.SimpleEvent],
-            music_parameters.NotationIndicatorCollection,
-        ] = music_converters.SimpleEventToNotationIndicatorCollection(),
-        simple_event_to_lyric: typing.Callable[
-            [core_events.SimpleEvent],
-            music_parameters.abc.Lyric,
-        ] = music_converters.SimpleEventToLyric(),
+        sequential_event_to_quantized_abjad_container: typing.Optional[
+            SequentialEventToQuantizedAbjadContainer
+        ] = None,
+        simple_event_to_pitch_list: typing.Optional[
+            typing.Callable[[core_events.SimpleEvent], list[music_parameters.abc.Pitch]]
+        ] = None,
+        simple_event_to_volume: typing.Optional[
+            typing.Callable[[core_events.SimpleEvent], music_parameters.abc.Volume]
+        ] = None,
+        simple_event_to_grace_note_sequential_event: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent],
+                core_events.SequentialEvent[core_events.SimpleEvent],
+            ]
+        ] = None,
+        simple_event_to_after_grace_note_sequential_event: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent],
+                core_events.SequentialEvent[core_events.SimpleEvent],
+            ]
+        ] = None,
+        simple_event_to_playing_indicator_collection: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent],
+                music_parameters.PlayingIndicatorCollection,
+            ]
+        ] = None,
+        simple_event_to_notation_indicator_collection: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent],
+                music_parameters.NotationIndicatorCollection,
+            ]
+        ] = None,
+        simple_event_to_lyric: typing.Optional[
+            typing.Callable[
+                [core_events.SimpleEvent],
+                music_parameters.abc.Lyric,
+            ]
+        ] = None,
         is_simple_event_rest: typing.Optional[
             typing.Callable[[core_events.SimpleEvent], bool]
         ] = None,
-        mutwo_pitch_to_abjad_pitch: MutwoPitchToAbjadPitch = MutwoPitchToAbjadPitch(),
-        mutwo_volume_to_abjad_attachment_dynamic: typing.Optional[
-            MutwoVolumeToAbjadAttachmentDynamic
-        ] = MutwoVolumeToAbjadAttachmentDynamic(),
-        tempo_envelope_to_abjad_attachment_tempo: typing.Optional[
-            TempoEnvelopeToAbjadAttachmentTempo
-        ] = ComplexTempoEnvelopeToAbjadAttachmentTempo(),
-        mutwo_lyric_to_abjad_string: MutwoLyricToAbjadString = MutwoLyricToAbjadString(),
+        mutwo_pitch_to_abjad_pitch: typing.Optional[MutwoPitchToAbjadPitch] = None,
+        mutwo_volume_to_abjad_attachment_dynamic: typing.Union[
+            MutwoVolumeToAbjadAttachmentDynamic, None, _DefaultArgument
+        ] = _DEFAULT,
+        tempo_envelope_to_abjad_attachment_tempo: typing.Union[
+            TempoEnvelopeToAbjadAttachmentTempo, None, _DefaultArgument
+        ] = _DEFAULT,
+        mutwo_lyric_to_abjad_string: typing.Optional[MutwoLyricToAbjadString] = None,
         abjad_attachment_class_sequence: typing.Sequence[
             typing.Type[abjad_parameters.abc.AbjadAttachment]
         ] = None,
@@ -343,14 +923,70 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         lilypond_type_of_abjad_container: str = "Voice",
         complex_event_to_abjad_container_name: typing.Callable[
             [core_events.abc.ComplexEvent], typing.Optional[str]
-        ] = lambda _: None,
+        ] = _get_no_name,
         pre_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
         post_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
+        cache_size: typing.Optional[int] = None,
+        cache_memory_limit: typing.Optional[int] = None,
+        tempo_map: typing.Optional[AbjadTempoMap] = None,
     ):
+        # Default converters are only created here (and not in the
+        # function signature), so that they aren't created when importing
+        # the module and aren't shared between different voice converters.
+        if sequential_event_to_quantized_abjad_container is None:
+            sequential_event_to_quantized_abjad_container = (
+                NauertSequentialEventToQuantizedAbjadContainer()
+            )
+        if simple_event_to_pitch_list is None:
+            simple_event_to_pitch_list = music_converters.SimpleEventToPitchList()
+        if simple_event_to_volume is None:
+            simple_event_to_volume = music_converters.SimpleEventToVolume()
+        if simple_event_to_grace_note_sequential_event is None:
+            simple_event_to_grace_note_sequential_event = (
+                music_converters.SimpleEventToGraceNoteSequentialEvent()
+            )
+        if simple_event_to_after_grace_note_sequential_event is None:
+            simple_event_to_after_grace_note_sequential_event = (
+                music_converters.SimpleEventToAfterGraceNoteSequentialEvent()
+            )
+        if simple_event_to_playing_indicator_collection is None:
+            simple_event_to_playing_indicator_collection = (
+                music_converters.SimpleEventToPlayingIndicatorCollection()
+            )
+        if simple_event_to_notation_indicator_collection is None:
+            simple_event_to_notation_indicator_collection = (
+                music_converters.SimpleEventToNotationIndicatorCollection()
+            )
+        if simple_event_to_lyric is None:
+            simple_event_to_lyric = music_converters.SimpleEventToLyric()
+        if mutwo_pitch_to_abjad_pitch is None:
+            mutwo_pitch_to_abjad_pitch = MutwoPitchToAbjadPitch()
+        # For the following two arguments 'None' means that no
+        # dynamics / tempos shall be notated.
+        if mutwo_volume_to_abjad_attachment_dynamic is _DEFAULT:
+            mutwo_volume_to_abjad_attachment_dynamic = (
+                MutwoVolumeToAbjadAttachmentDynamic()
+            )
+        if tempo_map is not None:
+            # The tempo map already converted the tempo envelope.
+            if tempo_envelope_to_abjad_attachment_tempo is not _DEFAULT:
+                raise ValueError(
+                    "Found both 'tempo_map' and "
+                    "'tempo_envelope_to_abjad_attachment_tempo'. Please "
+                    "pass the tempo converter to the tempo map instead."
+                )
+            tempo_envelope_to_abjad_attachment_tempo = None
+        elif tempo_envelope_to_abjad_attachment_tempo is _DEFAULT:
+            tempo_envelope_to_abjad_attachment_tempo = (
+                ComplexTempoEnvelopeToAbjadAttachmentTempo()
+            )
+        if mutwo_lyric_to_abjad_string is None:
+            mutwo_lyric_to_abjad_string = MutwoLyricToAbjadString()
+
         # special treatment for duration line based quantizer
         if isinstance(
             sequential_event_to_quantized_abjad_container,
@@ -383,12 +1019,7 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
             abjad_attachment_class_sequence = tuple(abjad_attachment_class_sequence)
 
         if is_simple_event_rest is None:
-
-            def is_simple_event_rest(simple_event: core_events.SimpleEvent) -> bool:
-                pitch_list = core_utilities.call_function_except_attribute_error(
-                    simple_event_to_pitch_list, simple_event, []
-                )
-                return not bool(pitch_list)
+            is_simple_event_rest = _IsSimpleEventRest(simple_event_to_pitch_list)
 
         self._abjad_attachment_class_sequence = abjad_attachment_class_sequence
 
@@ -430,7 +1061,21 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         self._mutwo_volume_to_abjad_attachment_dynamic = (
             mutwo_volume_to_abjad_attachment_dynamic
         )
-        if tempo_envelope_to_abjad_attachment_tempo:
+        if tempo_map is not None:
+            tempo_envelope = (
+                self._sequential_event_to_quantized_abjad_container.tempo_envelope
+            )
+            if (
+                tempo_map.tempo_envelope is not tempo_envelope
+                and tempo_map.tempo_envelope != tempo_envelope
+            ):
+                raise ValueError(
+                    f"The tempo envelope of the tempo map '{tempo_map}' differs "
+                    f"from the tempo envelope '{tempo_envelope}' of the quantizer. "
+                    "Please use the same tempo envelope for both."
+                )
+            tempo_attachment_tuple = tempo_map.tempo_attachment_tuple
+        elif tempo_envelope_to_abjad_attachment_tempo:
             tempo_attachment_tuple = tempo_envelope_to_abjad_attachment_tempo.convert(
                 self._sequential_event_to_quantized_abjad_container.tempo_envelope
             )
@@ -442,6 +1087,16 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
 
         self._write_multimeasure_rests = write_multimeasure_rests
 
+        self._is_before_to_grace_notes_converter: dict[
+            bool, _GraceNotesToAbjadVoiceConverter
+        ] = {}
+
+        if cache_size or cache_memory_limit:
+            result_cache = _ResultCache(cache_size, cache_memory_limit)
+        else:
+            result_cache = None
+        self._result_cache = result_cache
+
     # ###################################################################### #
     #                          static methods                                #
     # ###################################################################### #
@@ -504,6 +1159,26 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
 
         return attachment_dict
 
+    def _get_grace_notes_converter(
+        self, is_before: bool
+    ) -> "_GraceNotesToAbjadVoiceConverter":
+        # Grace note converters are only created when they are needed the
+        # first time and are reused for all events of all voices.
+        try:
+            return self._is_before_to_grace_notes_converter[is_before]
+        except KeyError:
+            converter = _GraceNotesToAbjadVoiceConverter(
+                is_before,
+                self._simple_event_to_pitch_list,
+                self._simple_event_to_volume,
+                self._simple_event_to_playing_indicator_collection,
+                self._simple_event_to_notation_indicator_collection,
+                self._is_simple_event_rest,
+                self._mutwo_pitch_to_abjad_pitch,
+            )
+            self._is_before_to_grace_notes_converter[is_before] = converter
+            return converter
+
     def _grace_note_sequential_event_to_abjad_attachment(
         self,
         grace_note_sequential_event_or_after_grace_note_sequential_event: core_events.SequentialEvent[
@@ -513,15 +1188,7 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
     ) -> dict[str, abjad_parameters.abc.AbjadAttachment]:
         if not grace_note_sequential_event_or_after_grace_note_sequential_event:
             return {}
-        converter = _GraceNotesToAbjadVoiceConverter(
-            is_before,
-            self._simple_event_to_pitch_list,
-            self._simple_event_to_volume,
-            self._simple_event_to_playing_indicator_collection,
-            self._simple_event_to_notation_indicator_collection,
-            self._is_simple_event_rest,
-            self._mutwo_pitch_to_abjad_pitch,
-        )
+        converter = self._get_grace_notes_converter(is_before)
         grace_note_sequential_event_container = converter.convert(
             grace_note_sequential_event_or_after_grace_note_sequential_event
         )
@@ -661,34 +1328,79 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         abjad_parameters_per_type_per_event_tuple: tuple[
             tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...], ...
         ],
-    ) -> None:
-        for abjad_parameters_per_type in abjad_parameters_per_type_per_event_tuple:
-            previous_attachment = None
-            for related_abjad_leaf_index_tuple_tuple, attachment in zip(
-                related_abjad_leaf_index_tuple_tuple_per_simple_event,
-                abjad_parameters_per_type,
-            ):
+        previous_attachment_tuple: typing.Optional[
+            tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...]
+        ] = None,
+    ) -> tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...]:
+        # Attachments which have been applied before the converted leaves
+        # (e.g. in previous bars), one attachment for each type.
+        if previous_attachment_tuple is None:
+            previous_attachment_tuple = tuple(
+                None for _ in abjad_parameters_per_type_per_event_tuple
+            )
+        # The leaves of each event are only searched once in the voice,
+        # processed leaves replace them afterwards.
+        nth_event_to_leaf_tuple: dict[int, tuple[abjad.Leaf, ...]] = {}
+        last_attachment_list = []
+        for abjad_parameters_per_type, previous_attachment in zip(
+            abjad_parameters_per_type_per_event_tuple, previous_attachment_tuple
+        ):
+            nth_event_list, attachment_list = [], []
+            for nth_event, attachment in enumerate(abjad_parameters_per_type):
                 if attachment and attachment.is_active:
-                    abjad_leaves = tuple(
+                    nth_event_list.append(nth_event)
+                    attachment_list.append(attachment)
+            if not attachment_list:
+                last_attachment_list.append(previous_attachment)
+                continue
+
+            leaf_tuple_list = []
+            for nth_event in nth_event_list:
+                try:
+                    leaf_tuple = nth_event_to_leaf_tuple[nth_event]
+                except KeyError:
+                    leaf_tuple = nth_event_to_leaf_tuple[nth_event] = tuple(
                         core_utilities.get_nested_item_from_index_sequence(
                             index_tuple,
                             quanitisized_abjad_leaf_voice,
                         )
-                        for index_tuple in related_abjad_leaf_index_tuple_tuple
+                        for index_tuple in related_abjad_leaf_index_tuple_tuple_per_simple_event[
+                            nth_event
+                        ]
                     )
-                    processed_abjad_leaves = attachment.process_leaf_tuple(
-                        abjad_leaves, previous_attachment
+                leaf_tuple_list.append(leaf_tuple)
+
+            # All attachments of one type are processed at once.
+            for nth_event, leaf_tuple, processed_leaf_tuple in zip(
+                nth_event_list,
+                leaf_tuple_list,
+                type(attachment_list[0]).process_leaf_tuple_batch(
+                    leaf_tuple_list, attachment_list, previous_attachment
+                ),
+            ):
+                # Nothing happened (e.g. a toggle attachment didn't change).
+                if processed_leaf_tuple is leaf_tuple:
+                    continue
+                # Processed leaves are put into the voice before the next
+                # leaf tuple is processed: abjad then doesn't need to search
+                # all previously attached indicators with a context (as
+                # dynamics) to find duplicates.
+                for processed_leaf, index_tuple in zip(
+                    processed_leaf_tuple,
+                    related_abjad_leaf_index_tuple_tuple_per_simple_event[nth_event],
+                ):
+                    core_utilities.set_nested_item_from_index_sequence(
+                        index_tuple,
+                        quanitisized_abjad_leaf_voice,
+                        processed_leaf,
                     )
-                    for processed_abjad_leaf, index_tuple in zip(
-                        processed_abjad_leaves, related_abjad_leaf_index_tuple_tuple
-                    ):
-                        core_utilities.set_nested_item_from_index_sequence(
-                            index_tuple,
-                            quanitisized_abjad_leaf_voice,
-                            processed_abjad_leaf,
-                        )
+                nth_event_to_leaf_tuple[nth_event] = (
+                    tuple(processed_leaf_tuple)[: len(leaf_tuple)]
+                    + leaf_tuple[len(processed_leaf_tuple) :]
+                )
 
-                    previous_attachment = attachment
+            last_attachment_list.append(attachment_list[-1])
+        return tuple(last_attachment_list)
 
     def _extract_pitch_list_and_volume_from_simple_event(
         self, simple_event: core_events.SimpleEvent
@@ -741,13 +1453,9 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
                     abjad_leaf.note_head._written_pitch = abjad_pitch_list[0]
 
             else:
-                new_abjad_leaf = leaf_class(
-                    [abjad.NamedPitch() for _ in abjad_pitch_list],
-                    abjad_leaf.written_duration,
+                new_abjad_leaf = abjad_parameters.abc.LeafRewritePlan.to_chord(
+                    abjad_leaf, [abjad.NamedPitch() for _ in abjad_pitch_list]
                 )
-                for indicator in abjad.get.indicators(abjad_leaf):
-                    if type(indicator) != dict:
-                        abjad.attach(indicator, new_abjad_leaf)
 
                 for abjad_pitch, note_head in zip(
                     abjad_pitch_list, new_abjad_leaf.note_heads
@@ -760,6 +1468,19 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
                     new_abjad_leaf,
                 )
 
+    def _convert_pitch_list(
+        self, pitch_list: list[music_parameters.abc.Pitch]
+    ) -> typing.Sequence[abjad.Pitch]:
+        # Custom pitch converters which don't inherit from
+        # 'MutwoPitchToAbjadPitch' may not provide 'convert_many'.
+        try:
+            convert_many = self._mutwo_pitch_to_abjad_pitch.convert_many
+        except AttributeError:
+            return [
+                self._mutwo_pitch_to_abjad_pitch.convert(pitch) for pitch in pitch_list
+            ]
+        return convert_many(pitch_list)
+
     def _apply_pitches_on_quantized_abjad_leaves(
         self,
         quanitisized_abjad_leaf_voice: abjad.Voice,
@@ -769,21 +1490,34 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         extracted_data_per_simple_event: ExtractedDataPerSimpleEvent,
         is_simple_event_rest_per_simple_event: tuple[bool, ...],
     ):
+        # Convert all pitches of the voice at once (this is faster than
+        # converting each pitch separately).
+        pitch_list_per_simple_event = tuple(
+            extracted_data[0] if not is_simple_event_rest else []
+            for is_simple_event_rest, extracted_data in zip(
+                is_simple_event_rest_per_simple_event, extracted_data_per_simple_event
+            )
+        )
+        abjad_pitch_iterator = iter(
+            self._convert_pitch_list(
+                [
+                    pitch
+                    for pitch_list in pitch_list_per_simple_event
+                    for pitch in pitch_list
+                ]
+            )
+        )
         for (
             is_simple_event_rest,
-            extracted_data,
+            pitch_list,
             related_abjad_leaf_index_tuple_tuple,
         ) in zip(
             is_simple_event_rest_per_simple_event,
-            extracted_data_per_simple_event,
+            pitch_list_per_simple_event,
             related_abjad_leaf_index_tuple_tuple_per_simple_event,
         ):
             if not is_simple_event_rest:
-                pitch_list = extracted_data[0]
-                abjad_pitch_list = [
-                    self._mutwo_pitch_to_abjad_pitch.convert(pitch)
-                    for pitch in pitch_list
-                ]
+                abjad_pitch_list = [next(abjad_pitch_iterator) for _ in pitch_list]
                 self._apply_pitch_list_on_quantized_abjad_leaf(
                     quanitisized_abjad_leaf_voice,
                     abjad_pitch_list,
@@ -853,13 +1587,21 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
             related_abjad_leaf_index_tuple_tuple_per_simple_event,
         )
 
-    def _fill_abjad_container(
+    def _convert_to_quantized_abjad_leaf_voice(
         self,
-        abjad_container_to_fill: abjad.Voice,
         sequential_event_to_convert: core_events.SequentialEvent[
             core_events.SimpleEvent
         ],
-    ):
+        previous_attachment_tuple: typing.Optional[
+            tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...]
+        ] = None,
+    ) -> tuple[
+        abjad.Voice,
+        tuple[tuple[tuple[int, ...], ...], ...],
+        ExtractedDataPerSimpleEvent,
+        tuple[bool, ...],
+        tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...],
+    ]:
         # tie rests before processing the event!
         sequential_event_to_convert = sequential_event_to_convert.tie_by(
             lambda event0, event1: self._is_simple_event_rest(event0)
@@ -886,26 +1628,33 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
             sequential_event_to_convert, is_simple_event_rest_per_simple_event
         )
 
-        # third, apply pitches on Abjad voice
-        self._apply_pitches_on_quantized_abjad_leaves(
-            quanitisized_abjad_leaf_voice,
-            related_abjad_leaf_index_tuple_tuple_per_simple_event,
-            extracted_data_per_simple_event,
-            is_simple_event_rest_per_simple_event,
-        )
+        # Notes which become chords (because of their pitches or because of
+        # attachments) only get the indicators of the replaced notes when
+        # all pitches and attachments have been applied.
+        with abjad_parameters.abc.LeafRewritePlan():
+            # third, apply pitches on Abjad voice
+            self._apply_pitches_on_quantized_abjad_leaves(
+                quanitisized_abjad_leaf_voice,
+                related_abjad_leaf_index_tuple_tuple_per_simple_event,
+                extracted_data_per_simple_event,
+                is_simple_event_rest_per_simple_event,
+            )
 
-        # fourth, apply dynamics, tempos and playing_indicators on abjad voice
-        abjad_parameters_per_type_per_event = (
-            self._get_abjad_parameters_for_quantized_abjad_leaves(
-                extracted_data_per_simple_event
+            # fourth, apply dynamics, tempos and playing_indicators on abjad voice
+            abjad_parameters_per_type_per_event = (
+                self._get_abjad_parameters_for_quantized_abjad_leaves(
+                    extracted_data_per_simple_event
+                )
+            )
+            self._apply_tempos_on_quantized_abjad_leaves(quanitisized_abjad_leaf_voice)
+            last_attachment_tuple = (
+                self._apply_abjad_parameters_on_quantized_abjad_leaves(
+                    quanitisized_abjad_leaf_voice,
+                    related_abjad_leaf_index_tuple_tuple_per_simple_event,
+                    abjad_parameters_per_type_per_event,
+                    previous_attachment_tuple,
+                )
             )
-        )
-        self._apply_tempos_on_quantized_abjad_leaves(quanitisized_abjad_leaf_voice)
-        self._apply_abjad_parameters_on_quantized_abjad_leaves(
-            quanitisized_abjad_leaf_voice,
-            related_abjad_leaf_index_tuple_tuple_per_simple_event,
-            abjad_parameters_per_type_per_event,
-        )
 
         # fifth, replace rests lasting one bar with full measure rests
         if self._write_multimeasure_rests:
@@ -913,6 +1662,29 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
                 quanitisized_abjad_leaf_voice
             )
 
+        return (
+            quanitisized_abjad_leaf_voice,
+            related_abjad_leaf_index_tuple_tuple_per_simple_event,
+            extracted_data_per_simple_event,
+            is_simple_event_rest_per_simple_event,
+            last_attachment_tuple,
+        )
+
+    def _fill_abjad_container(
+        self,
+        abjad_container_to_fill: abjad.Voice,
+        sequential_event_to_convert: core_events.SequentialEvent[
+            core_events.SimpleEvent
+        ],
+    ):
+        (
+            quanitisized_abjad_leaf_voice,
+            _,
+            extracted_data_per_simple_event,
+            is_simple_event_rest_per_simple_event,
+            _,
+        ) = self._convert_to_quantized_abjad_leaf_voice(sequential_event_to_convert)
+
         # move leaves from 'quanitisized_abjad_leaf_voice' object to target container
         abjad.mutate.swap(quanitisized_abjad_leaf_voice, abjad_container_to_fill)
 
@@ -922,6 +1694,196 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         )
         self._apply_lyrics_on_voice(abjad_container_to_fill, lyric_content)
 
+    def _split_into_bar_chunks(
+        self, simple_event_iterable: typing.Iterable[core_events.SimpleEvent]
+    ) -> typing.Iterator[
+        tuple[
+            list[core_events.SimpleEvent],
+            int,
+            int,
+            abjad.Duration,
+            typing.Optional[abjad.Duration],
+        ]
+    ]:
+        # Collect events until they end at a bar line. The end time of the
+        # last chunk is 'None', because it doesn't need to end at a bar line.
+        # Consecutive rests are merged before they are quantized, therefore
+        # a chunk never ends between two rests (otherwise the result would
+        # differ from the result of 'convert').
+        sequential_event_to_quantized_abjad_container = (
+            self._sequential_event_to_quantized_abjad_container
+        )
+        simple_event_list: list[core_events.SimpleEvent] = []
+        nth_start_bar = nth_bar = 0
+        start_time = end_time = abjad.Duration(0)
+        bar_end_time = (
+            sequential_event_to_quantized_abjad_container._get_time_signature(
+                0
+            ).duration
+        )
+        # True if the chunk ends at a bar line with a rest and it's not
+        # yet known if the next event is a rest, too.
+        is_chunk_end_pending = False
+
+        for simple_event in simple_event_iterable:
+            is_simple_event_rest = self._is_simple_event_rest(simple_event)
+            if is_chunk_end_pending:
+                is_chunk_end_pending = False
+                # 'nth_bar' is already the first bar after the chunk
+                if not is_simple_event_rest:
+                    yield (
+                        simple_event_list,
+                        nth_start_bar,
+                        nth_bar - nth_start_bar,
+                        start_time,
+                        end_time,
+                    )
+                    simple_event_list = []
+                    nth_start_bar = nth_bar
+                    start_time = end_time
+            simple_event_list.append(simple_event)
+            end_time += abjad.Duration(simple_event.duration)
+            while end_time > bar_end_time:
+                nth_bar += 1
+                bar_end_time += (
+                    sequential_event_to_quantized_abjad_container._get_time_signature(
+                        nth_bar
+                    ).duration
+                )
+            if end_time == bar_end_time:
+                if is_simple_event_rest:
+                    is_chunk_end_pending = True
+                else:
+                    yield (
+                        simple_event_list,
+                        nth_start_bar,
+                        nth_bar - nth_start_bar + 1,
+                        start_time,
+                        end_time,
+                    )
+                    simple_event_list = []
+                    nth_start_bar = nth_bar + 1
+                    start_time = end_time
+                nth_bar += 1
+                bar_end_time += (
+                    sequential_event_to_quantized_abjad_container._get_time_signature(
+                        nth_bar
+                    ).duration
+                )
+
+        if simple_event_list:
+            if is_chunk_end_pending:
+                yield (
+                    simple_event_list,
+                    nth_start_bar,
+                    nth_bar - nth_start_bar,
+                    start_time,
+                    end_time,
+                )
+            else:
+                yield (
+                    simple_event_list,
+                    nth_start_bar,
+                    nth_bar - nth_start_bar + 1,
+                    start_time,
+                    None,
+                )
+
+    def _convert_bars(
+        self,
+        simple_event_list: list[core_events.SimpleEvent],
+        nth_start_bar: int,
+        n_bars: int,
+        start_time: abjad.Duration,
+        end_time: typing.Optional[abjad.Duration],
+        previous_attachment_tuple: typing.Optional[
+            tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...]
+        ],
+    ) -> tuple[
+        tuple[abjad.Container, ...],
+        tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...],
+    ]:
+        sequential_event_to_quantized_abjad_container = (
+            self._sequential_event_to_quantized_abjad_container
+        )
+        # Converter which only knows the time signatures and tempos of the bars
+        converter = copy.copy(self)
+        converter._sequential_event_to_quantized_abjad_container = (
+            sequential_event_to_quantized_abjad_container._copy_for_bars(
+                nth_start_bar, n_bars
+            )
+        )
+        is_tempo_change_stopped_at_end = False
+        if self._tempo_attachment_tuple:
+            tempo_attachment_list = []
+            for absolute_time, tempo_attachment in self._tempo_attachment_tuple:
+                if absolute_time < start_time:
+                    continue
+                if end_time is not None and absolute_time >= end_time:
+                    if absolute_time == end_time:
+                        is_tempo_change_stopped_at_end = (
+                            is_tempo_change_stopped_at_end
+                            or tempo_attachment.stop_dynamic_change_indicaton
+                        )
+                    continue
+                # The previous bars already stopped the tempo change
+                if absolute_time == start_time and nth_start_bar > 0:
+                    tempo_attachment = dataclasses.replace(
+                        tempo_attachment, stop_dynamic_change_indicaton=False
+                    )
+                tempo_attachment_list.append(
+                    (absolute_time - start_time, tempo_attachment)
+                )
+            converter._tempo_attachment_tuple = tuple(tempo_attachment_list)
+
+        (
+            quanitisized_abjad_leaf_voice,
+            related_abjad_leaf_index_tuple_tuple_per_simple_event,
+            extracted_data_per_simple_event,
+            is_simple_event_rest_per_simple_event,
+            previous_attachment_tuple,
+        ) = converter._convert_to_quantized_abjad_leaf_voice(
+            core_events.SequentialEvent(simple_event_list), previous_attachment_tuple
+        )
+
+        if is_tempo_change_stopped_at_end:
+            abjad_parameters.DynamicChangeIndicationStop().process_leaf_tuple(
+                (abjad.get.leaf(quanitisized_abjad_leaf_voice, -1),), None
+            )
+
+        # Don't repeat the time signature of the previous bar
+        if nth_start_bar > 0:
+            first_leaf = abjad.get.leaf(quanitisized_abjad_leaf_voice, 0)
+            if abjad.get.indicator(
+                first_leaf, abjad.TimeSignature
+            ) == sequential_event_to_quantized_abjad_container._get_time_signature(
+                nth_start_bar - 1
+            ):
+                abjad.detach(abjad.TimeSignature, first_leaf)
+
+        bar_tuple = tuple(quanitisized_abjad_leaf_voice)
+        lyric_content_list_per_bar = [[] for _ in bar_tuple]
+        for (
+            extracted_data,
+            is_simple_event_rest,
+            related_abjad_leaf_index_tuple_tuple,
+        ) in zip(
+            extracted_data_per_simple_event,
+            is_simple_event_rest_per_simple_event,
+            related_abjad_leaf_index_tuple_tuple_per_simple_event,
+        ):
+            if not is_simple_event_rest:
+                nth_bar = related_abjad_leaf_index_tuple_tuple[0][0]
+                lyric_content_list_per_bar[nth_bar].append(
+                    self._mutwo_lyric_to_abjad_string(extracted_data[6])
+                )
+        del quanitisized_abjad_leaf_voice[:]
+        for bar, lyric_content_list in zip(bar_tuple, lyric_content_list_per_bar):
+            if lyric_content_list:
+                abjad.annotate(bar, "lyric_content", " ".join(lyric_content_list))
+
+        return bar_tuple, previous_attachment_tuple
+
     # ###################################################################### #
     #               public methods for interaction with the user             #
     # ###################################################################### #
@@ -972,21 +1934,282 @@ class SequentialEventToAbjadVoice(ComplexEventToAbjadContainer):
         }
         """
 
-        return super().convert(sequential_event_to_convert)
+        if self._result_cache is None:
+            return super().convert(sequential_event_to_convert)
+
+        # The converter is identified by the objects which are assigned
+        # to its attributes, the event by the hash of its content.
+        self._result_cache.set_configuration(
+            tuple(
+                attribute
+                for attribute_name, attribute in vars(self).items()
+                if attribute_name != "_result_cache"
+            )
+        )
+        key, function_tuple = _get_content_hash(sequential_event_to_convert)
+        if key is None:
+            return super().convert(sequential_event_to_convert)
+        abjad_voice = self._result_cache.get(key)
+        if abjad_voice is None:
+            abjad_voice = super().convert(sequential_event_to_convert)
+            self._result_cache.set(key, abjad.mutate.copy(abjad_voice), function_tuple)
+            return abjad_voice
+        # Return a copy, so that changes of the user don't change the cache
+        return abjad.mutate.copy(abjad_voice)
+
+    def clear_cache(self):
+        """Forget all memorized voices (only relevant if a cache is used)."""
+
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    @property
+    def cache_info(self) -> typing.Optional[ResultCacheInfo]:
+        """Hits, misses, size and estimated memory (in bytes) of the cache.
+
+        ``None`` if the converter doesn't use a cache.
+        """
+
+        if self._result_cache is not None:
+            return self._result_cache.info
+        return None
+
+    def convert_bar_wise(
+        self,
+        simple_event_iterable: typing.Iterable[core_events.SimpleEvent],
+        to_lilypond: bool = False,
+    ) -> typing.Iterator[typing.Union[abjad.Container, str]]:
+        """Convert events step by step and yield each bar when it's ready.
+
+        :param simple_event_iterable: A
+            :class:`~mutwo.core_events.SequentialEvent` or any other iterable
+            (e.g. a generator) of simple events.
+        :type simple_event_iterable: typing.Iterable[core_events.SimpleEvent]
+        :param to_lilypond: If set to ``True``, the LilyPond code of each bar
+            is yielded instead of the :class:`abjad.Container`. Default to
+            ``False``.
+        :type to_lilypond: bool
+
+        Events are collected until they end at a bar line. Then the
+        collected events are converted and the resulting bars are yielded,
+        therefore only events which belong to the same bars are kept in
+        memory at the same time. Dynamics and other attachments aren't
+        repeated in the next bars, tempo changes are attached to the
+        bar in which they happen. Because lyrics are attached to the whole
+        :class:`abjad.Voice` (and not to bars), the lyrics of the notes of
+        each bar are annotated to the bar (see
+        ``abjad.get.annotation(bar, "lyric_content")``). Bars which only
+        contain rests don't have this annotation.
+
+        Events aren't split at bar lines. If an event (or a group of
+        consecutive rests) crosses a bar line, no bar is yielded until
+        another event ends at a bar line. A voice in which no event ever
+        ends at a bar line (e.g. because of syncopated notes which are tied
+        across each bar line) is therefore kept in memory completely and
+        all its bars are only yielded at the end.
+
+        **Example:**
+
+        >>> from mutwo import abjad_converters
+        >>> from mutwo import music_events
+        >>> converter = abjad_converters.SequentialEventToAbjadVoice(
+        ...     abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        ... )
+        >>> simple_event_generator = (
+        ...     music_events.NoteLike(pitch, 0.5) for pitch in "c d e f".split()
+        ... )
+        >>> for lilypond_code in converter.convert_bar_wise(
+        ...     simple_event_generator, to_lilypond=True
+        ... ):
+        ...     print(lilypond_code)
+        {
+            \\tempo 4=120
+            %%% \\time 4/4 %%%
+            c'2
+            \\mf
+            d'2
+        }
+        {
+            e'2
+            f'2
+        }
+        """
+
+        previous_attachment_tuple = None
+        for (
+            simple_event_list,
+            nth_start_bar,
+            n_bars,
+            start_time,
+            end_time,
+        ) in self._split_into_bar_chunks(simple_event_iterable):
+            bar_tuple, previous_attachment_tuple = self._convert_bars(
+                simple_event_list,
+                nth_start_bar,
+                n_bars,
+                start_time,
+                end_time,
+                previous_attachment_tuple,
+            )
+            for bar in bar_tuple:
+                yield abjad.lilypond(bar) if to_lilypond else bar
+
+
+class IncrementalSequentialEventToAbjadVoice(SequentialEventToAbjadVoice):
+    """Convert edited versions of a :class:`SequentialEvent` without starting over.
+
+    This converter takes the same arguments as
+    :class:`SequentialEventToAbjadVoice` and returns the same
+    :class:`abjad.Voice`. It is meant for interactive work, where the same
+    voice is converted again and again after small changes. The converter
+    splits the events into groups of bars (a group ends at each bar line
+    at which an event ends) and remembers the converted bars of each group.
+    When :meth:`convert` is called again, only groups which changed are
+    converted again. A group is also converted again if the attachments
+    which are active at its start (e.g. the dynamic or the pedal of the
+    previous group) changed, so that toggle attachments stay correct
+    at the edges of the changed region.
+
+    Groups are compared by a hash of the content of their events (see
+    :meth:`SequentialEventToAbjadVoice.convert` with ``cache_size``), so
+    that also changes of attributes which are ignored by the equality
+    check of mutwo events are found. Groups with events which can't be
+    hashed are always converted again. Call :meth:`clear` to forget all
+    previous results.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.clear()
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _fill_abjad_container(
+        self,
+        abjad_container_to_fill: abjad.Voice,
+        sequential_event_to_convert: core_events.SequentialEvent[
+            core_events.SimpleEvent
+        ],
+    ):
+        bar_chunk_dict = {}
+        previous_attachment_tuple = None
+        for (
+            simple_event_list,
+            nth_start_bar,
+            n_bars,
+            start_time,
+            end_time,
+        ) in self._split_into_bar_chunks(sequential_event_to_convert):
+            key = (nth_start_bar, n_bars, start_time, end_time)
+            # The functions of the hash are kept, so that their ids
+            # can't be reused as long as the hash is remembered.
+            content_hash, function_tuple = _get_content_hash(tuple(simple_event_list))
+            try:
+                (
+                    previous_content_hash,
+                    _,
+                    previous_previous_attachment_tuple,
+                    bar_tuple,
+                    last_attachment_tuple,
+                ) = self._bar_chunk_dict[key]
+            except KeyError:
+                is_unchanged = False
+            else:
+                is_unchanged = (
+                    content_hash is not None
+                    and previous_previous_attachment_tuple == previous_attachment_tuple
+                    and previous_content_hash == content_hash
+                )
+            if is_unchanged:
+                self._n_reused_bars += len(bar_tuple)
+            else:
+                bar_tuple, last_attachment_tuple = self._convert_bars(
+                    simple_event_list,
+                    nth_start_bar,
+                    n_bars,
+                    start_time,
+                    end_time,
+                    previous_attachment_tuple,
+                )
+                self._n_converted_bars += len(bar_tuple)
+            bar_chunk_dict[key] = (
+                content_hash,
+                function_tuple,
+                previous_attachment_tuple,
+                bar_tuple,
+                last_attachment_tuple,
+            )
+            previous_attachment_tuple = last_attachment_tuple
+            # The remembered bars are never returned, otherwise the user
+            # could change them.
+            abjad_container_to_fill.extend(
+                [abjad.mutate.copy(bar) for bar in bar_tuple]
+            )
+        # Only keep the bars of the current voice
+        self._bar_chunk_dict = bar_chunk_dict
+
+        lyric_content_iterator = (
+            abjad.get.annotation(bar, "lyric_content")
+            for bar in abjad_container_to_fill
+        )
+        self._apply_lyrics_on_voice(
+            abjad_container_to_fill,
+            " ".join(
+                lyric_content
+                for lyric_content in lyric_content_iterator
+                if lyric_content is not None
+            ),
+        )
+
+    # ###################################################################### #
+    #               public methods for interaction with the user             #
+    # ###################################################################### #
+
+    def clear(self):
+        """Forget all previously converted bars."""
+
+        self._bar_chunk_dict: dict[
+            tuple[int, int, abjad.Duration, typing.Optional[abjad.Duration]],
+            tuple[
+                typing.Optional[bytes],
+                tuple[types.FunctionType, ...],
+                typing.Optional[
+                    tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...]
+                ],
+                tuple[abjad.Container, ...],
+                tuple[typing.Optional[abjad_parameters.abc.AbjadAttachment], ...],
+            ],
+        ] = {}
+        self._n_converted_bars = 0
+        self._n_reused_bars = 0
+
+    # ###################################################################### #
+    #                           properties                                   #
+    # ###################################################################### #
+
+    @property
+    def n_converted_bars(self) -> int:
+        """How many bars have been converted since the last :meth:`clear`."""
+
+        return self._n_converted_bars
+
+    @property
+    def n_reused_bars(self) -> int:
+        """How many bars have been reused since the last :meth:`clear`."""
+
+        return self._n_reused_bars
 
 
 class _GraceNotesToAbjadVoiceConverter(SequentialEventToAbjadVoice):
-    class GraceNotesToQuantizedAbjadContainerConverter(core_converters.abc.Converter):
-        def convert(
-            self, sequential_event_to_convert: core_events.SequentialEvent
-        ) -> abjad.Container:
-            container = abjad.Container([], simultaneous=False)
-            indices = []
-            for nth_event, event in enumerate(sequential_event_to_convert):
-                leaf = abjad.Note("c", event.duration)
-                container.append(leaf)
-                indices.append(((nth_event,),))
-            return container, tuple(indices)
+    """Build grace note containers directly from grace note events.
+
+    Grace notes don't need to be quantized and they don't have tempos,
+    multimeasure rests or lyrics. Therefore this converter doesn't run the
+    complete pipeline of :class:`SequentialEventToAbjadVoice`, but creates
+    one leaf for each event and only applies pitches and attachments.
+    """
 
     def __init__(
         self,
@@ -1014,7 +2237,9 @@ class _GraceNotesToAbjadVoiceConverter(SequentialEventToAbjadVoice):
             abjad_container_class = abjad.AfterGraceContainer
 
         super().__init__(
-            sequential_event_to_quantized_abjad_container=self.GraceNotesToQuantizedAbjadContainerConverter(),
+            # Grace notes aren't quantized (see 'convert'), but the
+            # initialisation method expects a quantizer.
+            sequential_event_to_quantized_abjad_container=LeafMakerSequentialEventToQuantizedAbjadContainer(),
             simple_event_to_pitch_list=simple_event_to_pitch_list,
             simple_event_to_volume=simple_event_to_volume,
             simple_event_to_playing_indicator_collection=simple_event_to_playing_indicator_collection,
@@ -1023,17 +2248,92 @@ class _GraceNotesToAbjadVoiceConverter(SequentialEventToAbjadVoice):
             mutwo_pitch_to_abjad_pitch=mutwo_pitch_to_abjad_pitch,
             mutwo_volume_to_abjad_attachment_dynamic=None,
             tempo_envelope_to_abjad_attachment_tempo=None,
-            simple_event_to_grace_note_sequential_event=lambda _: core_events.SequentialEvent(
-                []
-            ),
-            simple_event_to_after_grace_note_sequential_event=lambda _: core_events.SequentialEvent(
-                []
-            ),
+            simple_event_to_grace_note_sequential_event=_get_empty_sequential_event,
+            simple_event_to_after_grace_note_sequential_event=_get_empty_sequential_event,
             write_multimeasure_rests=False,
             abjad_container_class=abjad_container_class,
             lilypond_type_of_abjad_container=None,
         )
 
+    def _make_leaf(
+        self,
+        duration: core_parameters.abc.Duration,
+        abjad_pitch_list: typing.Optional[list[abjad.Pitch]],
+    ) -> abjad.Leaf:
+        # Rests are written as notes, because grace notes can't be rests
+        abjad_leaf = abjad.Note("c", duration)
+        if abjad_pitch_list is None:
+            return abjad_leaf
+        if len(abjad_pitch_list) == 1:
+            abjad_leaf.note_head._written_pitch = abjad_pitch_list[0]
+            return abjad_leaf
+        abjad_chord = abjad.Chord(
+            [abjad.NamedPitch() for _ in abjad_pitch_list],
+            abjad_leaf.written_duration,
+        )
+        for abjad_pitch, note_head in zip(abjad_pitch_list, abjad_chord.note_heads):
+            note_head._written_pitch = abjad_pitch
+        return abjad_chord
+
+    def convert(
+        self,
+        sequential_event_to_convert: core_events.SequentialEvent[
+            core_events.SimpleEvent
+        ],
+    ) -> abjad.Container:
+        # Tie rests (like 'SequentialEventToAbjadVoice' does), but without
+        # copying the events: only the durations of tied rests are added.
+        simple_event_list: list[core_events.SimpleEvent] = []
+        duration_list: list[core_parameters.abc.Duration] = []
+        is_simple_event_rest_list: list[bool] = []
+        for simple_event in sequential_event_to_convert:
+            is_simple_event_rest = self._is_simple_event_rest(simple_event)
+            if is_simple_event_rest and is_simple_event_rest_list[-1:] == [True]:
+                duration_list[-1] = simple_event.duration + duration_list[-1]
+            else:
+                simple_event_list.append(simple_event)
+                duration_list.append(simple_event.duration)
+                is_simple_event_rest_list.append(is_simple_event_rest)
+
+        extracted_data_per_simple_event = tuple(
+            self._extract_data_from_simple_event(simple_event)
+            for simple_event in simple_event_list
+        )
+        pitch_list_per_simple_event = tuple(
+            extracted_data[0] if not is_simple_event_rest else []
+            for is_simple_event_rest, extracted_data in zip(
+                is_simple_event_rest_list, extracted_data_per_simple_event
+            )
+        )
+        abjad_pitch_iterator = iter(
+            self._convert_pitch_list(
+                [
+                    pitch
+                    for pitch_list in pitch_list_per_simple_event
+                    for pitch in pitch_list
+                ]
+            )
+        )
+        abjad_leaf_list = []
+        for duration, is_simple_event_rest, pitch_list in zip(
+            duration_list, is_simple_event_rest_list, pitch_list_per_simple_event
+        ):
+            if is_simple_event_rest:
+                abjad_pitch_list = None
+            else:
+                abjad_pitch_list = [next(abjad_pitch_iterator) for _ in pitch_list]
+            abjad_leaf_list.append(self._make_leaf(duration, abjad_pitch_list))
+        abjad_container = self._abjad_container_class(abjad_leaf_list)
+
+        self._apply_abjad_parameters_on_quantized_abjad_leaves(
+            abjad_container,
+            tuple(((nth_leaf,),) for nth_leaf in range(len(abjad_container))),
+            self._get_abjad_parameters_for_quantized_abjad_leaves(
+                extracted_data_per_simple_event
+            ),
+        )
+        return abjad_container
+
     def _grace_note_sequential_event_to_abjad_attachment(
         self,
         grace_note_sequential_event_or_after_grace_note_sequential_event: core_events.SequentialEvent[
@@ -1101,7 +2401,7 @@ class TagBasedNestedComplexEventToComplexEventToAbjadContainers(
         tag_to_abjad_converter_dict: dict[str, ComplexEventToAbjadContainer],
         complex_event_to_tag: typing.Callable[
             [core_events.abc.ComplexEvent], str
-        ] = lambda complex_event: complex_event.tag,
+        ] = _get_tag,
     ):
         self._tag_to_abjad_converter_dict = tag_to_abjad_converter_dict
         self._complex_event_to_tag = complex_event_to_tag
@@ -1130,6 +2430,27 @@ class TagBasedNestedComplexEventToComplexEventToAbjadContainers(
 
 
 class NestedComplexEventToAbjadContainer(ComplexEventToAbjadContainer):
+    """Convert nested complex events (e.g. a score with many staves).
+
+    Each child of the nested event is converted by the converter which
+    is returned by `nested_complex_event_to_complex_event_to_abjad_container_converters_converter`.
+
+    :param n_workers: If bigger than 1, the children are converted in
+        (up to) `n_workers` parallel worker processes. The converted children
+        are appended to the container in their original order. Because
+        children are converted in other processes, converters of children
+        (and their pre- and post-process routines) shouldn't rely on
+        side effects in the current process. If a child can't be converted
+        in a worker process, a :class:`ChildConversionError` (with the
+        original exception as its cause) is raised. Default to 1.
+    :type n_workers: int
+    :param multiprocessing_context: The context (start method) of the worker
+        processes. If set to ``None`` the "fork" start method is used on Linux
+        and the default start method of the platform otherwise. Default
+        to ``None``.
+    :type multiprocessing_context: typing.Optional[multiprocessing.context.BaseContext]
+    """
+
     def __init__(
         self,
         nested_complex_event_to_complex_event_to_abjad_container_converters_converter: NestedComplexEventToComplexEventToAbjadContainers,
@@ -1137,13 +2458,17 @@ class NestedComplexEventToAbjadContainer(ComplexEventToAbjadContainer):
         lilypond_type_of_abjad_container: str,
         complex_event_to_abjad_container_name: typing.Callable[
             [core_events.abc.ComplexEvent], str
-        ] = lambda complex_event: complex_event.tag,
+        ] = _get_tag,
         pre_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
         post_process_abjad_container_routine_sequence: typing.Sequence[
             abjad_converters.ProcessAbjadContainerRoutine
         ] = tuple([]),
+        n_workers: int = 1,
+        multiprocessing_context: typing.Optional[
+            multiprocessing.context.BaseContext
+        ] = None,
     ):
         super().__init__(
             abjad_container_class,
@@ -1153,6 +2478,8 @@ class NestedComplexEventToAbjadContainer(ComplexEventToAbjadContainer):
             post_process_abjad_container_routine_sequence,
         )
         self._nested_complex_event_to_complex_event_to_abjad_container_converters_converter = nested_complex_event_to_complex_event_to_abjad_container_converters_converter
+        self._n_workers = n_workers
+        self._multiprocessing_context = multiprocessing_context
 
     def _fill_abjad_container(
         self,
@@ -1162,6 +2489,28 @@ class NestedComplexEventToAbjadContainer(ComplexEventToAbjadContainer):
         complex_event_to_abjad_container_converter_tuple = self._nested_complex_event_to_complex_event_to_abjad_container_converters_converter.convert(
             nested_complex_event_to_convert
         )
+        if self._n_workers > 1:
+            for nth_child, converted_complex_event in enumerate(
+                _convert_in_worker_processes(
+                    tuple(
+                        zip(
+                            complex_event_to_abjad_container_converter_tuple,
+                            nested_complex_event_to_convert,
+                        )
+                    ),
+                    self._n_workers,
+                    self._multiprocessing_context,
+                )
+            ):
+                # The traceback of the worker process is lost, therefore
+                # the error tells which child couldn't be converted.
+                if isinstance(converted_complex_event, Exception):
+                    raise ChildConversionError(
+                        nth_child, nested_complex_event_to_convert[nth_child]
+                    ) from converted_complex_event
+                abjad_container_to_fill.append(converted_complex_event)
+            return
+
         for complex_event, complex_event_to_abjad_container_converter in zip(
             nested_complex_event_to_convert,
             complex_event_to_abjad_container_converter_tuple,
@@ -1170,3 +2519,28 @@ class NestedComplexEventToAbjadContainer(ComplexEventToAbjadContainer):
                 complex_event_to_abjad_container_converter.convert(complex_event)
             )
             abjad_container_to_fill.append(converted_complex_event)
+
+    async def _afill_abjad_container(
+        self,
+        abjad_container_to_fill: abjad.Container,
+        nested_complex_event_to_convert: core_events.abc.ComplexEvent,
+        executor: typing.Optional[concurrent.futures.Executor],
+        semaphore: typing.Optional[asyncio.Semaphore],
+    ):
+        complex_event_to_abjad_container_converter_tuple = self._nested_complex_event_to_complex_event_to_abjad_container_converters_converter.convert(
+            nested_complex_event_to_convert
+        )
+        # Children are converted concurrently
+        converted_complex_event_list = await asyncio.gather(
+            *(
+                complex_event_to_abjad_container_converter.aconvert(
+                    complex_event, executor, semaphore
+                )
+                for complex_event, complex_event_to_abjad_container_converter in zip(
+                    nested_complex_event_to_convert,
+                    complex_event_to_abjad_container_converter_tuple,
+                )
+            )
+        )
+        for converted_complex_event in converted_complex_event_list:
+            abjad_container_to_fill.append(converted_complex_event)
@@ -1,6 +1,7 @@
 """Module to quantize free :class:`SequentialEvent` to notation based abjad :class:`Container`"""
 
 import abc
+import copy
 import typing
 import warnings
 
@@ -14,11 +15,17 @@ from abjadext import nauert  # type: ignore
 import expenvelope  # type: ignore
 import ranges  # type: ignore
 
+# Apply monkey patch (fixes 'abjad.LeafMaker')
+import mutwo_third_party.abjad
+
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import core_utilities
 
+from .._defaults import _DEFAULT
+from .._defaults import _DefaultArgument
+
 __all__ = (
     "SequentialEventToQuantizedAbjadContainer",
     "NauertSequentialEventToQuantizedAbjadContainer",
@@ -73,6 +80,24 @@ class SequentialEventToQuantizedAbjadContainer(core_converters.abc.Converter):
     def tempo_envelope(self) -> expenvelope.Envelope:
         return self._tempo_envelope
 
+    def _get_time_signature(self, nth_bar: int) -> abjad.TimeSignature:
+        try:
+            return self._time_signature_tuple[nth_bar]
+        except IndexError:
+            return self._time_signature_tuple[-1]
+
+    def _copy_for_bars(
+        self, nth_start_bar: int, n_bars: int
+    ) -> "SequentialEventToQuantizedAbjadContainer":
+        """Copy converter for quantizing events which start at `nth_start_bar`."""
+
+        sequential_event_to_quantized_abjad_container = copy.copy(self)
+        sequential_event_to_quantized_abjad_container._time_signature_tuple = tuple(
+            self._get_time_signature(nth_bar)
+            for nth_bar in range(nth_start_bar, nth_start_bar + n_bars)
+        )
+        return sequential_event_to_quantized_abjad_container
+
     # ###################################################################### #
     #               public methods for interaction with the user             #
     # ###################################################################### #
@@ -130,9 +155,9 @@ class NauertSequentialEventToQuantizedAbjadContainer(
         ),
         duration_unit: str = "beats",  # for future: typing.Literal["beats", "miliseconds"]
         tempo_envelope: expenvelope.Envelope = None,
-        attack_point_optimizer: typing.Optional[
-            nauert.AttackPointOptimizer
-        ] = nauert.MeasurewiseAttackPointOptimizer(),
+        attack_point_optimizer: typing.Union[
+            nauert.AttackPointOptimizer, None, _DefaultArgument
+        ] = _DEFAULT,
         search_tree: typing.Optional[nauert.SearchTree] = None,
     ):
         if duration_unit == "miliseconds":
@@ -153,8 +178,12 @@ class NauertSequentialEventToQuantizedAbjadContainer(
 
         super().__init__(time_signature_tuple, tempo_envelope)
 
+        if attack_point_optimizer is _DEFAULT:
+            attack_point_optimizer = nauert.MeasurewiseAttackPointOptimizer()
+
         self._duration_unit = duration_unit
         self._attack_point_optimizer = attack_point_optimizer
+        self._search_tree = search_tree
         self._q_schema = NauertSequentialEventToQuantizedAbjadContainer._make_q_schema(
             self._time_signature_tuple, search_tree
         )
@@ -341,6 +370,21 @@ class NauertSequentialEventToQuantizedAbjadContainer(
             )
             raise NotImplementedError(message)
 
+    def _copy_for_bars(
+        self, nth_start_bar: int, n_bars: int
+    ) -> "NauertSequentialEventToQuantizedAbjadContainer":
+        # nauert will raise an error if there is only one time signature
+        sequential_event_to_quantized_abjad_container = super()._copy_for_bars(
+            nth_start_bar, max(n_bars, 2)
+        )
+        sequential_event_to_quantized_abjad_container._q_schema = (
+            NauertSequentialEventToQuantizedAbjadContainer._make_q_schema(
+                sequential_event_to_quantized_abjad_container._time_signature_tuple,
+                self._search_tree,
+            )
+        )
+        return sequential_event_to_quantized_abjad_container
+
     def _q_event_sequence_to_quanitisized_abjad_leaf_voice(
         self, q_event_sequence: nauert.QEventSequence
     ) -> abjad.Voice:
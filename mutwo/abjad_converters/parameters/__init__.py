@@ -1,28 +1,53 @@
 """Module to convert mutwo parameters to abjad equivalents."""
 
-from .lyrics import *
-from .pitches import *
-from .tempos import *
-from .volumes import *
-
-# Force flat structure
-del lyrics, pitches, tempos, volumes
-
-
-# Only import if mutwo.ext-ekmelily has been installed
-try:
-    from mutwo import ekmelily_converters
-except ImportError:
-    import logging
-
-    logging.info(
-        "Couldn't find 'ekmelily_converters.constants'. Please install "
-        "package 'mutwo.ext-ekmelily' if you want to use "
-        "'MutwoPitchToHEJIAbjadPitch'"
-    )
-    # Cleanup
-    del logging
-else:
-    from .heji import *
-    # Cleanup
-    del heji
+import importlib
+import importlib.util
+import typing
+
+# Submodules are only imported when one of their classes is used
+# the first time, so that importing this package doesn't import abjad.
+_MODULE_NAME_TO_ATTRIBUTE_NAME_TUPLE_DICT = {
+    "lyrics": ("MutwoLyricToAbjadString",),
+    "pitches": ("MutwoPitchToAbjadPitch",),
+    "tempos": (
+        "TempoEnvelopeToAbjadAttachmentTempo",
+        "ComplexTempoEnvelopeToAbjadAttachmentTempo",
+        "AbjadTempoMap",
+    ),
+    "volumes": ("MutwoVolumeToAbjadAttachmentDynamic",),
+}
+
+# Only available if mutwo.ext-ekmelily has been installed
+if importlib.util.find_spec("mutwo.ekmelily_converters") is not None:
+    _MODULE_NAME_TO_ATTRIBUTE_NAME_TUPLE_DICT["heji"] = ("MutwoPitchToHEJIAbjadPitch",)
+
+_ATTRIBUTE_NAME_TO_MODULE_NAME_DICT = {
+    attribute_name: module_name
+    for module_name, attribute_name_tuple in _MODULE_NAME_TO_ATTRIBUTE_NAME_TUPLE_DICT.items()
+    for attribute_name in attribute_name_tuple
+}
+
+__all__ = tuple(_ATTRIBUTE_NAME_TO_MODULE_NAME_DICT)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name = _ATTRIBUTE_NAME_TO_MODULE_NAME_DICT[name]
+    except KeyError:
+        if name == "MutwoPitchToHEJIAbjadPitch":
+            import logging
+
+            logging.info(
+                "Couldn't find 'ekmelily_converters.constants'. Please install "
+                "package 'mutwo.ext-ekmelily' if you want to use "
+                "'MutwoPitchToHEJIAbjadPitch'"
+            )
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attribute = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Next time the attribute is found without calling '__getattr__'
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
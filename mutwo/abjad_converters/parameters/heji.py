@@ -1,3 +1,4 @@
+import math
 import typing
 
 import abjad
@@ -49,6 +50,13 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         :const:`mutwo.ekmelily_converters.configurations.DEFAULT_TEMPERED_PITCH_INDICATOR`
         for the default value.
     :type tempered_pitch_indicator: str, optional
+    :param cache_size: How many converted pitches the converter memorizes.
+        :class:`~mutwo.music_parameters.JustIntonationPitch` objects are
+        identified by their ratio (or more precisely by their exponent tuple),
+        so that scores which repeat the same ratios over and over only
+        need to convert each ratio once. Set to ``None`` to disable the
+        cache. Default to 256.
+    :type cache_size: typing.Optional[int]
 
     The resulting Abjad pitches are expected to be used in combination with tuning
     files that are generated by
@@ -96,7 +104,10 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         utonality_indicator: str = None,
         exponent_to_exponent_indicator: typing.Callable[[int], str] = None,
         tempered_pitch_indicator: str = None,
+        cache_size: typing.Optional[int] = 256,
     ):
+        super().__init__(cache_size=cache_size)
+
         # set default values
         if prime_to_heji_accidental_name is None:
             prime_to_heji_accidental_name = (
@@ -133,6 +144,11 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
                 reference_pitch
             ].index
         )
+        self._reference_pitch_class = (
+            music_parameters.constants.DIATONIC_PITCH_CLASS_CONTAINER[
+                reference_pitch
+            ].pitch_class
+        )
         self._prime_to_heji_accidental_name = prime_to_heji_accidental_name
 
     def _find_western_octave_for_just_intonation_pitch(
@@ -141,48 +157,37 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         closest_pythagorean_pitch_name: str,
     ) -> int:
         octave = pitch_to_convert.octave + 4
-        closest_pythagorean_pitch_index = (
+        closest_pythagorean_pitch_class = (
             music_parameters.constants.DIATONIC_PITCH_CLASS_CONTAINER[
                 closest_pythagorean_pitch_name[0]
-            ].index
+            ]
         )
-        if closest_pythagorean_pitch_index < self._reference_index:
+        if closest_pythagorean_pitch_class.index < self._reference_index:
             octave += 1
 
-        pitch_as_western_pitch = music_parameters.WesternPitch(
-            closest_pythagorean_pitch_name[0], octave
-        )
-        reference_pitch_as_western_pitch = music_parameters.WesternPitch(
-            self._reference_pitch, 4
-        )
-        expected_difference_in_cents = pitch_to_convert.interval
-        while (
-            expected_difference_in_cents
-            - (
-                (
-                    pitch_as_western_pitch.midi_pitch_number
-                    - reference_pitch_as_western_pitch.midi_pitch_number
-                )
-                * 100
-            )
-            > 300
-        ):
-            pitch_as_western_pitch.octave += 1
-
-        while (
-            expected_difference_in_cents
-            - (
-                (
-                    pitch_as_western_pitch.midi_pitch_number
-                    - reference_pitch_as_western_pitch.midi_pitch_number
-                )
-                * 100
+        # Difference between the expected interval and the interval
+        # between the written western pitch and the reference pitch
+        # (reference pitch is in octave 4).
+        difference_in_cents = pitch_to_convert.interval - (
+            (
+                (octave - 4) * 12
+                + closest_pythagorean_pitch_class.pitch_class
+                - self._reference_pitch_class
             )
-            < -300
-        ):
-            pitch_as_western_pitch.octave -= 1
+            * 100
+        )
+
+        # Move the written pitch in octave steps until it is
+        # close enough to the expected interval.
+        if difference_in_cents > 300:
+            octave_shift = math.ceil((difference_in_cents - 300) / 1200)
+            octave += octave_shift
+            difference_in_cents -= octave_shift * 1200
+
+        if difference_in_cents < -300:
+            octave -= math.ceil((-300 - difference_in_cents) / 1200)
 
-        return pitch_as_western_pitch.octave
+        return octave
 
     def _find_heji_accidental_for_just_intonation_pitch(
         self,
@@ -236,10 +241,38 @@ class MutwoPitchToHEJIAbjadPitch(MutwoPitchToAbjadPitch):
         abjad_pitch._pitch_class = abjad_pitch_class
         return abjad_pitch
 
-    def convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
+    def _get_cache_key(
+        self, pitch_to_convert: music_parameters.abc.Pitch
+    ) -> typing.Hashable:
         if isinstance(pitch_to_convert, music_parameters.JustIntonationPitch):
-            abjad_pitch = self._convert_just_intonation_pitch(pitch_to_convert)
+            return ("exponent_tuple", pitch_to_convert.exponent_tuple)
         else:
-            abjad_pitch = MutwoPitchToAbjadPitch().convert(pitch_to_convert)
+            return super()._get_cache_key(pitch_to_convert)
 
-        return abjad_pitch
+    def _convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
+        if isinstance(pitch_to_convert, music_parameters.JustIntonationPitch):
+            return self._convert_just_intonation_pitch(pitch_to_convert)
+        else:
+            return super()._convert(pitch_to_convert)
+
+    def _convert_many(
+        self, pitch_tuple: tuple[music_parameters.abc.Pitch, ...]
+    ) -> tuple[abjad.Pitch, ...]:
+        abjad_pitch_list: list[typing.Optional[abjad.Pitch]] = [None] * len(pitch_tuple)
+        other_pitch_index_list, other_pitch_list = [], []
+        for index, pitch_to_convert in enumerate(pitch_tuple):
+            if isinstance(pitch_to_convert, music_parameters.JustIntonationPitch):
+                abjad_pitch_list[index] = self._convert_just_intonation_pitch(
+                    pitch_to_convert
+                )
+            else:
+                other_pitch_index_list.append(index)
+                other_pitch_list.append(pitch_to_convert)
+
+        if other_pitch_list:
+            for index, abjad_pitch in zip(
+                other_pitch_index_list, super()._convert_many(tuple(other_pitch_list))
+            ):
+                abjad_pitch_list[index] = abjad_pitch
+
+        return tuple(abjad_pitch_list)
@@ -1,4 +1,8 @@
+import collections
+import typing
+
 import abjad  # type: ignore
+import numpy as np
 
 from mutwo import core_converters
 from mutwo import music_parameters
@@ -6,9 +10,52 @@ from mutwo import music_parameters
 __all__ = ("MutwoPitchToAbjadPitch",)
 
 
+class _LRUCache(object):
+    """Minimal bounded mapping which forgets the least recently used item.
+
+    Only for internal usage within the pitch converters. Unlike
+    :func:`functools.lru_cache` it is stored as plain data on the
+    converter instance, so that converters can still be pickled.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: collections.OrderedDict = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: typing.Hashable, default: typing.Any = None) -> typing.Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: typing.Hashable, value: typing.Any):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
 class MutwoPitchToAbjadPitch(core_converters.abc.Converter):
     """Convert Mutwo Pitch objects to Abjad Pitch objects.
 
+    :param cache_size: If set to a positive integer, the converter memorizes
+        up to ``cache_size`` converted pitches and returns the already
+        converted :class:`abjad.NamedPitch` for repeating input pitches
+        (least recently used pitches are forgotten first).
+        :class:`~mutwo.music_parameters.WesternPitch` objects are identified
+        by their name, all other pitches by their rounded frequency.
+        Because abjad pitches are immutable, it's safe to share the returned
+        objects. Default to ``None`` (no cache).
+    :type cache_size: typing.Optional[int]
+
     This default class simply checks if the passed Mutwo object belongs to
     :class:`mutwo.ext.parameters.pitches.WesternPitch`. If it does, Mutwo
     will initialise the Abjad Pitch from the :attr:`name` attribute.
@@ -18,10 +65,188 @@ class MutwoPitchToAbjadPitch(core_converters.abc.Converter):
     If users desire to make more complex conversions (for instance
     due to ``scordatura`` or transpositions of instruments), one can simply
     inherit from this class to define more complex cases.
+
+    Many pitches can be converted at once with :meth:`convert_many`.
     """
 
-    def convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
+    # Frequencies which only differ after this decimal place
+    # share the same cache entry.
+    _frequency_digit_count = 6
+    # Fallback for subclasses which don't call 'super().__init__'
+    _cache: typing.Optional[_LRUCache] = None
+
+    def __init__(self, cache_size: typing.Optional[int] = None):
+        if cache_size:
+            cache = _LRUCache(cache_size)
+        else:
+            cache = None
+        self._cache = cache
+
+    def _get_cache_key(
+        self, pitch_to_convert: music_parameters.abc.Pitch
+    ) -> typing.Hashable:
+        if isinstance(pitch_to_convert, music_parameters.WesternPitch):
+            return ("name", pitch_to_convert.name)
+        else:
+            return (
+                "frequency",
+                round(pitch_to_convert.frequency, self._frequency_digit_count),
+            )
+
+    def _convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
         if isinstance(pitch_to_convert, music_parameters.WesternPitch):
             return abjad.NamedPitch(pitch_to_convert.name)
         else:
             return abjad.NamedPitch.from_hertz(pitch_to_convert.frequency)
+
+    def _convert_many(
+        self, pitch_tuple: tuple[music_parameters.abc.Pitch, ...]
+    ) -> tuple[abjad.Pitch, ...]:
+        abjad_pitch_list: list[typing.Optional[abjad.Pitch]] = [None] * len(pitch_tuple)
+        frequency_index_list, frequency_list = [], []
+        for index, pitch_to_convert in enumerate(pitch_tuple):
+            if isinstance(pitch_to_convert, music_parameters.WesternPitch):
+                abjad_pitch_list[index] = abjad.NamedPitch(pitch_to_convert.name)
+            else:
+                frequency_index_list.append(index)
+                frequency_list.append(pitch_to_convert.frequency)
+
+        if frequency_list:
+            number_to_abjad_pitch = {}
+            for index, number in zip(
+                frequency_index_list,
+                self._frequency_array_to_abjad_pitch_number_tuple(
+                    np.array(frequency_list, dtype=float)
+                ),
+            ):
+                try:
+                    abjad_pitch = number_to_abjad_pitch[number]
+                except KeyError:
+                    abjad_pitch = number_to_abjad_pitch[number] = abjad.NamedPitch(
+                        number
+                    )
+                abjad_pitch_list[index] = abjad_pitch
+
+        return tuple(abjad_pitch_list)
+
+    @staticmethod
+    def _frequency_array_to_abjad_pitch_number_tuple(
+        frequency_array: np.ndarray,
+    ) -> tuple[typing.Union[int, float], ...]:
+        # Same calculation as 'abjad.Pitch.from_hertz' and
+        # 'abjad.Pitch._to_nearest_quarter_tone', but for all
+        # frequencies at once.
+        midi_array = 9.0 + (12.0 * np.log2(frequency_array / 440.0))
+        quarter_tone_array = midi_array * 4
+        rounded_quarter_tone_array = np.round(quarter_tone_array).astype(int)
+        # Abjad rounds quarter tones to the next semitone (upwards
+        # if three quarter tones, downwards if one quarter tone).
+        semitone_array, quarter_tone_rest_array = np.divmod(
+            rounded_quarter_tone_array, 4
+        )
+        half_semitone_array = (
+            semitone_array * 2 + np.array((0, 0, 1, 2))[quarter_tone_rest_array]
+        )
+        # Values which are exactly between two quarter tones may be
+        # rounded differently due to floating point imprecision:
+        # they are calculated by abjad itself.
+        is_ambiguous_array = np.isclose(
+            np.abs(quarter_tone_array - np.floor(quarter_tone_array)), 0.5
+        )
+        abjad_pitch_number_list = []
+        for frequency, half_semitone, is_ambiguous in zip(
+            frequency_array.tolist(),
+            half_semitone_array.tolist(),
+            is_ambiguous_array.tolist(),
+        ):
+            if is_ambiguous:
+                abjad_pitch_number = abjad.NamedPitch.from_hertz(frequency).number
+            elif half_semitone % 2:
+                abjad_pitch_number = half_semitone / 2
+            else:
+                abjad_pitch_number = half_semitone // 2
+            abjad_pitch_number_list.append(abjad_pitch_number)
+        return tuple(abjad_pitch_number_list)
+
+    def _is_batch_conversion_supported(self) -> bool:
+        # If a subclass overrides 'convert' or '_convert' without
+        # providing its own '_convert_many', the batch conversion
+        # would ignore the customized behaviour.
+        for cls in type(self).__mro__:
+            namespace = vars(cls)
+            if "_convert_many" in namespace:
+                return True
+            if "_convert" in namespace or "convert" in namespace:
+                return False
+        return False
+
+    def clear_cache(self):
+        """Forget all memorized pitches (only relevant if `cache_size` is set)."""
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def convert(self, pitch_to_convert: music_parameters.abc.Pitch) -> abjad.Pitch:
+        if self._cache is None:
+            return self._convert(pitch_to_convert)
+
+        key = self._get_cache_key(pitch_to_convert)
+        abjad_pitch = self._cache.get(key)
+        if abjad_pitch is None:
+            abjad_pitch = self._convert(pitch_to_convert)
+            self._cache.set(key, abjad_pitch)
+        return abjad_pitch
+
+    def convert_many(
+        self, pitch_sequence: typing.Sequence[music_parameters.abc.Pitch]
+    ) -> tuple[abjad.Pitch, ...]:
+        """Convert many pitches at once.
+
+        :param pitch_sequence: The pitches which shall be converted.
+        :type pitch_sequence: typing.Sequence[music_parameters.abc.Pitch]
+
+        Equal pitches are only converted once and the numeric work
+        for all pitches which aren't
+        :class:`~mutwo.music_parameters.WesternPitch` objects is done in
+        one step. The result is the same as calling :meth:`convert` for
+        each pitch.
+
+        **Example:**
+
+        >>> from mutwo import abjad_converters
+        >>> from mutwo import music_parameters
+        >>> converter = abjad_converters.MutwoPitchToAbjadPitch()
+        >>> converter.convert_many(
+        >>>     [music_parameters.DirectPitch(440), music_parameters.WesternPitch('c')]
+        >>> )
+        (NamedPitch("a'"), NamedPitch("c'"))
+        """
+
+        pitch_tuple = tuple(pitch_sequence)
+        if not self._is_batch_conversion_supported():
+            return tuple(self.convert(pitch) for pitch in pitch_tuple)
+
+        key_list, key_to_abjad_pitch, key_to_pitch_to_convert = [], {}, {}
+        for pitch_to_convert in pitch_tuple:
+            key = self._get_cache_key(pitch_to_convert)
+            key_list.append(key)
+            if key in key_to_abjad_pitch or key in key_to_pitch_to_convert:
+                continue
+            abjad_pitch = None
+            if self._cache is not None:
+                abjad_pitch = self._cache.get(key)
+            if abjad_pitch is None:
+                key_to_pitch_to_convert[key] = pitch_to_convert
+            else:
+                key_to_abjad_pitch[key] = abjad_pitch
+
+        if key_to_pitch_to_convert:
+            for key, abjad_pitch in zip(
+                key_to_pitch_to_convert,
+                self._convert_many(tuple(key_to_pitch_to_convert.values())),
+            ):
+                key_to_abjad_pitch[key] = abjad_pitch
+                if self._cache is not None:
+                    self._cache.set(key, abjad_pitch)
+
+        return tuple(key_to_abjad_pitch[key] for key in key_list)
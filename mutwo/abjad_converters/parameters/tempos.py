@@ -17,6 +17,7 @@ from mutwo import core_utilities
 __all__ = (
     "TempoEnvelopeToAbjadAttachmentTempo",
     "ComplexTempoEnvelopeToAbjadAttachmentTempo",
+    "AbjadTempoMap",
 )
 
 
@@ -213,6 +214,20 @@ class ComplexTempoEnvelopeToAbjadAttachmentTempo(TempoEnvelopeToAbjadAttachmentT
             tempo_attachment_tuple
         )
 
+        return ComplexTempoEnvelopeToAbjadAttachmentTempo._make_tempo_attachment(
+            tempo_point,
+            dynamic_change_indication,
+            write_metronome_mark,
+            stop_dynamic_change_indicaton,
+        )
+
+    @staticmethod
+    def _make_tempo_attachment(
+        tempo_point: core_parameters.TempoPoint,
+        dynamic_change_indication: typing.Optional[str],
+        write_metronome_mark: bool,
+        stop_dynamic_change_indicaton: bool,
+    ) -> abjad_parameters.Tempo:
         (
             reference_duration,
             units_per_minute,
@@ -225,7 +240,7 @@ class ComplexTempoEnvelopeToAbjadAttachmentTempo(TempoEnvelopeToAbjadAttachmentT
         if textual_indication == "a tempo":
             write_metronome_mark = True
 
-        converted_tempo_point = abjad_parameters.Tempo(
+        converted_tempo_point = abjad_parameters.Tempo.intern(
             reference_duration=reference_duration,
             units_per_minute=units_per_minute,
             textual_indication=textual_indication,
@@ -249,26 +264,110 @@ class ComplexTempoEnvelopeToAbjadAttachmentTempo(TempoEnvelopeToAbjadAttachmentT
             )
         )
 
+        duration_tuple = tuple(tempo_envelope_to_convert.durations)
+
+        # Instead of searching the previous tempo points and attachments for
+        # each tempo point (see '_process_tempo_event'), the state which is
+        # needed for the next tempo point is carried along in a single pass.
         tempo_attachment_list: list[
             tuple[core_constants.Real, abjad_parameters.Tempo]
         ] = []
-        for tempo_point_index, absolute_time, duration, tempo_point in zip(
-            range(len(tempo_point_tuple)),
-            core_utilities.accumulate_from_zero(tempo_envelope_to_convert.durations),
-            tuple(tempo_envelope_to_convert.durations) + (1,),
+        # The last tempo point with a duration > 0 (only these tempo points
+        # could have been written down).
+        previous_tempo_point: typing.Optional[core_parameters.TempoPoint] = None
+        stop_dynamic_change_indicaton = False
+        for absolute_time, duration, tempo_point, next_tempo_point in zip(
+            core_utilities.accumulate_from_zero(duration_tuple),
+            duration_tuple + (1,),
             tempo_point_tuple,
+            tempo_point_tuple[1:] + (None,),
         ):
-
             if duration > 0:
+                dynamic_change_indication = ComplexTempoEnvelopeToAbjadAttachmentTempo._find_dynamic_change_indication(
+                    tempo_point, next_tempo_point
+                )
+                write_metronome_mark = (
+                    previous_tempo_point is None
+                    or previous_tempo_point.absolute_tempo_in_beat_per_minute
+                    != tempo_point.absolute_tempo_in_beat_per_minute
+                )
                 tempo_attachment = (
-                    ComplexTempoEnvelopeToAbjadAttachmentTempo._process_tempo_event(
-                        tempo_envelope_to_convert,
-                        tempo_point_index,
+                    ComplexTempoEnvelopeToAbjadAttachmentTempo._make_tempo_attachment(
                         tempo_point,
-                        tempo_point_tuple,
-                        tuple(tempo_attachment_list),
+                        dynamic_change_indication,
+                        write_metronome_mark,
+                        stop_dynamic_change_indicaton,
                     )
                 )
                 tempo_attachment_list.append((absolute_time, tempo_attachment))
+                previous_tempo_point = tempo_point
+                stop_dynamic_change_indicaton = dynamic_change_indication is not None
 
         return tuple(tempo_attachment_list)
+
+
+class AbjadTempoMap(object):
+    """Tempos of a score which are shared by the converters of all its voices.
+
+    :param tempo_envelope: The tempo envelope of the score. It should be
+        the same tempo envelope which is used by the quantizers of the
+        voices.
+    :type tempo_envelope: expenvelope.Envelope
+    :param tempo_envelope_to_abjad_attachment_tempo: Class which defines how
+        to convert the tempo envelope to
+        :class:`mutwo.abjad_parameters.Tempo` objects. Default to a new
+        :class:`ComplexTempoEnvelopeToAbjadAttachmentTempo`.
+    :type tempo_envelope_to_abjad_attachment_tempo: TempoEnvelopeToAbjadAttachmentTempo, optional
+
+    The tempo envelope is converted only once when the tempo map is
+    initialised. Pass the tempo map to each
+    :class:`~mutwo.abjad_converters.SequentialEventToAbjadVoice` which
+    prints tempos (argument ``tempo_map``), so that the voices only need
+    to find the leaves at the positions of the tempos.
+
+    **Example:**
+
+    >>> import expenvelope
+    >>> from mutwo import abjad_converters
+    >>> tempo_map = abjad_converters.AbjadTempoMap(
+    ...     expenvelope.Envelope.from_levels_and_durations(
+    ...         levels=[60, 60, 40], durations=[2, 2]
+    ...     )
+    ... )
+    >>> [
+    ...     (absolute_time, tempo.print_metronome_mark)
+    ...     for absolute_time, tempo in tempo_map.tempo_attachment_tuple
+    ... ]
+    [(0, True), (2, False), (4, True)]
+    """
+
+    def __init__(
+        self,
+        tempo_envelope: expenvelope.Envelope,
+        tempo_envelope_to_abjad_attachment_tempo: typing.Optional[
+            TempoEnvelopeToAbjadAttachmentTempo
+        ] = None,
+    ):
+        if tempo_envelope_to_abjad_attachment_tempo is None:
+            tempo_envelope_to_abjad_attachment_tempo = (
+                ComplexTempoEnvelopeToAbjadAttachmentTempo()
+            )
+        self._tempo_envelope = tempo_envelope
+        self._tempo_attachment_tuple = tempo_envelope_to_abjad_attachment_tempo.convert(
+            tempo_envelope
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._tempo_envelope})"
+
+    @property
+    def tempo_envelope(self) -> expenvelope.Envelope:
+        """The tempo envelope of the score."""
+        return self._tempo_envelope
+
+    @property
+    def tempo_attachment_tuple(
+        self,
+    ) -> tuple[tuple[core_constants.Real, abjad_parameters.Tempo], ...]:
+        """Converted tempos and their absolute times."""
+        return self._tempo_attachment_tuple
@@ -1,5 +1,9 @@
+import bisect
+import math
 import typing
 
+import numpy as np
+
 from mutwo import abjad_parameters
 from mutwo import core_converters
 from mutwo import music_parameters
@@ -13,21 +17,123 @@ class MutwoVolumeToAbjadAttachmentDynamic(core_converters.abc.Converter):
     This default class simply checks if the passed Mutwo object belongs to
     :class:`mutwo.ext.parameters.volumes.WesternVolume`. If it does, Mutwo
     will initialise the :class:`Tempo` object from the :attr:`name` attribute.
-    Otherwise Mutwo will first initialise a :class:`WesternVolume` object via
-    its py:method:`mutwo.ext.parameters.volumes.WesternVolume.from_amplitude` method.
+    Otherwise Mutwo will look up the closest dynamic indicator of the volumes
+    amplitude (this gives the same result as
+    py:method:`mutwo.ext.parameters.volumes.WesternVolume.from_amplitude`).
+    The decibel values of the dynamic indicators are read when the converter
+    is initialised.
 
     Hairpins aren't notated with the aid of :class:`mutwo.ext.parameters.abc.Volume`
     objects, but with :class:`mutwo.ext.parameters.playing_indicators.Hairpin`.
+
+    The converter returns the same
+    :class:`~mutwo.converters.frontends.abjad_parameters.Dynamic` object
+    for equal dynamic indicators, therefore the returned objects
+    shouldn't be mutated.
     """
 
+    def __init__(self):
+        self._dynamic_indicator_to_dynamic: dict[str, abjad_parameters.Dynamic] = {}
+        standard_dynamic_indicator_tuple = tuple(
+            music_parameters.constants.STANDARD_DYNAMIC_INDICATOR
+        )
+        decibel_list = [
+            music_parameters.WesternVolume(dynamic_indicator).decibel
+            for dynamic_indicator in standard_dynamic_indicator_tuple
+        ]
+        # A decibel value belongs to the dynamic indicator with the closest
+        # decibel value, so the thresholds are between two dynamic indicators.
+        self._decibel_threshold_tuple = tuple(
+            (decibel0 + decibel1) / 2
+            for decibel0, decibel1 in zip(decibel_list, decibel_list[1:])
+        )
+        self._standard_dynamic_indicator_tuple = standard_dynamic_indicator_tuple
+
+    def _get_dynamic(self, dynamic_indicator: str) -> abjad_parameters.Dynamic:
+        try:
+            return self._dynamic_indicator_to_dynamic[dynamic_indicator]
+        except KeyError:
+            dynamic = self._dynamic_indicator_to_dynamic[dynamic_indicator] = (
+                abjad_parameters.Dynamic.intern(dynamic_indicator=dynamic_indicator)
+            )
+            return dynamic
+
+    def _decibel_to_dynamic_indicator(self, decibel: float) -> str:
+        index = bisect.bisect_right(self._decibel_threshold_tuple, decibel)
+        # Values which are (almost) exactly between two dynamic indicators
+        # may be sorted differently due to floating point imprecision.
+        for threshold_index in (index - 1, index):
+            if 0 <= threshold_index < len(self._decibel_threshold_tuple):
+                if math.isclose(
+                    self._decibel_threshold_tuple[threshold_index], decibel
+                ):
+                    return music_parameters.WesternVolume.from_decibel(decibel).name
+        return self._standard_dynamic_indicator_tuple[index]
+
+    def convert_amplitude_array(
+        self, amplitude_array: np.ndarray
+    ) -> tuple[typing.Optional[abjad_parameters.Dynamic], ...]:
+        """Convert many amplitudes (e.g. of a whole voice) at once.
+
+        :param amplitude_array: The amplitudes which shall be converted.
+        :type amplitude_array: np.ndarray
+
+        Returns ``None`` for amplitudes which aren't bigger than 0 (as
+        :meth:`convert` does).
+
+        **Example:**
+
+        >>> import numpy as np
+        >>> from mutwo import abjad_converters
+        >>> converter = abjad_converters.MutwoVolumeToAbjadAttachmentDynamic()
+        >>> converter.convert_amplitude_array(np.array([0.05, 0, 0.05]))
+        (Dynamic(dynamic_indicator='p'), None, Dynamic(dynamic_indicator='p'))
+        """
+
+        amplitude_array = np.asarray(amplitude_array, dtype=float)
+        is_audible_array = amplitude_array > 0
+        decibel_array = np.full(amplitude_array.shape, -np.inf)
+        decibel_array[is_audible_array] = 20 * np.log10(
+            amplitude_array[is_audible_array]
+        )
+        index_array = np.searchsorted(
+            self._decibel_threshold_tuple, decibel_array, side="right"
+        )
+        is_ambiguous_array = np.zeros(amplitude_array.shape, dtype=bool)
+        if self._decibel_threshold_tuple:
+            is_ambiguous_array = np.isclose(
+                decibel_array[:, np.newaxis],
+                np.array(self._decibel_threshold_tuple)[np.newaxis, :],
+            ).any(axis=1)
+
+        dynamic_list: list[typing.Optional[abjad_parameters.Dynamic]] = []
+        for decibel, index, is_audible, is_ambiguous in zip(
+            decibel_array.tolist(),
+            index_array.tolist(),
+            is_audible_array.tolist(),
+            is_ambiguous_array.tolist(),
+        ):
+            if not is_audible:
+                dynamic_list.append(None)
+                continue
+            if is_ambiguous:
+                dynamic_indicator = self._decibel_to_dynamic_indicator(decibel)
+            else:
+                dynamic_indicator = self._standard_dynamic_indicator_tuple[index]
+            dynamic_list.append(self._get_dynamic(dynamic_indicator))
+        return tuple(dynamic_list)
+
     def convert(
         self, volume_to_convert: music_parameters.abc.Volume
     ) -> typing.Optional[abjad_parameters.Dynamic]:
-        if not isinstance(volume_to_convert, music_parameters.WesternVolume):
-            if volume_to_convert.amplitude > 0:
-                volume_to_convert = music_parameters.WesternVolume.from_amplitude(
-                    volume_to_convert.amplitude
+        if isinstance(volume_to_convert, music_parameters.WesternVolume):
+            dynamic_indicator = volume_to_convert.name
+        else:
+            amplitude = volume_to_convert.amplitude
+            if amplitude > 0:
+                dynamic_indicator = self._decibel_to_dynamic_indicator(
+                    music_parameters.abc.Volume.amplitude_ratio_to_decibel(amplitude)
                 )
             else:
                 return None
-        return abjad_parameters.Dynamic(dynamic_indicator=volume_to_convert.name)
+        return self._get_dynamic(dynamic_indicator)
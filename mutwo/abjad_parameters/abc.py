@@ -1,18 +1,255 @@
 import abc
+import contextvars
+import copyreg
+import dataclasses
+import importlib.metadata
+import inspect
 import typing
+import warnings
+import weakref
 
 import abjad
 
+from mutwo import abjad_parameters
 from mutwo import core_utilities
 from mutwo import music_parameters
 
 
 class AbjadAttachment(abc.ABC):
-    """Abstract base class for all Abjad attachments."""
+    """Abstract base class for all Abjad attachments.
+
+    Subclasses which are defined with the class keyword ``register=True``
+    are added to a registry (see :meth:`get_registered_attachment_class_tuple`).
+    This is only meant for the attachments of this package and of plugins
+    (see :const:`mutwo.abjad_parameters.constants.ATTACHMENT_PLUGIN_ENTRY_POINT_GROUP`),
+    other subclasses have to be passed explicitly to the converters.
+    A ``ValueError`` is raised if a different class with the same class
+    name is already registered.
+
+    Attachments which are created with :meth:`intern` (which is also used by
+    :meth:`from_indicator_collection`) are shared between all events with
+    equal arguments and can't be changed anymore (they are instances of a
+    frozen subclass of their class, copies of them can be changed again).
+    """
+
+    # Registry of subclasses with 'register=True': {class_name: class}
+    _class_name_to_attachment_class: dict[str, typing.Type["AbjadAttachment"]] = {}
+    _are_plugins_loaded = False
+    # Shared attachments: {(class, argument_key_tuple): attachment}
+    _key_to_interned_attachment: weakref.WeakValueDictionary = (
+        weakref.WeakValueDictionary()
+    )
+    # Classes of shared attachments: {class: frozen_class}
+    _attachment_class_to_frozen_class: dict[
+        typing.Type["AbjadAttachment"], typing.Type["AbjadAttachment"]
+    ] = {}
+
+    # Subclasses which don't inherit from a class with an instance
+    # dictionary only need memory for their own slots.
+    __slots__ = ("__weakref__",)
+
+    def __init_subclass__(cls, register: bool = False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The class name is needed for each call of 'from_indicator_collection',
+        # so it's only converted once.
+        cls._class_name = core_utilities.camel_case_to_snake_case(cls.__name__)
+        # Copies of registered classes (e.g. slotted dataclasses) are created
+        # without the class keyword, but they replace the registered class.
+        if register or cls.__dict__.get("_is_registered", False):
+            cls._is_registered = True
+            cls._register()
+
+    @classmethod
+    def _register(cls):
+        class_name = cls._class_name
+        class_name_to_attachment_class = AbjadAttachment._class_name_to_attachment_class
+        try:
+            registered_class = class_name_to_attachment_class[class_name]
+        except KeyError:
+            pass
+        else:
+            # Redefinitions of the same class (e.g. after reloading its module)
+            # replace the old class.
+            if (registered_class.__module__, registered_class.__qualname__) != (
+                cls.__module__,
+                cls.__qualname__,
+            ):
+                raise ValueError(
+                    f"Can't register attachment class '{cls.__module__}."
+                    f"{cls.__qualname__}': the attachment class "
+                    f"'{registered_class.__module__}.{registered_class.__qualname__}'"
+                    f" is already registered with the name '{class_name}'."
+                )
+        class_name_to_attachment_class[class_name] = cls
+
+    @classmethod
+    def _get_frozen_class(cls) -> typing.Type["AbjadAttachment"]:
+        try:
+            return AbjadAttachment._attachment_class_to_frozen_class[cls]
+        except KeyError:
+            pass
+
+        def __setattr__(self, name: str, value: typing.Any):
+            raise AttributeError(
+                f"Can't set attribute '{name}' of shared attachment '{self}'! "
+                "Please create a new attachment instead."
+            )
+
+        def __delattr__(self, name: str):
+            raise AttributeError(
+                f"Can't delete attribute '{name}' of shared attachment '{self}'! "
+                "Please create a new attachment instead."
+            )
+
+        def __reduce_ex__(self, protocol: int):
+            # Copies (and pickled attachments) are normal attachments
+            # of the original class, so that they can be changed.
+            constructor, argument_tuple, *rest = cls.__reduce_ex__(self, protocol)
+            if argument_tuple and argument_tuple[0] is type(self):
+                # 'copyreg.__newobj__' only accepts the class of the object.
+                if constructor is copyreg.__newobj__:
+                    constructor = cls.__new__
+                argument_tuple = (cls,) + argument_tuple[1:]
+            return (constructor, argument_tuple, *rest)
+
+        class_dict = dict(
+            __slots__=(),
+            __qualname__=cls.__qualname__,
+            __module__=cls.__module__,
+            __setattr__=__setattr__,
+            __delattr__=__delattr__,
+            __reduce_ex__=__reduce_ex__,
+        )
+        # The equality check of dataclasses is only true for objects of
+        # the same class, but shared attachments should still be equal to
+        # independent attachments with the same arguments.
+        if dataclasses.is_dataclass(cls) and cls.__dataclass_params__.eq:
+            field_name_tuple = tuple(
+                field.name for field in dataclasses.fields(cls) if field.compare
+            )
+
+            def __eq__(self, other: typing.Any) -> bool:
+                if other.__class__ is not cls and other.__class__ is not type(self):
+                    return NotImplemented
+                return all(
+                    getattr(self, field_name) == getattr(other, field_name)
+                    for field_name in field_name_tuple
+                )
+
+            class_dict.update(__eq__=__eq__, __hash__=cls.__hash__)
+
+        frozen_class = type(cls)(cls.__name__, (cls,), class_dict)
+        AbjadAttachment._attachment_class_to_frozen_class[cls] = frozen_class
+        return frozen_class
+
+    @staticmethod
+    def _get_argument_key(value: typing.Any) -> typing.Hashable:
+        # Equal values of different types (e.g. 1, 1.0 and True) may be
+        # notated differently, so the type is part of the key.
+        if isinstance(value, tuple):
+            return (tuple, tuple(map(AbjadAttachment._get_argument_key, value)))
+        return (type(value), value)
+
+    @staticmethod
+    def _load_plugins():
+        entry_points = importlib.metadata.entry_points()
+        group = abjad_parameters.constants.ATTACHMENT_PLUGIN_ENTRY_POINT_GROUP
+        try:
+            entry_point_tuple = tuple(entry_points.select(group=group))
+        # Python < 3.10
+        except AttributeError:
+            entry_point_tuple = tuple(entry_points.get(group, []))
+        for entry_point in entry_point_tuple:
+            # Loading the entry point is sufficient: attachment classes
+            # with 'register=True' register themselves when they are defined.
+            try:
+                entry_point.load()
+            except Exception as exception:
+                warnings.warn(
+                    f"Couldn't load abjad attachment plugin '{entry_point.name}'"
+                    f" ({entry_point.value}): {exception}"
+                )
+
+    @classmethod
+    def get_registered_attachment_class_tuple(
+        cls, load_plugins: bool = True
+    ) -> tuple[typing.Type["AbjadAttachment"], ...]:
+        """Get all registered (not abstract) attachment classes.
+
+        :param load_plugins: If set to ``True`` attachment classes of
+            installed plugins are loaded before returning the registered
+            classes (plugins are only loaded once). Plugins are packages
+            which declare an entry point in the group
+            :const:`mutwo.abjad_parameters.constants.ATTACHMENT_PLUGIN_ENTRY_POINT_GROUP`
+            that points to a module or class which defines
+            :class:`AbjadAttachment` subclasses. Default to ``True``.
+        :type load_plugins: bool
+
+        The classes are sorted by their name.
+        """
+
+        if load_plugins and not AbjadAttachment._are_plugins_loaded:
+            AbjadAttachment._are_plugins_loaded = True
+            AbjadAttachment._load_plugins()
+        return tuple(
+            sorted(
+                (
+                    attachment_class
+                    for attachment_class in AbjadAttachment._class_name_to_attachment_class.values()
+                    if not inspect.isabstract(attachment_class)
+                ),
+                key=lambda attachment_class: attachment_class.__name__,
+            )
+        )
 
     @classmethod
     def get_class_name(cls):
-        return core_utilities.camel_case_to_snake_case(cls.__name__)
+        try:
+            return cls.__dict__["_class_name"]
+        except KeyError:
+            return core_utilities.camel_case_to_snake_case(cls.__name__)
+
+    @classmethod
+    def intern(cls, **argument_dict) -> "AbjadAttachment":
+        """Get shared attachment which is initialized with the given arguments.
+
+        :param argument_dict: The arguments which are passed to the
+            initialisation of the attachment class.
+
+        Attachments with the same class and the same arguments are only
+        created once and then shared, so scores with many equal attachments
+        need less memory and toggle attachments only need to compare
+        their identity. Shared attachments can't be changed (an
+        ``AttributeError`` is raised), but they can be copied to get
+        an independent attachment. If an argument can't be hashed a
+        new, independent attachment is returned.
+
+        **Example:**
+
+        >>> from mutwo import abjad_parameters
+        >>> dynamic = abjad_parameters.Dynamic.intern(dynamic_indicator="mf")
+        >>> dynamic is abjad_parameters.Dynamic.intern(dynamic_indicator="mf")
+        True
+        """
+
+        try:
+            key = (
+                cls,
+                tuple(
+                    (argument_name, AbjadAttachment._get_argument_key(value))
+                    for argument_name, value in sorted(argument_dict.items())
+                ),
+            )
+            return AbjadAttachment._key_to_interned_attachment[key]
+        except TypeError:
+            return cls(**argument_dict)
+        except KeyError:
+            attachment = cls(**argument_dict)
+            # Frozen dataclasses can't be changed anyway.
+            if not (dataclasses.is_dataclass(cls) and cls.__dataclass_params__.frozen):
+                attachment.__class__ = cls._get_frozen_class()
+            AbjadAttachment._key_to_interned_attachment[key] = attachment
+            return attachment
 
     @classmethod
     def from_indicator_collection(
@@ -34,7 +271,7 @@ class AbjadAttachment(abc.ABC):
         # to make this method working, we also need to inherit
         # the inherited subclass from a mutwo.parameters.abc.Indicator
         # class
-        return cls(**indicator.get_arguments_dict())  # type: ignore
+        return cls.intern(**indicator.get_arguments_dict())  # type: ignore
 
     @abc.abstractmethod
     def process_leaf_tuple(
@@ -44,6 +281,38 @@ class AbjadAttachment(abc.ABC):
     ) -> tuple[abjad.Leaf, ...]:
         raise NotImplementedError()
 
+    @classmethod
+    def process_leaf_tuple_batch(
+        cls,
+        leaf_tuple_sequence: typing.Sequence[tuple[abjad.Leaf, ...]],
+        attachment_sequence: typing.Sequence["AbjadAttachment"],
+        previous_attachment: typing.Optional["AbjadAttachment"] = None,
+    ) -> typing.Iterator[tuple[abjad.Leaf, ...]]:
+        """Process many leaf tuples with (active) attachments of this class.
+
+        :param leaf_tuple_sequence: The leaf tuples to process (e.g. the
+            leaves of all events of a voice).
+        :type leaf_tuple_sequence: typing.Sequence[tuple[abjad.Leaf, ...]]
+        :param attachment_sequence: One attachment for each leaf tuple.
+        :type attachment_sequence: typing.Sequence[AbjadAttachment]
+        :param previous_attachment: The attachment which has been applied
+            before the first leaf tuple. Default to ``None``.
+        :type previous_attachment: typing.Optional[AbjadAttachment]
+
+        This has the same result as calling :meth:`process_leaf_tuple`
+        for each leaf tuple and its attachment (the previous attachment
+        of each attachment is the attachment before it), but subclasses
+        can override it to process all leaf tuples at once. The processed
+        leaf tuples are yielded one after another, so that callers can put
+        each processed leaf tuple into their container before the next
+        leaf tuple is processed. Leaf tuples which didn't change may be
+        yielded as they are.
+        """
+
+        for leaf_tuple, attachment in zip(leaf_tuple_sequence, attachment_sequence):
+            yield attachment.process_leaf_tuple(leaf_tuple, previous_attachment)
+            previous_attachment = attachment
+
     @property
     @abc.abstractmethod
     def is_active(self) -> bool:
@@ -60,6 +329,8 @@ class ToggleAttachment(AbjadAttachment):
     which only get notated if their value changes.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def process_leaf(
         self, leaf: abjad.Leaf, previous_attachment: typing.Optional["AbjadAttachment"]
@@ -71,6 +342,10 @@ class ToggleAttachment(AbjadAttachment):
         leaf_tuple: tuple[abjad.Leaf, ...],
         previous_attachment: typing.Optional["AbjadAttachment"],
     ) -> tuple[abjad.Leaf, ...]:
+        # Shared attachments (see 'AbjadAttachment.intern') are equal
+        # if they are identical, so the (slower) comparison is avoided.
+        if previous_attachment is self:
+            return leaf_tuple
         if previous_attachment != self:
             return (
                 self.process_leaf(leaf_tuple[0], previous_attachment),
@@ -78,6 +353,31 @@ class ToggleAttachment(AbjadAttachment):
         else:
             return leaf_tuple
 
+    @classmethod
+    def process_leaf_tuple_batch(
+        cls,
+        leaf_tuple_sequence: typing.Sequence[tuple[abjad.Leaf, ...]],
+        attachment_sequence: typing.Sequence["AbjadAttachment"],
+        previous_attachment: typing.Optional["AbjadAttachment"] = None,
+    ) -> typing.Iterator[tuple[abjad.Leaf, ...]]:
+        # Subclasses which change 'process_leaf_tuple' need to be called
+        # for each leaf tuple.
+        if cls.process_leaf_tuple is not ToggleAttachment.process_leaf_tuple:
+            yield from super().process_leaf_tuple_batch(
+                leaf_tuple_sequence, attachment_sequence, previous_attachment
+            )
+            return
+        for leaf_tuple, attachment in zip(leaf_tuple_sequence, attachment_sequence):
+            # Only leaves where the attachment changes are processed.
+            if previous_attachment is not attachment and (
+                previous_attachment != attachment
+            ):
+                leaf_tuple = (
+                    attachment.process_leaf(leaf_tuple[0], previous_attachment),
+                ) + leaf_tuple[1:]
+            yield leaf_tuple
+            previous_attachment = attachment
+
 
 class BangAttachment(AbjadAttachment):
     """Abstract base class for Abjad attachments which behave like a bang.
@@ -89,6 +389,8 @@ class BangAttachment(AbjadAttachment):
     elements which have to be notated again and again to be effective.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def process_first_leaf(self, leaf: abjad.Leaf) -> abjad.Leaf:
         raise NotImplementedError()
@@ -124,6 +426,8 @@ class BangAttachment(AbjadAttachment):
 
 
 class BangEachAttachment(BangAttachment):
+    __slots__ = ()
+
     @abc.abstractmethod
     def process_leaf(
         self, leaf: abjad.Leaf
@@ -147,6 +451,8 @@ class BangEachAttachment(BangAttachment):
 
 
 class BangFirstAttachment(BangAttachment):
+    __slots__ = ()
+
     @abc.abstractmethod
     def process_leaf(
         self, leaf: abjad.Leaf
@@ -168,8 +474,35 @@ class BangFirstAttachment(BangAttachment):
     ) -> typing.Union[abjad.Leaf, typing.Sequence[abjad.Leaf]]:
         return leaf
 
+    @classmethod
+    def process_leaf_tuple_batch(
+        cls,
+        leaf_tuple_sequence: typing.Sequence[tuple[abjad.Leaf, ...]],
+        attachment_sequence: typing.Sequence["AbjadAttachment"],
+        previous_attachment: typing.Optional["AbjadAttachment"] = None,
+    ) -> typing.Iterator[tuple[abjad.Leaf, ...]]:
+        # If only the first leaf is processed, the other leaves can be
+        # skipped (but subclasses may change this).
+        if (
+            cls.process_leaf_tuple is not BangAttachment.process_leaf_tuple
+            or cls.process_central_leaf is not BangFirstAttachment.process_central_leaf
+            or cls.process_last_leaf is not BangFirstAttachment.process_last_leaf
+        ):
+            yield from super().process_leaf_tuple_batch(
+                leaf_tuple_sequence, attachment_sequence, previous_attachment
+            )
+            return
+        for leaf_tuple, attachment in zip(leaf_tuple_sequence, attachment_sequence):
+            if leaf_tuple:
+                leaf_tuple = (attachment.process_first_leaf(leaf_tuple[0]),) + (
+                    leaf_tuple[1:]
+                )
+            yield leaf_tuple
+
 
 class BangLastAttachment(BangAttachment):
+    __slots__ = ()
+
     @abc.abstractmethod
     def process_leaf(
         self, leaf: abjad.Leaf
@@ -195,3 +528,151 @@ class BangLastAttachment(BangAttachment):
             return leaf_tuple[:-1] + (self.process_last_leaf(leaf_tuple[-1]),)
         else:
             return leaf_tuple
+
+
+class LeafRewritePlan(object):
+    """Collect notes which are replaced by chords and move their indicators at once.
+
+    Some conversion steps (for instance the pitches of an event or
+    attachments as :class:`~mutwo.abjad_parameters.ArtificalHarmonic`)
+    need to replace a note by a chord. Without an active plan :meth:`to_chord`
+    copies all indicators of the note to the new chord immediately. While
+    a plan is active (in a ``with`` statement) the indicators are only
+    moved once for each chord when the plan is applied at the end of the
+    ``with`` statement. If such a chord is passed to :meth:`to_chord`
+    again, the new chord takes over the indicators of all replaced leaves.
+
+    **Example:**
+
+    >>> import abjad
+    >>> from mutwo import abjad_parameters
+    >>> voice = abjad.Voice([abjad.Note("c'4")])
+    >>> abjad.attach(abjad.Dynamic("p"), voice[0])
+    >>> with abjad_parameters.abc.LeafRewritePlan():
+    ...     voice[0] = abjad_parameters.abc.LeafRewritePlan.to_chord(
+    ...         voice[0], ["c'", "g'"]
+    ...     )
+    >>> abjad.lilypond(voice[0])
+    "<c' g'>4\\n\\\\p"
+    """
+
+    _active_leaf_rewrite_plan: contextvars.ContextVar = contextvars.ContextVar(
+        "active_leaf_rewrite_plan", default=None
+    )
+
+    def __init__(self):
+        # {id(chord): (chord, replaced_leaf_tuple)}
+        self._chord_id_to_chord_and_replaced_leaf_tuple: dict[
+            int, tuple[abjad.Chord, tuple[abjad.Leaf, ...]]
+        ] = {}
+        self._token_list: list[contextvars.Token] = []
+
+    def __enter__(self) -> "LeafRewritePlan":
+        self._token_list.append(LeafRewritePlan._active_leaf_rewrite_plan.set(self))
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        LeafRewritePlan._active_leaf_rewrite_plan.reset(self._token_list.pop())
+        if exception_type is None:
+            self.apply()
+
+    @staticmethod
+    def _get_copyable_indicator_list(leaf: abjad.Leaf) -> list[typing.Any]:
+        # Annotations (dicts) are specific to the replaced leaf.
+        return [
+            indicator
+            for indicator in abjad.get.indicators(leaf)
+            if type(indicator) != dict
+        ]
+
+    @staticmethod
+    def to_chord(
+        leaf: abjad.Leaf, written_pitches: typing.Sequence[typing.Any]
+    ) -> abjad.Chord:
+        """Make chord which replaces ``leaf``.
+
+        :param leaf: The leaf which is going to be replaced by the returned chord.
+        :type leaf: abjad.Leaf
+        :param written_pitches: The pitches of the new chord.
+        :type written_pitches: typing.Sequence[typing.Any]
+
+        The caller is responsible to put the chord at the place of ``leaf``.
+        """
+
+        chord = abjad.Chord(written_pitches, leaf.written_duration)
+        leaf_rewrite_plan = LeafRewritePlan._active_leaf_rewrite_plan.get()
+        if leaf_rewrite_plan is None:
+            for indicator in LeafRewritePlan._get_copyable_indicator_list(leaf):
+                abjad.attach(indicator, chord)
+        else:
+            chord_id_to_chord_and_replaced_leaf_tuple = (
+                leaf_rewrite_plan._chord_id_to_chord_and_replaced_leaf_tuple
+            )
+            # If the leaf is a chord which is still waiting for the
+            # indicators of the leaves which it replaced, the new chord
+            # gets them instead (followed by the indicators of the leaf).
+            try:
+                _, replaced_leaf_tuple = chord_id_to_chord_and_replaced_leaf_tuple.pop(
+                    id(leaf)
+                )
+            except KeyError:
+                replaced_leaf_tuple = ()
+            chord_id_to_chord_and_replaced_leaf_tuple[id(chord)] = (
+                chord,
+                replaced_leaf_tuple + (leaf,),
+            )
+        return chord
+
+    @staticmethod
+    def get_indicator_list(leaf: abjad.Leaf) -> list[typing.Any]:
+        """Get indicators of leaf, including the not yet moved indicators.
+
+        :param leaf: The leaf which indicators shall be returned.
+        :type leaf: abjad.Leaf
+
+        Use this function instead of ``abjad.get.indicators`` when replacing
+        a leaf which may be a chord returned by :meth:`to_chord`.
+        """
+
+        indicator_list = []
+        leaf_rewrite_plan = LeafRewritePlan._active_leaf_rewrite_plan.get()
+        if leaf_rewrite_plan is not None:
+            try:
+                (
+                    _,
+                    replaced_leaf_tuple,
+                ) = leaf_rewrite_plan._chord_id_to_chord_and_replaced_leaf_tuple[
+                    id(leaf)
+                ]
+            except KeyError:
+                pass
+            else:
+                for replaced_leaf in replaced_leaf_tuple:
+                    indicator_list.extend(
+                        LeafRewritePlan._get_copyable_indicator_list(replaced_leaf)
+                    )
+        indicator_list.extend(abjad.get.indicators(leaf))
+        return indicator_list
+
+    def apply(self):
+        """Move indicators of all replaced leaves to their chords."""
+
+        for (
+            chord,
+            replaced_leaf_tuple,
+        ) in self._chord_id_to_chord_and_replaced_leaf_tuple.values():
+            # The chord has been removed from its container and isn't
+            # used anymore.
+            if abjad.get.parentage(chord).parent is None:
+                continue
+            wrapper_list = chord._wrappers
+            n_wrappers = len(wrapper_list)
+            for replaced_leaf in replaced_leaf_tuple:
+                for indicator in LeafRewritePlan._get_copyable_indicator_list(
+                    replaced_leaf
+                ):
+                    abjad.attach(indicator, chord)
+            # Indicators of the replaced leaves have been attached earlier,
+            # so they are formatted before the indicators of the chord.
+            wrapper_list[:] = wrapper_list[n_wrappers:] + wrapper_list[:n_wrappers]
+        self._chord_id_to_chord_and_replaced_leaf_tuple.clear()
@@ -1,8 +1,10 @@
 """Build Abjad attachments from Mutwo data.
 """
 
+import copy
 import dataclasses
-import inspect
+import functools
+import sys
 import typing
 import warnings
 
@@ -11,10 +13,81 @@ import abjad  # type: ignore
 from mutwo import abjad_parameters
 from mutwo import music_parameters
 
+__all__ = (
+    "Arpeggio",
+    "Articulation",
+    "Trill",
+    "Cue",
+    "WoodwindFingering",
+    "Tremolo",
+    "ArtificalHarmonic",
+    "PreciseNaturalHarmonic",
+    "StringContactPoint",
+    "Pedal",
+    "Hairpin",
+    "BartokPizzicato",
+    "BreathMark",
+    "Fermata",
+    "NaturalHarmonic",
+    "Prall",
+    "Tie",
+    "DurationLineTriller",
+    "DurationLineDashed",
+    "Glissando",
+    "BendAfter",
+    "LaissezVibrer",
+    "BarLine",
+    "Clef",
+    "Ottava",
+    "Markup",
+    "RehearsalMark",
+    "MarginMarkup",
+    "Ornamentation",
+    "Dynamic",
+    "Tempo",
+    "DynamicChangeIndicationStop",
+    "GraceNoteSequentialEvent",
+    "AfterGraceNoteSequentialEvent",
+)
+
 LeafOrLeafSequence = typing.Union[abjad.Leaf, typing.Sequence[abjad.Leaf]]
 
+# Prebuilt indicators are only templates: abjad indicators are mutable,
+# so each leaf gets its own copy of them.
+_PREBUILT_INDICATOR_CACHE_SIZE = 128
+
+# Slotted dataclasses are only supported since python 3.10
+_DATACLASS_SLOTS_ARGUMENT_DICT = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _frozen_attachment_dataclass(
+    cls: typing.Type[typing.Any],
+) -> typing.Type[typing.Any]:
+    """Make frozen (and if possible slotted) dataclass with a cached hash."""
+
+    # The hash is only calculated once, because attachments can't change.
+    cls.__annotations__ = dict(cls.__annotations__, _hash=typing.Optional[int])
+    cls._hash = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        if (hash_value := self._hash) is None:
+            hash_value = hash(
+                tuple(
+                    getattr(self, field.name)
+                    for field in dataclasses.fields(self)
+                    if field.compare
+                )
+            )
+            object.__setattr__(self, "_hash", hash_value)
+        return hash_value
 
-class Arpeggio(music_parameters.Arpeggio, abjad_parameters.abc.BangFirstAttachment):
+    cls.__hash__ = __hash__
+    return dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS_ARGUMENT_DICT)(cls)
+
+
+class Arpeggio(
+    music_parameters.Arpeggio, abjad_parameters.abc.BangFirstAttachment, register=True
+):
     _string_to_direction = {
         "up": abjad.enums.Up,
         "down": abjad.enums.Down,
@@ -32,20 +105,26 @@ class Arpeggio(music_parameters.Arpeggio, abjad_parameters.abc.BangFirstAttachme
 
 
 class Articulation(
-    music_parameters.Articulation, abjad_parameters.abc.BangEachAttachment
+    music_parameters.Articulation,
+    abjad_parameters.abc.BangEachAttachment,
+    register=True,
 ):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(abjad.Articulation(self.name), leaf)
         return leaf
 
 
-class Trill(music_parameters.Trill, abjad_parameters.abc.BangFirstAttachment):
+class Trill(
+    music_parameters.Trill, abjad_parameters.abc.BangFirstAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(abjad.Articulation("trill"), leaf)
         return leaf
 
 
-class Cue(music_parameters.Cue, abjad_parameters.abc.BangFirstAttachment):
+class Cue(
+    music_parameters.Cue, abjad_parameters.abc.BangFirstAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
             abjad.Markup(contents=f"\\rounded-box {{ {self.nth_cue} }}", direction="^"),
@@ -55,7 +134,9 @@ class Cue(music_parameters.Cue, abjad_parameters.abc.BangFirstAttachment):
 
 
 class WoodwindFingering(
-    music_parameters.WoodwindFingering, abjad_parameters.abc.BangFirstAttachment
+    music_parameters.WoodwindFingering,
+    abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
     fingering_size = 0.7
 
@@ -83,7 +164,9 @@ class WoodwindFingering(
         return leaf
 
 
-class Tremolo(music_parameters.Tremolo, abjad_parameters.abc.BangEachAttachment):
+class Tremolo(
+    music_parameters.Tremolo, abjad_parameters.abc.BangEachAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
             abjad.StemTremolo(self.n_flags * (2 ** leaf.written_duration.flag_count)),
@@ -93,7 +176,9 @@ class Tremolo(music_parameters.Tremolo, abjad_parameters.abc.BangEachAttachment)
 
 
 class ArtificalHarmonic(
-    music_parameters.ArtificalHarmonic, abjad_parameters.abc.BangEachAttachment
+    music_parameters.ArtificalHarmonic,
+    abjad_parameters.abc.BangEachAttachment,
+    register=True,
 ):
     @staticmethod
     def _change_note_head_style(leaf: abjad.Chord) -> None:
@@ -118,14 +203,9 @@ class ArtificalHarmonic(
             return leaf, True
 
         elif isinstance(leaf, abjad.Note):
-            new_abjad_leaf = abjad.Chord(
-                [leaf.written_pitch],
-                leaf.written_duration,
+            new_abjad_leaf = abjad_parameters.abc.LeafRewritePlan.to_chord(
+                leaf, [leaf.written_pitch]
             )
-            for indicator in abjad.get.indicators(leaf):
-                if type(indicator) != dict:
-                    abjad.attach(indicator, new_abjad_leaf)
-
             return new_abjad_leaf, True
 
         else:
@@ -149,7 +229,9 @@ class ArtificalHarmonic(
 
 
 class PreciseNaturalHarmonic(
-    music_parameters.PreciseNaturalHarmonic, abjad_parameters.abc.BangEachAttachment
+    music_parameters.PreciseNaturalHarmonic,
+    abjad_parameters.abc.BangEachAttachment,
+    register=True,
 ):
     @staticmethod
     def _convert_leaf(leaf: abjad.Leaf) -> tuple[abjad.Leaf, bool]:
@@ -157,15 +239,7 @@ class PreciseNaturalHarmonic(
             return leaf
 
         else:
-            new_abjad_leaf = abjad.Chord(
-                "c",
-                leaf.written_duration,
-            )
-            for indicator in abjad.get.indicators(leaf):
-                if type(indicator) != dict:
-                    abjad.attach(indicator, new_abjad_leaf)
-
-            return new_abjad_leaf
+            return abjad_parameters.abc.LeafRewritePlan.to_chord(leaf, "c")
 
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         if isinstance(leaf, (abjad.Chord, abjad.Note)):
@@ -189,55 +263,87 @@ class PreciseNaturalHarmonic(
 
 
 class StringContactPoint(
-    music_parameters.StringContactPoint, abjad_parameters.abc.ToggleAttachment
+    music_parameters.StringContactPoint,
+    abjad_parameters.abc.ToggleAttachment,
+    register=True,
 ):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    # The extended abjad class and the abbreviation dict only need to
+    # be rebuilt if 'CUSTOM_STRING_CONTACT_POINT_DICT' changed:
+    # (custom_string_contact_point_item_tuple, class, abbreviation_dict)
+    _string_contact_point_class_data: typing.Optional[
+        tuple[
+            tuple[tuple[str, str], ...],
+            typing.Type[abjad.StringContactPoint],
+            dict[str, str],
+        ]
+    ] = None
 
-        # Extend abjad with custom string contact points
-        class StringContactPoint(abjad.StringContactPoint):
-            _contact_point = abjad.StringContactPoint._contact_points + tuple(
-                abjad_parameters.configurations.CUSTOM_STRING_CONTACT_POINT_DICT.keys()
+    @staticmethod
+    def _get_string_contact_point_class_data() -> tuple[
+        typing.Type[abjad.StringContactPoint], dict[str, str]
+    ]:
+        custom_string_contact_point_item_tuple = tuple(
+            abjad_parameters.configurations.CUSTOM_STRING_CONTACT_POINT_DICT.items()
+        )
+        string_contact_point_class_data = (
+            StringContactPoint._string_contact_point_class_data
+        )
+        if (
+            string_contact_point_class_data is None
+            or string_contact_point_class_data[0]
+            != custom_string_contact_point_item_tuple
+        ):
+            # Extend abjad with custom string contact points
+            string_contact_point_class = type(
+                "StringContactPoint",
+                (abjad.StringContactPoint,),
+                {
+                    "_contact_points": abjad.StringContactPoint._contact_points
+                    + tuple(
+                        full_name
+                        for full_name, _ in custom_string_contact_point_item_tuple
+                    ),
+                    "_contact_point_abbreviations": dict(
+                        abjad.StringContactPoint._contact_point_abbreviations,
+                        **dict(custom_string_contact_point_item_tuple),
+                    ),
+                },
             )
-            _contact_point_abbreviations = dict(
-                abjad.StringContactPoint._contact_point_abbreviations,
-                **abjad_parameters.configurations.CUSTOM_STRING_CONTACT_POINT_DICT,
+            string_contact_point_class_data = (
+                StringContactPoint._string_contact_point_class_data
+            ) = (
+                custom_string_contact_point_item_tuple,
+                string_contact_point_class,
+                {
+                    abbreviation: full_name
+                    for full_name, abbreviation in string_contact_point_class._contact_point_abbreviations.items()
+                },
             )
+        return string_contact_point_class_data[1:]
 
-        self._string_contact_point_class = StringContactPoint
-        self._abbreviation_to_string_contact_point = {
-            abbreviation: full_name
-            for full_name, abbreviation in StringContactPoint._contact_point_abbreviations.items()
-        }
-
-    def _attach_string_contact_point(
-        self,
-        leaf: abjad.Leaf,
-        previous_attachment: typing.Optional["abjad_parameters.abc.AbjadAttachment"],
-        string_contact_point_markup: abjad.Markup,
-    ):
-        if previous_attachment:
-            if previous_attachment.contact_point == "pizzicato":  # type: ignore
-                string_contact_point_markup = abjad.Markup(
-                    [
-                        abjad.markups.MarkupCommand(
-                            "caps",
-                            "arco {}".format(
-                                " ".join(
-                                    string_contact_point_markup.contents[0].arguments
-                                )
-                            ),
-                        )
-                    ]
-                )
-
-        abjad.attach(
-            abjad.Markup(
-                [abjad.markups.MarkupCommand("fontsize", -2.4)]
-                + string_contact_point_markup.contents,
-                direction="up",
-            ),
-            leaf,
+    @staticmethod
+    @functools.lru_cache(maxsize=_PREBUILT_INDICATOR_CACHE_SIZE)
+    def _get_markup(
+        string_contact_point_class: typing.Type[abjad.StringContactPoint],
+        contact_point: str,
+        is_arco: bool,
+    ) -> abjad.Markup:
+        string_contact_point_markup = string_contact_point_class(contact_point).markup
+        if is_arco:
+            string_contact_point_markup = abjad.Markup(
+                [
+                    abjad.markups.MarkupCommand(
+                        "caps",
+                        "arco {}".format(
+                            " ".join(string_contact_point_markup.contents[0].arguments)
+                        ),
+                    )
+                ]
+            )
+        return abjad.Markup(
+            [abjad.markups.MarkupCommand("fontsize", -2.4)]
+            + string_contact_point_markup.contents,
+            direction="up",
         )
 
     def process_leaf(
@@ -245,22 +351,27 @@ class StringContactPoint(
         leaf: abjad.Leaf,
         previous_attachment: typing.Optional["abjad_parameters.abc.AbjadAttachment"],
     ) -> LeafOrLeafSequence:
+        (
+            string_contact_point_class,
+            abbreviation_to_string_contact_point,
+        ) = self._get_string_contact_point_class_data()
         contact_point = self.contact_point
-        if contact_point in self._abbreviation_to_string_contact_point:
-            contact_point = self._abbreviation_to_string_contact_point[contact_point]
+        if contact_point in abbreviation_to_string_contact_point:
+            contact_point = abbreviation_to_string_contact_point[contact_point]
+        is_arco = bool(previous_attachment) and (
+            previous_attachment.contact_point == "pizzicato"  # type: ignore
+        )
         try:
-            string_contact_point_markup = self._string_contact_point_class(
-                contact_point
-            ).markup
+            markup = self._get_markup(
+                string_contact_point_class, contact_point, is_arco
+            )
         except AssertionError:
             warnings.warn(
                 f"Can't find contact point '{self.contact_point}' "
-                f"in '{self._string_contact_point_class._contact_point_abbreviations}'!"
+                f"in '{string_contact_point_class._contact_point_abbreviations}'!"
             )
         else:
-            self._attach_string_contact_point(
-                leaf, previous_attachment, string_contact_point_markup
-            )
+            abjad.attach(copy.copy(markup), leaf)
         return leaf
 
     def process_leaf_tuple(
@@ -275,7 +386,9 @@ class StringContactPoint(
             return leaf_tuple
 
 
-class Pedal(music_parameters.Pedal, abjad_parameters.abc.ToggleAttachment):
+class Pedal(
+    music_parameters.Pedal, abjad_parameters.abc.ToggleAttachment, register=True
+):
     def process_leaf(
         self,
         leaf: abjad.Leaf,
@@ -301,7 +414,9 @@ class Pedal(music_parameters.Pedal, abjad_parameters.abc.ToggleAttachment):
             return leaf_tuple
 
 
-class Hairpin(music_parameters.Hairpin, abjad_parameters.abc.ToggleAttachment):
+class Hairpin(
+    music_parameters.Hairpin, abjad_parameters.abc.ToggleAttachment, register=True
+):
     niente_literal = abjad.LilyPondLiteral(r"\once \override Hairpin.circled-tip = ##t")
 
     def process_leaf(
@@ -358,28 +473,32 @@ class Hairpin(music_parameters.Hairpin, abjad_parameters.abc.ToggleAttachment):
 class BartokPizzicato(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
+    snap_pizzicato_literal = abjad.LilyPondLiteral(
+        "\\snappizzicato", format_slot="after"
+    )
+
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
-        abjad.attach(
-            abjad.LilyPondLiteral("\\snappizzicato", format_slot="after"),
-            leaf,
-        )
+        abjad.attach(self.snap_pizzicato_literal, leaf)
         return leaf
 
 
 class BreathMark(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
+    breathe_literal = abjad.LilyPondLiteral("\\breathe", format_slot="before")
+
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
-        abjad.attach(
-            abjad.LilyPondLiteral("\\breathe", format_slot="before"),
-            leaf,
-        )
+        abjad.attach(self.breathe_literal, leaf)
         return leaf
 
 
-class Fermata(music_parameters.Fermata, abjad_parameters.abc.BangFirstAttachment):
+class Fermata(
+    music_parameters.Fermata, abjad_parameters.abc.BangFirstAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
             abjad.Fermata(self.fermata_type),
@@ -391,31 +510,33 @@ class Fermata(music_parameters.Fermata, abjad_parameters.abc.BangFirstAttachment
 class NaturalHarmonic(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
-    def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
-        abjad.attach(
-            abjad.LilyPondLiteral("\\flageolet", directed="up", format_slot="after"),
-            leaf,
-        )
+    flageolet_literal = abjad.LilyPondLiteral(
+        "\\flageolet", directed="up", format_slot="after"
+    )
 
+    def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
+        abjad.attach(self.flageolet_literal, leaf)
         return leaf
 
 
 class Prall(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
+    prall_literal = abjad.LilyPondLiteral("^\\prall", format_slot="after")
+
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
-        abjad.attach(
-            abjad.LilyPondLiteral("^\\prall", format_slot="after"),
-            leaf,
-        )
+        abjad.attach(self.prall_literal, leaf)
         return leaf
 
 
 class Tie(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangLastAttachment,
+    register=True,
 ):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         if isinstance(leaf, (abjad.Chord, abjad.Note)):
@@ -429,95 +550,105 @@ class Tie(
 class DurationLineTriller(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangEachAttachment,
+    register=True,
 ):
+    duration_line_style_literal = abjad.LilyPondLiteral(
+        "\\once \\override DurationLine.style = #'trill"
+    )
+
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         if isinstance(leaf, (abjad.Chord, abjad.Note)):
-            abjad.attach(
-                abjad.LilyPondLiteral("\\once \\override DurationLine.style = #'trill"),
-                leaf,
-            )
+            abjad.attach(self.duration_line_style_literal, leaf)
         return leaf
 
 
 class DurationLineDashed(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangEachAttachment,
+    register=True,
 ):
+    duration_line_style_literal = abjad.LilyPondLiteral(
+        "\\once \\override DurationLine.style = #'dashed-line"
+    )
+
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         if isinstance(leaf, (abjad.Chord, abjad.Note)):
-            abjad.attach(
-                abjad.LilyPondLiteral(
-                    "\\once \\override DurationLine.style = #'dashed-line"
-                ),
-                leaf,
-            )
+            abjad.attach(self.duration_line_style_literal, leaf)
         return leaf
 
 
 class Glissando(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangLastAttachment,
+    register=True,
 ):
     thickness = 3
     minimum_length = 5
 
-    def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
-        abjad.attach(
-            abjad.LilyPondLiteral(
-                "\\override Glissando.thickness = #'{}".format(self.thickness)
-            ),
-            leaf,
-        )
-        abjad.attach(
-            abjad.LilyPondLiteral(
-                "\\override Glissando.minimum-length = #{}".format(self.minimum_length)
-            ),
-            leaf,
-        )
-        abjad.attach(
-            abjad.LilyPondLiteral("\\override Glissando.breakable = ##t"),
-            leaf,
-        )
-        abjad.attach(
-            abjad.LilyPondLiteral("\\override Glissando.after-line-breaking = ##t"),
-            leaf,
-        )
-        # Prevent duration line from getting printed when we print a glissando
-        abjad.attach(
-            abjad.LilyPondLiteral("\\once \\override DurationLine.style = #'none"), leaf
+    @staticmethod
+    @functools.lru_cache(maxsize=_PREBUILT_INDICATOR_CACHE_SIZE)
+    def _get_literal_tuple(
+        thickness: int, minimum_length: int
+    ) -> tuple[abjad.LilyPondLiteral, ...]:
+        # The literals only depend on the glissando parameters, so they
+        # are only created once and then copied for each glissando.
+        return tuple(
+            abjad.LilyPondLiteral(command)
+            for command in (
+                "\\override Glissando.thickness = #'{}".format(thickness),
+                "\\override Glissando.minimum-length = #{}".format(minimum_length),
+                "\\override Glissando.breakable = ##t",
+                "\\override Glissando.after-line-breaking = ##t",
+                # Prevent duration line from getting printed when we print a glissando
+                "\\once \\override DurationLine.style = #'none",
+                "\\override "
+                "Glissando.springs-and-rods = #ly:spanner::set-spacing-rods",
+            )
         )
-        command = "\\override "
-        command += "Glissando.springs-and-rods = #ly:spanner::set-spacing-rods"
-        abjad.attach(abjad.LilyPondLiteral(command), leaf)
+
+    def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
+        # abjad compares indicators with a context (as the glissando) with
+        # all indicators which are already attached, so the glissando is
+        # attached before the literals (this doesn't change the output).
         abjad.attach(
             abjad.Glissando(allow_ties=True),
             leaf,
         )
+        for literal in self._get_literal_tuple(self.thickness, self.minimum_length):
+            abjad.attach(copy.copy(literal), leaf)
         return leaf
 
 
-class BendAfter(music_parameters.BendAfter, abjad_parameters.abc.BangLastAttachment):
-    def _attach_bend_after_to_note(self, note: abjad.Note):
-        abjad.attach(
+class BendAfter(
+    music_parameters.BendAfter, abjad_parameters.abc.BangLastAttachment, register=True
+):
+    @staticmethod
+    @functools.lru_cache(maxsize=_PREBUILT_INDICATOR_CACHE_SIZE)
+    def _get_indicator_tuple(
+        thickness: float, minimum_length: float, bend_amount: float
+    ) -> tuple[typing.Union[abjad.LilyPondLiteral, abjad.BendAfter], ...]:
+        return (
             abjad.LilyPondLiteral(
-                "\\once \\override BendAfter.thickness = #'{}".format(self.thickness)
+                "\\once \\override BendAfter.thickness = #'{}".format(thickness)
             ),
-            note,
-        )
-        abjad.attach(
             abjad.LilyPondLiteral(
-                f"\\once \\override BendAfter.minimum-length = #{self.minimum_length}"
+                f"\\once \\override BendAfter.minimum-length = #{minimum_length}"
             ),
-            note,
+            abjad.LilyPondLiteral("\\once \\override DurationLine.style = #'none"),
+            abjad.BendAfter(bend_amount=bend_amount),
         )
-        abjad.attach(
-            abjad.LilyPondLiteral("\\once \\override DurationLine.style = #'none"), note
-        )
-        abjad.attach(abjad.BendAfter(bend_amount=self.bend_amount), note)
+
+    def _attach_bend_after_to_note(self, note: abjad.Note):
+        for indicator in self._get_indicator_tuple(
+            self.thickness, self.minimum_length, self.bend_amount
+        ):
+            abjad.attach(copy.copy(indicator), note)
 
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         if isinstance(leaf, abjad.Chord):
-            indicator_list = abjad.get.indicators(leaf)
+            indicator_list = abjad_parameters.abc.LeafRewritePlan.get_indicator_list(
+                leaf
+            )
             container = abjad.Container([], simultaneous=True)
             for note_head in leaf.note_heads:
                 note = abjad.Note("c", leaf.written_duration)
@@ -539,6 +670,7 @@ class BendAfter(music_parameters.BendAfter, abjad_parameters.abc.BangLastAttachm
 class LaissezVibrer(
     music_parameters.abc.ExplicitPlayingIndicator,
     abjad_parameters.abc.BangLastAttachment,
+    register=True,
 ):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
@@ -548,7 +680,9 @@ class LaissezVibrer(
         return leaf
 
 
-class BarLine(music_parameters.BarLine, abjad_parameters.abc.BangLastAttachment):
+class BarLine(
+    music_parameters.BarLine, abjad_parameters.abc.BangLastAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
             abjad.BarLine(self.abbreviation),
@@ -557,7 +691,9 @@ class BarLine(music_parameters.BarLine, abjad_parameters.abc.BangLastAttachment)
         return leaf
 
 
-class Clef(music_parameters.Clef, abjad_parameters.abc.BangFirstAttachment):
+class Clef(
+    music_parameters.Clef, abjad_parameters.abc.BangFirstAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
             abjad.Clef(self.name),
@@ -566,7 +702,9 @@ class Clef(music_parameters.Clef, abjad_parameters.abc.BangFirstAttachment):
         return leaf
 
 
-class Ottava(music_parameters.Ottava, abjad_parameters.abc.ToggleAttachment):
+class Ottava(
+    music_parameters.Ottava, abjad_parameters.abc.ToggleAttachment, register=True
+):
     def process_leaf(
         self,
         leaf: abjad.Leaf,
@@ -590,7 +728,9 @@ class Ottava(music_parameters.Ottava, abjad_parameters.abc.ToggleAttachment):
             return leaf_tuple
 
 
-class Markup(music_parameters.Markup, abjad_parameters.abc.BangFirstAttachment):
+class Markup(
+    music_parameters.Markup, abjad_parameters.abc.BangFirstAttachment, register=True
+):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
             abjad.Markup(self.content, direction=self.direction),
@@ -600,7 +740,9 @@ class Markup(music_parameters.Markup, abjad_parameters.abc.BangFirstAttachment):
 
 
 class RehearsalMark(
-    music_parameters.RehearsalMark, abjad_parameters.abc.BangFirstAttachment
+    music_parameters.RehearsalMark,
+    abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(
@@ -611,7 +753,9 @@ class RehearsalMark(
 
 
 class MarginMarkup(
-    music_parameters.MarginMarkup, abjad_parameters.abc.BangFirstAttachment
+    music_parameters.MarginMarkup,
+    abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         command = "\\set {}.instrumentName = \\markup ".format(self.context)
@@ -624,7 +768,9 @@ class MarginMarkup(
 
 
 class Ornamentation(
-    music_parameters.Ornamentation, abjad_parameters.abc.BangFirstAttachment
+    music_parameters.Ornamentation,
+    abjad_parameters.abc.BangFirstAttachment,
+    register=True,
 ):
     _direction_to_ornamentation_command = {
         "up": """
@@ -639,31 +785,36 @@ class Ornamentation(
       (lineto 3.5 0))""",
     }
 
-    def _make_markup(self) -> abjad.Markup:
+    @staticmethod
+    @functools.lru_cache(maxsize=_PREBUILT_INDICATOR_CACHE_SIZE)
+    def _get_markup(n_times: int, direction: str) -> abjad.Markup:
         return abjad.Markup(
             [
                 abjad.markups.MarkupCommand("vspace", -0.25),
                 abjad.markups.MarkupCommand("fontsize", -4),
-                abjad.markups.MarkupCommand("rounded-box", ["{}".format(self.n_times)]),
+                abjad.markups.MarkupCommand("rounded-box", ["{}".format(n_times)]),
                 abjad.markups.MarkupCommand("hspace", -0.4),
                 abjad.markups.MarkupCommand(
                     "path",
                     0.25,
                     abjad.LilyPondLiteral(
-                        self._direction_to_ornamentation_command[self.direction]  # type: ignore
+                        Ornamentation._direction_to_ornamentation_command[direction]
                     ),
                 ),
             ],
             direction="up",
         )
 
+    def _make_markup(self) -> abjad.Markup:
+        return copy.copy(self._get_markup(self.n_times, self.direction))
+
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(self._make_markup(), leaf)
         return leaf
 
 
-@dataclasses.dataclass()
-class Dynamic(abjad_parameters.abc.ToggleAttachment):
+@_frozen_attachment_dataclass
+class Dynamic(abjad_parameters.abc.ToggleAttachment, register=True):
     dynamic_indicator: str = "mf"  # TODO(for future usage add typing.Literal)
 
     @classmethod
@@ -689,8 +840,8 @@ class Dynamic(abjad_parameters.abc.ToggleAttachment):
         return leaf
 
 
-@dataclasses.dataclass()
-class Tempo(abjad_parameters.abc.BangFirstAttachment):
+@_frozen_attachment_dataclass
+class Tempo(abjad_parameters.abc.BangFirstAttachment, register=True):
     reference_duration: typing.Optional[tuple[int, int]] = (1, 4)
     units_per_minute: typing.Union[int, tuple[int, int], None] = 60
     textual_indication: typing.Optional[str] = None
@@ -713,13 +864,30 @@ class Tempo(abjad_parameters.abc.BangFirstAttachment):
     def is_active(self) -> bool:
         return True
 
+    @staticmethod
+    @functools.lru_cache(maxsize=_PREBUILT_INDICATOR_CACHE_SIZE)
+    def _get_metronome_mark(
+        reference_duration: typing.Optional[tuple[int, int]],
+        units_per_minute: typing.Union[int, tuple[int, int], None],
+        textual_indication: typing.Optional[str],
+    ) -> abjad.MetronomeMark:
+        # Voices which share their tempos (see
+        # 'abjad_converters.AbjadTempoMap') copy the same metronome marks.
+        return abjad.MetronomeMark(
+            reference_duration=reference_duration,
+            units_per_minute=units_per_minute,
+            textual_indication=textual_indication,
+        )
+
     def _attach_metronome_mark(self, leaf: abjad.Leaf) -> None:
         if self.print_metronome_mark:
             abjad.attach(
-                abjad.MetronomeMark(
-                    reference_duration=self.reference_duration,
-                    units_per_minute=self.units_per_minute,
-                    textual_indication=self.textual_indication,
+                copy.copy(
+                    self._get_metronome_mark(
+                        self.reference_duration,
+                        self.units_per_minute,
+                        self.textual_indication,
+                    )
                 ),
                 leaf,
             )
@@ -736,7 +904,11 @@ class Tempo(abjad_parameters.abc.BangFirstAttachment):
         return leaf
 
 
-class DynamicChangeIndicationStop(abjad_parameters.abc.BangFirstAttachment):
+class DynamicChangeIndicationStop(
+    abjad_parameters.abc.BangFirstAttachment, register=True
+):
+    __slots__ = ()
+
     @classmethod
     def from_indicator_collection(
         cls, indicator_collection: music_parameters.abc.IndicatorCollection
@@ -756,7 +928,9 @@ class DynamicChangeIndicationStop(abjad_parameters.abc.BangFirstAttachment):
         return leaf
 
 
-class GraceNoteSequentialEvent(abjad_parameters.abc.BangFirstAttachment):
+class GraceNoteSequentialEvent(abjad_parameters.abc.BangFirstAttachment, register=True):
+    __slots__ = ("_grace_note_sequential_event",)
+
     def __init__(self, grace_note_sequential_event: abjad.BeforeGraceContainer):
         self._grace_note_sequential_event = grace_note_sequential_event
 
@@ -786,7 +960,11 @@ class GraceNoteSequentialEvent(abjad_parameters.abc.BangFirstAttachment):
         return leaf
 
 
-class AfterGraceNoteSequentialEvent(abjad_parameters.abc.BangLastAttachment):
+class AfterGraceNoteSequentialEvent(
+    abjad_parameters.abc.BangLastAttachment, register=True
+):
+    __slots__ = ("_after_grace_note_sequential_event",)
+
     def __init__(self, after_grace_note_sequential_event: abjad.AfterGraceContainer):
         self._after_grace_note_sequential_event = after_grace_note_sequential_event
 
@@ -807,13 +985,3 @@ class AfterGraceNoteSequentialEvent(abjad_parameters.abc.BangLastAttachment):
     def process_leaf(self, leaf: abjad.Leaf) -> LeafOrLeafSequence:
         abjad.attach(self._after_grace_note_sequential_event, leaf)
         return leaf
-
-
-# Auto define all due to many classes
-__all__ = tuple(
-    name
-    for name, cls in globals().items()
-    if inspect.isclass(cls)
-    and not inspect.isabstract(cls)
-    and abjad_parameters.abc.AbjadAttachment in inspect.getmro(cls)
-)
@@ -9,6 +9,25 @@ Some indicators have to be detached from the main note and added to the first
 grace note, otherwise the resulting notation will first print the grace notes
 and afterwards the indicator (which is ugly and looks buggy)."""
 
+ATTACHMENT_PLUGIN_ENTRY_POINT_GROUP = "mutwo.abjad_parameters.attachments"
+"""Entry point group of packages which provide additional abjad attachments.
+
+The modules or classes of all entry points in this group are loaded
+when :meth:`mutwo.abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple`
+is called the first time, so that their attachment classes which are defined
+with the class keyword ``register=True`` are registered. A plugin package can
+declare such an entry point in its ``setup.py``:
+
+    >>> setuptools.setup(
+    >>>     ...,
+    >>>     entry_points={
+    >>>         "mutwo.abjad_parameters.attachments": [
+    >>>             "my_attachments = my_package.attachments"
+    >>>         ]
+    >>>     },
+    >>> )
+"""
+
 
 # Cleanup
 del abjad
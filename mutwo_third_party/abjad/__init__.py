@@ -3,24 +3,21 @@
 __all__ = ("AbjadScoreListToLilyPondFile",)
 
 
+import functools
+
 import abjad
 
+WRITTEN_DURATION_TUPLE_CACHE_SIZE = 1024
+"""Maximum count of (duration, forbidden_duration, increase_monotonic)
+combinations which are memorized by the patched `LeafMaker._make_tied_leaf`."""
 
-# Monkey patch abjads LeafMaker '_make_tied_leaf`
-# in order to allow not-assignable duration and duration
-# with numerator > 1 for forbidden_duration
-def LeafMaker__make_tied_leaf(
-    class_,
-    duration,
-    increase_monotonic=None,
-    forbidden_duration=None,
-    multiplier=None,
-    pitches=None,
-    tag=None,
-    tie_parts=True,
-):
-    duration = abjad.Duration(duration)
 
+@functools.lru_cache(maxsize=WRITTEN_DURATION_TUPLE_CACHE_SIZE)
+def _make_written_duration_tuple(
+    duration: abjad.Duration,
+    forbidden_duration=None,
+    increase_monotonic=None,
+) -> tuple[abjad.Duration, ...]:
     # ###### MONKEY PATCH ##### #
     # if forbidden_duration is not None:
     #     assert forbidden_duration.is_assignable
@@ -58,10 +55,36 @@ def LeafMaker__make_tied_leaf(
     # reverse numerators if necessary
     if increase_monotonic:
         numerators = list(reversed(numerators))
+    return tuple(
+        abjad.Duration(numerator, duration.denominator) for numerator in numerators
+    )
+
+
+# Monkey patch abjads LeafMaker '_make_tied_leaf`
+# in order to allow not-assignable duration and duration
+# with numerator > 1 for forbidden_duration
+def LeafMaker__make_tied_leaf(
+    class_,
+    duration,
+    increase_monotonic=None,
+    forbidden_duration=None,
+    multiplier=None,
+    pitches=None,
+    tag=None,
+    tie_parts=True,
+):
+    # The partition of a duration into written durations only depends
+    # on 'duration', 'forbidden_duration' and 'increase_monotonic'.
+    # Because only few different combinations appear in one piece, the
+    # partition is memorized and we only need to create the leaves here.
+    written_duration_tuple = _make_written_duration_tuple(
+        abjad.Duration(duration),
+        forbidden_duration,
+        bool(increase_monotonic),
+    )
     # make one leaf per written duration
     result = []
-    for numerator in numerators:
-        written_duration = abjad.Duration(numerator, duration.denominator)
+    for written_duration in written_duration_tuple:
         if pitches is not None:
             arguments = (pitches, written_duration)
         else:
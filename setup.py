@@ -17,7 +17,9 @@ extras_require = {
         "coveralls",
         "pillow>=8.2.0, <9.0.0",
         "mutwo.ext-ekmelily>=0.6.2, <0.7.0",
-    ]
+        "cloudpickle>=2.0.0, <4.0.0",
+    ],
+    "daemons": ["cloudpickle>=2.0.0, <4.0.0"],
 }
 
 setuptools.setup(
@@ -46,6 +48,8 @@ setuptools.setup(
         # Abjad dependencies
         "abjad>=3.4.0, <3.5.0",
         "abjad-ext-nauert>=3.4.0, <3.5.0",
+        # Other dependencies
+        "numpy>=1.18.0, <2.00.0",
     ],
     extras_require=extras_require,
     python_requires=">=3.9, <4",
@@ -1,12 +1,27 @@
+import asyncio
+import concurrent.futures
+import copy
+import dataclasses
+import gc
+import importlib
+import importlib.metadata
+import multiprocessing
 import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
 import typing
 import unittest
+from unittest import mock
 
 from PIL import Image  # type: ignore
 from PIL import ImageChops  # type: ignore
 
 import abjad  # type: ignore
 import expenvelope  # type: ignore
+import numpy as np
 
 try:
     import quicktions as fractions  # type: ignore
@@ -14,6 +29,8 @@ except ImportError:
     import fractions  # type: ignore
 
 from mutwo import abjad_converters
+from mutwo.abjad_converters import daemons
+from mutwo.abjad_converters.events import building
 from mutwo import abjad_parameters
 from mutwo import core_events
 from mutwo import core_parameters
@@ -37,6 +54,389 @@ def run_if_ekmelily_is_available(method_to_wrap: typing.Callable):
     return test
 
 
+class LazyImportTest(unittest.TestCase):
+    def test_import_without_heavy_dependencies(self):
+        statement = (
+            "import sys; from mutwo import abjad_converters; "
+            "sys.exit(any(module_name in sys.modules for module_name in "
+            "('abjad', 'abjadext.nauert', 'expenvelope', 'ranges')))"
+        )
+        self.assertEqual(
+            subprocess.run(
+                [sys.executable, "-c", statement],
+                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            ).returncode,
+            0,
+        )
+
+    def test_attribute_name_tuple(self):
+        for package_name in ("events", "parameters"):
+            package = importlib.import_module(
+                f"mutwo.abjad_converters.{package_name}"
+            )
+            for (
+                module_name,
+                attribute_name_tuple,
+            ) in package._MODULE_NAME_TO_ATTRIBUTE_NAME_TUPLE_DICT.items():
+                module = importlib.import_module(
+                    f"mutwo.abjad_converters.{package_name}.{module_name}"
+                )
+                self.assertEqual(attribute_name_tuple, tuple(module.__all__))
+
+        for attribute_name in abjad_converters.__all__:
+            self.assertTrue(hasattr(abjad_converters, attribute_name))
+
+
+class LeafMakerMonkeyPatchTest(unittest.TestCase):
+    def test_make_written_duration_tuple(self):
+        from mutwo_third_party import abjad as abjad_patch
+
+        for duration, forbidden_duration, increase_monotonic, expected in (
+            (abjad.Duration(3, 8), None, False, (abjad.Duration(3, 8),)),
+            (
+                abjad.Duration(5, 8),
+                None,
+                False,
+                (abjad.Duration(4, 8), abjad.Duration(1, 8)),
+            ),
+            (
+                abjad.Duration(5, 8),
+                None,
+                True,
+                (abjad.Duration(1, 8), abjad.Duration(4, 8)),
+            ),
+            (
+                abjad.Duration(17, 1),
+                abjad.Duration(8, 1),
+                False,
+                (abjad.Duration(4, 1),) * 4 + (abjad.Duration(1, 1),),
+            ),
+        ):
+            self.assertEqual(
+                abjad_patch._make_written_duration_tuple(
+                    duration, forbidden_duration, increase_monotonic
+                ),
+                expected,
+            )
+
+    def test_make_tied_leaf(self):
+        leaf_selection = abjad.LeafMaker()([0], [abjad.Duration(5, 8)])
+        self.assertEqual(
+            [leaf.written_duration for leaf in leaf_selection],
+            [abjad.Duration(1, 2), abjad.Duration(1, 8)],
+        )
+        self.assertTrue(abjad.get.has_indicator(leaf_selection[0], abjad.Tie))
+
+
+class AbjadAttachmentRegistryTest(unittest.TestCase):
+    def tearDown(self):
+        abjad_parameters.abc.AbjadAttachment._class_name_to_attachment_class.pop(
+            "test_attachment", None
+        )
+
+    def test_get_registered_attachment_class_tuple(self):
+        attachment_class_tuple = (
+            abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple()
+        )
+        self.assertEqual(
+            attachment_class_tuple,
+            tuple(
+                sorted(
+                    (
+                        getattr(abjad_parameters, class_name)
+                        for class_name in importlib.import_module(
+                            "mutwo.abjad_parameters.attachments"
+                        ).__all__
+                    ),
+                    key=lambda attachment_class: attachment_class.__name__,
+                )
+            ),
+        )
+        self.assertEqual(
+            abjad_converters.configurations.DEFAULT_ABJAD_ATTACHMENT_CLASS_TUPLE,
+            attachment_class_tuple,
+        )
+
+    def test_register_subclass(self):
+        class TestAttachment(abjad_parameters.abc.BangEachAttachment):
+            is_active = True
+
+            def process_leaf(self, leaf):
+                return leaf
+
+        # Subclasses are only registered if they ask for it
+        self.assertNotIn(
+            TestAttachment,
+            abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple(),
+        )
+
+        class TestAttachment(TestAttachment, register=True):
+            pass
+
+        self.assertIn(
+            TestAttachment,
+            abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple(),
+        )
+        # Abstract classes aren't part of the returned classes
+        self.assertNotIn(
+            abjad_parameters.abc.BangEachAttachment,
+            abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple(),
+        )
+
+    def test_register_subclass_with_registered_name(self):
+        with self.assertRaises(ValueError):
+
+            class Dynamic(abjad_parameters.Dynamic, register=True):
+                pass
+
+        self.assertIn(
+            abjad_parameters.Dynamic,
+            abjad_parameters.abc.AbjadAttachment.get_registered_attachment_class_tuple(),
+        )
+
+    def test_load_plugins(self):
+        group = abjad_parameters.constants.ATTACHMENT_PLUGIN_ENTRY_POINT_GROUP
+        entry_point_list = [
+            importlib.metadata.EntryPoint(
+                name="working_plugin", value="my_package.attachments", group=group
+            ),
+            importlib.metadata.EntryPoint(
+                name="broken_plugin", value="not_existing_module", group=group
+            ),
+        ]
+        entry_points = mock.Mock()
+        entry_points.select.return_value = entry_point_list
+        with mock.patch("importlib.metadata.entry_points", return_value=entry_points):
+            with mock.patch.object(
+                importlib.metadata.EntryPoint, "load"
+            ) as load, self.assertWarns(Warning):
+                load.side_effect = [None, ImportError("test")]
+                abjad_parameters.abc.AbjadAttachment._load_plugins()
+        entry_points.select.assert_called_once_with(group=group)
+        self.assertEqual(load.call_count, 2)
+
+
+class AbjadAttachmentInternTest(unittest.TestCase):
+    def test_from_indicator_collection(self):
+        indicator_collection = music_parameters.PlayingIndicatorCollection()
+        indicator_collection.articulation.name = "."
+        articulation = abjad_parameters.Articulation.from_indicator_collection(
+            indicator_collection
+        )
+        self.assertIs(
+            articulation,
+            abjad_parameters.Articulation.from_indicator_collection(
+                indicator_collection
+            ),
+        )
+        with self.assertRaises(AttributeError):
+            articulation.name = ">"
+
+    def test_intern(self):
+        self.assertIs(
+            abjad_parameters.Tempo.intern(units_per_minute=60),
+            abjad_parameters.Tempo.intern(units_per_minute=60),
+        )
+        # Equal values of different types aren't shared
+        self.assertIsNot(
+            abjad_parameters.Tempo.intern(units_per_minute=60),
+            abjad_parameters.Tempo.intern(units_per_minute=60.0),
+        )
+        # Unhashable arguments can't be shared
+        tempo = abjad_parameters.Tempo.intern(reference_duration=[1, 4])
+        self.assertIsNot(
+            tempo, abjad_parameters.Tempo.intern(reference_duration=[1, 4])
+        )
+
+    def test_shared_attachment(self):
+        articulation = abjad_parameters.Articulation.intern(name=".")
+        self.assertIsInstance(articulation, abjad_parameters.Articulation)
+        self.assertEqual(articulation, abjad_parameters.Articulation(name="."))
+        self.assertEqual(abjad_parameters.Articulation(name="."), articulation)
+        self.assertNotEqual(articulation, abjad_parameters.Articulation(name=">"))
+        with self.assertRaises(AttributeError):
+            del articulation.name
+        # Copies can be changed again
+        for copied_articulation in (
+            copy.copy(articulation),
+            pickle.loads(pickle.dumps(articulation)),
+        ):
+            self.assertIs(type(copied_articulation), abjad_parameters.Articulation)
+            copied_articulation.name = ">"
+            self.assertEqual(copied_articulation.name, ">")
+        self.assertEqual(articulation.name, ".")
+        # Independent attachments can be changed
+        articulation = abjad_parameters.Articulation(name=".")
+        articulation.name = ">"
+        self.assertEqual(articulation.name, ">")
+
+    def test_frozen_dataclass(self):
+        dynamic = abjad_parameters.Dynamic("p")
+        with self.assertRaises(AttributeError):
+            dynamic.dynamic_indicator = "f"
+        self.assertEqual(hash(dynamic), hash(abjad_parameters.Dynamic("p")))
+        self.assertEqual(
+            dataclasses.replace(dynamic, dynamic_indicator="f"),
+            abjad_parameters.Dynamic("f"),
+        )
+
+
+class StringContactPointTest(unittest.TestCase):
+    def _convert(self, contact_point: str) -> str:
+        leaf = abjad.Note("c'4")
+        abjad_parameters.StringContactPoint(contact_point).process_leaf(leaf, None)
+        return abjad.lilypond(leaf)
+
+    def test_custom_string_contact_point(self):
+        self.assertIn("C.L.T.", self._convert("col legno tratto"))
+        self.assertIn("C.L.T.", self._convert("c.l.t."))
+        string_contact_point_class_data = (
+            abjad_parameters.StringContactPoint._get_string_contact_point_class_data()
+        )
+        self.assertIs(
+            string_contact_point_class_data[0],
+            abjad_parameters.StringContactPoint._get_string_contact_point_class_data()[
+                0
+            ],
+        )
+
+    def test_changed_configuration(self):
+        with mock.patch.dict(
+            abjad_parameters.configurations.CUSTOM_STRING_CONTACT_POINT_DICT,
+            {"ebow": "eb"},
+        ):
+            self.assertIn("Eb", self._convert("eb"))
+        with self.assertWarns(Warning):
+            self._convert("eb")
+
+
+class ProcessLeafTupleBatchTest(unittest.TestCase):
+    def test_toggle_attachment(self):
+        leaf_tuple_list = [(abjad.Note("c'4"),) for _ in range(3)]
+        dynamic_list = [
+            abjad_parameters.Dynamic.intern(dynamic_indicator=dynamic_indicator)
+            for dynamic_indicator in ("p", "p", "f")
+        ]
+        processed_leaf_tuple_list = list(
+            abjad_parameters.Dynamic.process_leaf_tuple_batch(
+                leaf_tuple_list, dynamic_list
+            )
+        )
+        # Unchanged dynamics don't touch their leaves
+        self.assertIs(processed_leaf_tuple_list[1], leaf_tuple_list[1])
+        self.assertEqual(
+            [
+                [
+                    indicator.name
+                    for indicator in abjad.get.indicators(leaf, abjad.Dynamic)
+                ]
+                for leaf, in processed_leaf_tuple_list
+            ],
+            [["p"], [], ["f"]],
+        )
+
+    def test_bang_first_attachment(self):
+        leaf_tuple_list = [(abjad.Note("c'4"), abjad.Note("d'4")), ()]
+        fermata = abjad_parameters.Fermata(fermata_type="fermata")
+        processed_leaf_tuple_list = list(
+            abjad_parameters.Fermata.process_leaf_tuple_batch(
+                leaf_tuple_list, [fermata, fermata]
+            )
+        )
+        self.assertEqual(processed_leaf_tuple_list[1], ())
+        first_leaf, second_leaf = processed_leaf_tuple_list[0]
+        self.assertTrue(abjad.get.indicators(first_leaf, abjad.Fermata))
+        self.assertFalse(abjad.get.indicators(second_leaf, abjad.Fermata))
+
+
+class LeafRewritePlanTest(unittest.TestCase):
+    def test_to_chord_without_plan(self):
+        note = abjad.Note("c'4")
+        abjad.attach(abjad.Fermata(), note)
+        chord = abjad_parameters.abc.LeafRewritePlan.to_chord(note, ["c'", "e'"])
+        self.assertTrue(abjad.get.indicators(chord, abjad.Fermata))
+
+    def test_to_chord_with_plan(self):
+        voice = abjad.Voice([abjad.Note("c'4")])
+        abjad.attach(abjad.Fermata(), voice[0])
+        with abjad_parameters.abc.LeafRewritePlan():
+            voice[0] = abjad_parameters.abc.LeafRewritePlan.to_chord(
+                voice[0], ["c'", "e'"]
+            )
+            # Indicators are only moved when the plan is applied
+            self.assertFalse(abjad.get.indicators(voice[0], abjad.Fermata))
+            self.assertEqual(
+                len(abjad_parameters.abc.LeafRewritePlan.get_indicator_list(voice[0])),
+                1,
+            )
+            abjad.attach(abjad.Articulation("."), voice[0])
+        self.assertEqual(
+            [type(indicator) for indicator in abjad.get.indicators(voice[0])],
+            [abjad.Fermata, abjad.Articulation],
+        )
+
+    def test_chained_to_chord_with_plan(self):
+        voice = abjad.Voice([abjad.Note("c'4")])
+        abjad.attach(abjad.Fermata(), voice[0])
+        with abjad_parameters.abc.LeafRewritePlan():
+            voice[0] = abjad_parameters.abc.LeafRewritePlan.to_chord(
+                voice[0], ["c'", "e'"]
+            )
+            abjad.attach(abjad.Articulation("."), voice[0])
+            voice[0] = abjad_parameters.abc.LeafRewritePlan.to_chord(
+                voice[0], ["c'", "g'"]
+            )
+            self.assertEqual(
+                len(abjad_parameters.abc.LeafRewritePlan.get_indicator_list(voice[0])),
+                2,
+            )
+        self.assertEqual(
+            [type(indicator) for indicator in abjad.get.indicators(voice[0])],
+            [abjad.Fermata, abjad.Articulation],
+        )
+
+    def test_artifical_harmonic_with_dynamic(self):
+        artifical_harmonic = abjad_parameters.ArtificalHarmonic(n_semitones=5)
+        note = abjad.Note("c'4")
+        abjad.attach(abjad.Dynamic("p"), note)
+        expected_lilypond_string = abjad.lilypond(artifical_harmonic.process_leaf(note))
+
+        voice = abjad.Voice([abjad.Note("c'4")])
+        abjad.attach(abjad.Dynamic("p"), voice[0])
+        with abjad_parameters.abc.LeafRewritePlan():
+            voice[0] = artifical_harmonic.process_leaf(voice[0])
+        self.assertEqual(abjad.lilypond(voice[0]), expected_lilypond_string)
+
+
+class PrebuiltIndicatorTest(unittest.TestCase):
+    def test_glissando(self):
+        leaf0, leaf1 = abjad.Note("c'4"), abjad.Note("d'4")
+        abjad_parameters.Glissando(True).process_leaf(leaf0)
+        abjad_parameters.Glissando(True).process_leaf(leaf1)
+        literal_list0, literal_list1 = (
+            abjad.get.indicators(leaf, abjad.LilyPondLiteral)
+            for leaf in (leaf0, leaf1)
+        )
+        self.assertEqual(len(literal_list0), 6)
+        for literal0, literal1 in zip(literal_list0, literal_list1):
+            self.assertEqual(literal0, literal1)
+            # Each leaf gets its own copy of the prebuilt literals
+            self.assertIsNot(literal0, literal1)
+        self.assertIn("\\glissando", abjad.lilypond(leaf0))
+
+    def test_ornamentation(self):
+        markup0, markup1 = (
+            abjad_parameters.Ornamentation(direction="up", n_times=2)._make_markup()
+            for _ in range(2)
+        )
+        self.assertEqual(markup0, markup1)
+        self.assertIsNot(markup0, markup1)
+        self.assertNotEqual(
+            abjad_parameters.Ornamentation(direction="up", n_times=2)._make_markup(),
+            abjad_parameters.Ornamentation(direction="down", n_times=2)._make_markup(),
+        )
+
+
 class MutwoPitchToAbjadPitchTest(unittest.TestCase):
     def test_convert(self):
         converter = abjad_converters.MutwoPitchToAbjadPitch()
@@ -64,6 +464,63 @@ class MutwoPitchToAbjadPitchTest(unittest.TestCase):
         ):
             self.assertEqual(converter.convert(mutwo_pitch), expected_abajd_pitch)
 
+    def test_convert_with_cache(self):
+        converter = abjad_converters.MutwoPitchToAbjadPitch(cache_size=2)
+        pitch0, pitch1, pitch2 = (
+            music_parameters.WesternPitch("ds", 4),
+            music_parameters.JustIntonationPitch("3/2", concert_pitch=262),
+            music_parameters.JustIntonationPitch("5/4", concert_pitch=262),
+        )
+        abjad_pitch0 = converter.convert(pitch0)
+        self.assertEqual(abjad_pitch0, abjad.NamedPitch("ds'"))
+        self.assertIs(
+            converter.convert(music_parameters.WesternPitch("ds", 4)), abjad_pitch0
+        )
+        self.assertEqual(converter.convert(pitch1), abjad.NumberedPitch(7))
+        self.assertIs(converter.convert(pitch0), abjad_pitch0)
+        # pitch1 is the least recently used pitch and will be forgotten
+        self.assertEqual(converter.convert(pitch2), abjad.NumberedPitch(4))
+        self.assertEqual(len(converter._cache), 2)
+        self.assertIs(converter.convert(pitch0), abjad_pitch0)
+        converter.clear_cache()
+        self.assertEqual(len(converter._cache), 0)
+
+    def test_convert_many(self):
+        converter = abjad_converters.MutwoPitchToAbjadPitch(cache_size=10)
+        pitch_list = [
+            music_parameters.WesternPitch("ds", 4),
+            music_parameters.JustIntonationPitch("3/2", concert_pitch=262),
+            music_parameters.DirectPitch(440),
+            music_parameters.DirectPitch(452),
+            music_parameters.DirectPitch(20),
+            music_parameters.WesternPitch("ds", 4),
+            music_parameters.JustIntonationPitch("3/2", concert_pitch=262),
+        ]
+        abjad_pitch_tuple = converter.convert_many(pitch_list)
+        self.assertEqual(
+            abjad_pitch_tuple,
+            tuple(
+                abjad_converters.MutwoPitchToAbjadPitch().convert(pitch)
+                for pitch in pitch_list
+            ),
+        )
+        self.assertIs(abjad_pitch_tuple[0], abjad_pitch_tuple[5])
+        self.assertEqual(len(converter._cache), 5)
+        self.assertIs(
+            converter.convert(music_parameters.DirectPitch(440)), abjad_pitch_tuple[2]
+        )
+        self.assertEqual(converter.convert_many([]), tuple([]))
+
+    def test_convert_many_with_overridden_convert(self):
+        class TransposingConverter(abjad_converters.MutwoPitchToAbjadPitch):
+            def convert(self, pitch_to_convert):
+                return super().convert(pitch_to_convert).transpose(12)
+
+        self.assertEqual(
+            TransposingConverter().convert_many([music_parameters.DirectPitch(440)]),
+            (abjad.NamedPitch("a''"),),
+        )
+
 
 class MutwoPitchToHEJIAbjadPitchTest(unittest.TestCase):
     @run_if_ekmelily_is_available
@@ -94,6 +551,55 @@ class MutwoPitchToHEJIAbjadPitchTest(unittest.TestCase):
             )
 
 
+    @run_if_ekmelily_is_available
+    def test_convert_with_cache(self):
+        converter = abjad_converters.MutwoPitchToHEJIAbjadPitch(reference_pitch="c")
+        abjad_pitch = converter.convert(music_parameters.JustIntonationPitch("7/4"))
+        self.assertEqual(abjad.lilypond(abjad_pitch), "bfoba'")
+        self.assertIs(
+            converter.convert(music_parameters.JustIntonationPitch("7/4")),
+            abjad_pitch,
+        )
+        # different octave
+        self.assertEqual(
+            abjad.lilypond(
+                converter.convert(music_parameters.JustIntonationPitch("7/8"))
+            ),
+            "bfoba",
+        )
+
+    @run_if_ekmelily_is_available
+    def test_convert_without_cache(self):
+        converter = abjad_converters.MutwoPitchToHEJIAbjadPitch(
+            reference_pitch="c", cache_size=None
+        )
+        for _ in range(2):
+            self.assertEqual(
+                abjad.lilypond(
+                    converter.convert(music_parameters.JustIntonationPitch("12/7"))
+                ),
+                "auba'",
+            )
+
+    @run_if_ekmelily_is_available
+    def test_convert_many(self):
+        converter = abjad_converters.MutwoPitchToHEJIAbjadPitch(reference_pitch="c")
+        self.assertEqual(
+            tuple(
+                abjad.lilypond(abjad_pitch)
+                for abjad_pitch in converter.convert_many(
+                    [
+                        music_parameters.JustIntonationPitch("7/4"),
+                        music_parameters.WesternPitch("ds", 4),
+                        music_parameters.JustIntonationPitch("12/7"),
+                        music_parameters.JustIntonationPitch("7/4"),
+                    ]
+                )
+            ),
+            ("bfoba'", "ds'", "auba'", "bfoba'"),
+        )
+
+
 class MutwoVolumeToAbjadAttachmentDynamicTest(unittest.TestCase):
     def test_convert(self):
         converter = abjad_converters.MutwoVolumeToAbjadAttachmentDynamic()
@@ -112,6 +618,37 @@ class MutwoVolumeToAbjadAttachmentDynamicTest(unittest.TestCase):
                 expected_abjad_parameter,
             )
 
+    def test_convert_amplitude(self):
+        converter = abjad_converters.MutwoVolumeToAbjadAttachmentDynamic()
+        for amplitude in (0.0001, 0.01, 0.05, 0.2, 0.5, 1, 2):
+            self.assertEqual(
+                converter.convert(music_parameters.DirectVolume(amplitude)),
+                abjad_parameters.Dynamic(
+                    music_parameters.WesternVolume.from_amplitude(amplitude).name
+                ),
+            )
+        self.assertEqual(converter.convert(music_parameters.DirectVolume(0)), None)
+        self.assertIs(
+            converter.convert(music_parameters.DirectVolume(0.05)),
+            converter.convert(
+                music_parameters.WesternVolume.from_amplitude(0.05)
+            ),
+        )
+
+    def test_convert_amplitude_array(self):
+        converter = abjad_converters.MutwoVolumeToAbjadAttachmentDynamic()
+        amplitude_array = np.array([0.05, 0, 0.2, 0.05, 1])
+        dynamic_tuple = converter.convert_amplitude_array(amplitude_array)
+        self.assertEqual(
+            dynamic_tuple,
+            tuple(
+                converter.convert(music_parameters.DirectVolume(amplitude))
+                for amplitude in amplitude_array
+            ),
+        )
+        self.assertIs(dynamic_tuple[0], dynamic_tuple[3])
+        self.assertEqual(dynamic_tuple[1], None)
+
 
 class MutwoLyricToAbjadStringTest(unittest.TestCase):
     def setUp(self):
@@ -145,6 +682,114 @@ class MutwoLyricToAbjadStringTest(unittest.TestCase):
         )
 
 
+class AbjadConversionDaemonTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.daemon = abjad_converters.AbjadConversionDaemon(
+            os.path.join(self.directory.name, "daemon.socket"),
+            {
+                "pitch": abjad_converters.MutwoPitchToAbjadPitch,
+                "lyric": "mutwo.abjad_converters:MutwoLyricToAbjadString",
+            },
+            n_workers=2,
+            maximum_in_flight_job_count=2,
+            maximum_job_count_per_worker=1,
+        ).start()
+
+    def tearDown(self):
+        self.daemon.stop()
+        self.directory.cleanup()
+
+    def test_convert(self):
+        with abjad_converters.AbjadConversionClient(self.daemon.address) as client:
+            # Workers are replaced after each job
+            for _ in range(3):
+                self.assertEqual(
+                    client.convert(music_parameters.WesternPitch("a", 4), "pitch"),
+                    "a'",
+                )
+            self.assertEqual(
+                client.convert(music_parameters.DirectLyric("hello"), "lyric"),
+                "hello",
+            )
+
+    def test_convert_concurrently(self):
+        def convert(pitch_name: str) -> str:
+            with abjad_converters.AbjadConversionClient(
+                self.daemon.address
+            ) as client:
+                return client.convert(
+                    music_parameters.WesternPitch(pitch_name, 4), "pitch"
+                )
+
+        pitch_name_tuple = ("c", "d", "e", "f", "g", "a", "b")
+        with concurrent.futures.ThreadPoolExecutor(len(pitch_name_tuple)) as executor:
+            self.assertEqual(
+                tuple(executor.map(convert, pitch_name_tuple)),
+                tuple(f"{pitch_name}'" for pitch_name in pitch_name_tuple),
+            )
+
+    def test_socket_permissions(self):
+        self.assertEqual(os.stat(self.daemon.address).st_mode & 0o777, 0o600)
+
+    def test_only_loopback_addresses(self):
+        for host in ("127.0.0.1", "localhost"):
+            abjad_converters.AbjadConversionDaemon((host, 0), authkey=b"key")
+        with self.assertRaises(ValueError):
+            abjad_converters.AbjadConversionDaemon(("0.0.0.0", 0), authkey=b"key")
+        # All local users can connect to TCP sockets
+        with self.assertRaises(ValueError):
+            abjad_converters.AbjadConversionDaemon(("127.0.0.1", 0))
+        with self.assertRaises(ValueError):
+            abjad_converters.AbjadConversionClient(("127.0.0.1", 0))
+
+    def test_authentication(self):
+        with abjad_converters.AbjadConversionDaemon(
+            ("127.0.0.1", 0),
+            {"lyric": abjad_converters.MutwoLyricToAbjadString},
+            n_workers=1,
+            authkey=b"key",
+        ) as daemon:
+            with abjad_converters.AbjadConversionClient(
+                daemon.address, authkey=b"key"
+            ) as client:
+                self.assertEqual(
+                    client.convert(music_parameters.DirectLyric("hello"), "lyric"),
+                    "hello",
+                )
+            with abjad_converters.AbjadConversionClient(
+                daemon.address, authkey=b"wrong key"
+            ) as client:
+                with self.assertRaises(multiprocessing.AuthenticationError):
+                    client.convert(music_parameters.DirectLyric("hello"), "lyric")
+
+    def test_maximum_request_size(self):
+        with abjad_converters.AbjadConversionDaemon(
+            os.path.join(self.directory.name, "small.socket"),
+            {"lyric": abjad_converters.MutwoLyricToAbjadString},
+            n_workers=1,
+            maximum_request_size=1000,
+        ) as daemon:
+            with abjad_converters.AbjadConversionClient(daemon.address) as client:
+                with self.assertRaises(daemons.ConversionDaemonError):
+                    client.convert(music_parameters.DirectLyric("a" * 2000), "lyric")
+                # The connection can still be used after an error
+                self.assertEqual(
+                    client.convert(music_parameters.DirectLyric("hello"), "lyric"),
+                    "hello",
+                )
+
+    def test_convert_with_unknown_converter(self):
+        with abjad_converters.AbjadConversionClient(self.daemon.address) as client:
+            with self.assertRaises(daemons.ConversionDaemonError):
+                client.convert(music_parameters.DirectLyric("hello"), "voice")
+            # The connection can still be used after an error
+            self.assertEqual(
+                client.convert(music_parameters.DirectLyric("hello"), "lyric"),
+                "hello",
+            )
+
+
 class ComplexTempoEnvelopeToAbjadAttachmentTempoTest(unittest.TestCase):
     def test_convert_tempo_point_tuple(self):
         self.assertEqual(
@@ -367,6 +1012,42 @@ class ComplexTempoEnvelopeToAbjadAttachmentTempoTest(unittest.TestCase):
                 current_tempo_attachment,
             )
 
+    def test_convert(self):
+        # 'convert' returns the same tempos as '_process_tempo_event'
+        # applied on each tempo point with the previous tempos.
+        converter = abjad_converters.ComplexTempoEnvelopeToAbjadAttachmentTempo
+        tempo_envelope_to_convert = expenvelope.Envelope.from_levels_and_durations(
+            levels=[
+                core_parameters.TempoPoint(bpm)
+                for bpm in (120, 120, 110, 120, 110, 120, 110, 100, 100, 60)
+            ],
+            durations=[2, 2, 2, 2, 0, 2, 0, 1, 1],
+        )
+        tempo_point_tuple = tuple(tempo_envelope_to_convert.levels)
+        expected_tempo_attachment_list = []
+        for tempo_point_index, absolute_time, duration in zip(
+            range(len(tempo_point_tuple)),
+            (0, 2, 4, 6, 8, 8, 10, 10, 11, 12),
+            tuple(tempo_envelope_to_convert.durations) + (1,),
+        ):
+            if duration > 0:
+                expected_tempo_attachment_list.append(
+                    (
+                        absolute_time,
+                        converter._process_tempo_event(
+                            tempo_envelope_to_convert,
+                            tempo_point_index,
+                            tempo_point_tuple[tempo_point_index],
+                            tempo_point_tuple,
+                            tuple(expected_tempo_attachment_list),
+                        ),
+                    )
+                )
+        self.assertEqual(
+            converter().convert(tempo_envelope_to_convert),
+            tuple(expected_tempo_attachment_list),
+        )
+
 
 class SequentialEventToAbjadVoiceTest(unittest.TestCase):
     @staticmethod
@@ -474,6 +1155,475 @@ class SequentialEventToAbjadVoiceTest(unittest.TestCase):
             SequentialEventToAbjadVoiceTest._make_complex_sequential_event()
         )
 
+    def test_default_arguments_are_not_shared(self):
+        converter0, converter1 = (
+            abjad_converters.SequentialEventToAbjadVoice() for _ in range(2)
+        )
+        for attribute_name in (
+            "_sequential_event_to_quantized_abjad_container",
+            "_simple_event_to_pitch_list",
+            "_mutwo_pitch_to_abjad_pitch",
+            "_mutwo_volume_to_abjad_attachment_dynamic",
+        ):
+            self.assertIsNot(
+                getattr(converter0, attribute_name),
+                getattr(converter1, attribute_name),
+            )
+
+    def test_disable_dynamics_and_tempos(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            mutwo_volume_to_abjad_attachment_dynamic=None,
+            tempo_envelope_to_abjad_attachment_tempo=None,
+        )
+        self.assertEqual(converter._mutwo_volume_to_abjad_attachment_dynamic, None)
+        self.assertEqual(converter._tempo_attachment_tuple, None)
+
+    def test_tempo_map(self):
+        tempo_envelope = expenvelope.Envelope.from_levels_and_durations(
+            levels=[60, 60, 40], durations=[2, 2]
+        )
+        tempo_map = abjad_converters.AbjadTempoMap(tempo_envelope)
+        converter_list = [
+            abjad_converters.SequentialEventToAbjadVoice(
+                abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(
+                    tempo_envelope=tempo_envelope
+                ),
+                tempo_map=tempo_map,
+            )
+            for _ in range(2)
+        ]
+        for converter in converter_list:
+            self.assertIs(
+                converter._tempo_attachment_tuple, tempo_map.tempo_attachment_tuple
+            )
+        sequential_event = core_events.SequentialEvent(
+            [music_events.NoteLike("c", 2), music_events.NoteLike("d", 2)]
+        )
+        voice0, voice1 = (
+            converter.convert(sequential_event) for converter in converter_list
+        )
+        # Same result as without a tempo map
+        self.assertEqual(
+            abjad.lilypond(voice0),
+            abjad.lilypond(
+                abjad_converters.SequentialEventToAbjadVoice(
+                    abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(
+                        tempo_envelope=tempo_envelope
+                    )
+                ).convert(sequential_event)
+            ),
+        )
+        # Both voices get equal, but independent metronome marks
+        metronome_mark_list0, metronome_mark_list1 = (
+            [
+                metronome_mark
+                for leaf in abjad.select(voice).leaves()
+                for metronome_mark in abjad.get.indicators(leaf, abjad.MetronomeMark)
+            ]
+            for voice in (voice0, voice1)
+        )
+        self.assertEqual(len(metronome_mark_list0), 2)
+        for metronome_mark0, metronome_mark1 in zip(
+            metronome_mark_list0, metronome_mark_list1
+        ):
+            self.assertEqual(metronome_mark0, metronome_mark1)
+            self.assertIsNot(metronome_mark0, metronome_mark1)
+
+    def test_tempo_map_with_invalid_arguments(self):
+        tempo_envelope = expenvelope.Envelope.from_levels_and_durations(
+            levels=[60, 60, 40], durations=[2, 2]
+        )
+        tempo_map = abjad_converters.AbjadTempoMap(tempo_envelope)
+        # Equal tempo envelopes are fine
+        abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(
+                tempo_envelope=expenvelope.Envelope.from_levels_and_durations(
+                    levels=[60, 60, 40], durations=[2, 2]
+                )
+            ),
+            tempo_map=tempo_map,
+        )
+        # The tempo map doesn't fit to the quantizer
+        with self.assertRaises(ValueError):
+            abjad_converters.SequentialEventToAbjadVoice(
+                abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+                tempo_map=tempo_map,
+            )
+        # The tempo converter would be ignored
+        for tempo_envelope_to_abjad_attachment_tempo in (
+            abjad_converters.ComplexTempoEnvelopeToAbjadAttachmentTempo(),
+            None,
+        ):
+            with self.assertRaises(ValueError):
+                abjad_converters.SequentialEventToAbjadVoice(
+                    abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(
+                        tempo_envelope=tempo_envelope
+                    ),
+                    tempo_envelope_to_abjad_attachment_tempo=tempo_envelope_to_abjad_attachment_tempo,
+                    tempo_map=tempo_map,
+                )
+
+    def test_convert_many(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event_list = [
+            core_events.SequentialEvent(
+                [music_events.NoteLike("c", 0.75), music_events.NoteLike("a", 0.25)]
+            ),
+            # Negative durations can't be converted
+            core_events.SequentialEvent([music_events.NoteLike("c", -1)]),
+            core_events.SequentialEvent(
+                [music_events.NoteLike([], 0.5), music_events.NoteLike("d", 1.5)]
+            ),
+        ]
+        for n_workers in (1, 2):
+            converted_tuple = tuple(
+                converter.convert_many(sequential_event_list, n_workers=n_workers)
+            )
+            self.assertEqual(len(converted_tuple), 3)
+            self.assertIsInstance(converted_tuple[1], Exception)
+            for sequential_event, converted in zip(
+                sequential_event_list[::2], converted_tuple[::2]
+            ):
+                self.assertEqual(
+                    abjad.lilypond(converted),
+                    abjad.lilypond(converter.convert(sequential_event)),
+                )
+
+    def test_convert_many_multiprocessing_context(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event_list = [
+            core_events.SequentialEvent([music_events.NoteLike(pitch, 1)])
+            for pitch in "c d".split()
+        ]
+        multiprocessing_context_list = []
+
+        def make_executor(n_workers, mp_context, **kwargs):
+            multiprocessing_context_list.append(mp_context)
+            return concurrent.futures.ThreadPoolExecutor(n_workers, **kwargs)
+
+        spawn_context = multiprocessing.get_context("spawn")
+        with mock.patch.object(
+            concurrent.futures, "ProcessPoolExecutor", side_effect=make_executor
+        ):
+            for platform, multiprocessing_context in (
+                ("linux", None),
+                ("darwin", None),
+                ("linux", spawn_context),
+            ):
+                with mock.patch.object(building.sys, "platform", platform):
+                    self.assertEqual(
+                        len(
+                            tuple(
+                                converter.convert_many(
+                                    sequential_event_list,
+                                    n_workers=2,
+                                    multiprocessing_context=multiprocessing_context,
+                                )
+                            )
+                        ),
+                        2,
+                    )
+        self.assertEqual(multiprocessing_context_list[0].get_start_method(), "fork")
+        # Forking isn't safe on macOS
+        self.assertIs(multiprocessing_context_list[1], multiprocessing.get_context())
+        self.assertIs(multiprocessing_context_list[2], spawn_context)
+
+    def test_convert_many_with_spawned_workers(self):
+        # Converters with default arguments can be sent to
+        # worker processes which aren't forked.
+        pickle.loads(pickle.dumps(abjad_converters.SequentialEventToAbjadVoice()))
+
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event_list = [
+            core_events.SequentialEvent([music_events.NoteLike([], duration)])
+            for duration in (1, 2, 0.5)
+        ]
+        self.assertEqual(
+            [
+                abjad.lilypond(abjad_voice)
+                for abjad_voice in converter.convert_many(
+                    sequential_event_list,
+                    n_workers=2,
+                    multiprocessing_context=multiprocessing.get_context("spawn"),
+                )
+            ],
+            [
+                abjad.lilypond(converter.convert(sequential_event))
+                for sequential_event in sequential_event_list
+            ],
+        )
+
+    def test_convert_many_with_unpicklable_converter(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+            complex_event_to_abjad_container_name=lambda _: "voice",
+        )
+        sequential_event_list = [
+            core_events.SequentialEvent([music_events.NoteLike([], 1)])
+        ] * 2
+        with mock.patch.object(
+            building, "_dumps_for_worker", pickle.dumps
+        ), self.assertWarns(Warning):
+            # Events are converted in the current process instead
+            abjad_voice_list = list(
+                converter.convert_many(
+                    sequential_event_list,
+                    n_workers=2,
+                    multiprocessing_context=multiprocessing.get_context("spawn"),
+                )
+            )
+        self.assertEqual(
+            [abjad_voice.name for abjad_voice in abjad_voice_list], ["voice", "voice"]
+        )
+
+    def test_result_cache(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+            cache_size=2,
+        )
+        sequential_event_tuple = tuple(
+            core_events.SequentialEvent(
+                [music_events.NoteLike(pitch, 0.75), music_events.NoteLike([], 0.25)]
+            )
+            for pitch in "c d e".split()
+        )
+        abjad_voice = converter.convert(sequential_event_tuple[0])
+        # Equal, but not identical events share the same cache entry
+        cached_abjad_voice = converter.convert(sequential_event_tuple[0].copy())
+        self.assertIsNot(abjad_voice, cached_abjad_voice)
+        self.assertEqual(
+            abjad.lilypond(abjad_voice), abjad.lilypond(cached_abjad_voice)
+        )
+        self.assertEqual(converter.cache_info[:3], (1, 1, 1))
+
+        # Changing the returned voice doesn't change the cache
+        abjad.mutate.transpose(cached_abjad_voice, 12)
+        self.assertEqual(
+            abjad.lilypond(converter.convert(sequential_event_tuple[0])),
+            abjad.lilypond(abjad_voice),
+        )
+
+        # Least recently used voices are forgotten
+        for sequential_event in sequential_event_tuple:
+            converter.convert(sequential_event)
+        self.assertEqual(converter.cache_info[:3], (3, 3, 2))
+
+        # Pitches which only differ in their concert pitch aren't mixed up
+        for concert_pitch in (440, 442):
+            sequential_event_tuple[0][0].pitch_list = [
+                music_parameters.WesternPitch("c", concert_pitch=concert_pitch)
+            ]
+            converter.convert(sequential_event_tuple[0])
+        self.assertEqual(converter.cache_info[:3], (3, 5, 2))
+
+        # A new configuration invalidates all results
+        converter._write_multimeasure_rests = False
+        converter.convert(sequential_event_tuple[0])
+        self.assertEqual(converter.cache_info[:3], (3, 6, 1))
+
+        converter.clear_cache()
+        self.assertEqual(converter.cache_info, (0, 0, 0, 0))
+        self.assertIsNone(abjad_converters.SequentialEventToAbjadVoice().cache_info)
+
+    def test_result_cache_with_functions(self):
+        # Functions are identified by their id: a new function must not
+        # get the id (and therefore the cached voice) of a freed function.
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+            simple_event_to_pitch_list=lambda simple_event: [simple_event.get_pitch()],
+            cache_size=2,
+        )
+
+        def make_sequential_event(pitch_name: str) -> core_events.SequentialEvent:
+            simple_event = music_events.NoteLike([], 1)
+            simple_event.get_pitch = lambda: music_parameters.WesternPitch(pitch_name)
+            return core_events.SequentialEvent([simple_event])
+
+        for pitch_name in "c d e".split():
+            sequential_event = make_sequential_event(pitch_name)
+            abjad_voice = converter.convert(sequential_event)
+            self.assertIn(f"{pitch_name}'1", abjad.lilypond(abjad_voice))
+            del sequential_event
+            gc.collect()
+        self.assertEqual(converter.cache_info[:2], (0, 3))
+
+    def test_result_cache_memory_limit(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+            cache_memory_limit=1,
+        )
+        converter.convert(core_events.SequentialEvent([music_events.NoteLike("c")]))
+        # The voice is bigger than the complete cache
+        self.assertEqual(converter.cache_info, (0, 1, 0, 0))
+
+    def test_convert_bar_wise(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event = core_events.SequentialEvent(
+            [
+                music_events.NoteLike(pitch, duration)
+                for pitch, duration in zip(
+                    "c d e f g a".split(), (0.75, 0.5, 0.5, 0.25, 1, 0.5)
+                )
+            ]
+        )
+        for nth_event, simple_event in enumerate(sequential_event):
+            simple_event.lyric = music_parameters.DirectLyric(f"la{nth_event}")
+        sequential_event[1].playing_indicator_collection.articulation.name = "."
+
+        abjad_voice = converter.convert(sequential_event)
+        bar_list = list(converter.convert_bar_wise(iter(sequential_event)))
+        self.assertEqual(
+            [abjad.lilypond(bar) for bar in bar_list],
+            [abjad.lilypond(bar) for bar in abjad_voice],
+        )
+        self.assertEqual(
+            list(converter.convert_bar_wise(sequential_event, to_lilypond=True)),
+            [abjad.lilypond(bar) for bar in abjad_voice],
+        )
+        self.assertEqual(
+            [abjad.get.annotation(bar, "lyric_content") for bar in bar_list],
+            ["la0 la1", "la2 la3", "la4", "la5"],
+        )
+
+    def test_convert_bar_wise_with_rests_across_bar_lines(self):
+        # Consecutive rests are merged, even if one of them ends at a bar line
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event = core_events.SequentialEvent(
+            [
+                music_events.NoteLike(pitch_list, duration)
+                for pitch_list, duration in (
+                    ("c", 3),
+                    ([], 1),
+                    ([], 4),
+                    ([], 2),
+                    ("d", 2),
+                    ([], 4),
+                )
+            ]
+        )
+        sequential_event[1].playing_indicator_collection.articulation.name = "."
+        self.assertEqual(
+            list(converter.convert_bar_wise(iter(sequential_event), to_lilypond=True)),
+            [abjad.lilypond(bar) for bar in converter.convert(sequential_event)],
+        )
+
+    def test_convert_bar_wise_with_event_across_bar_line(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event = core_events.SequentialEvent(
+            [
+                music_events.NoteLike(pitch, duration)
+                for pitch, duration in zip("c d e f".split(), (0.75, 0.5, 0.75, 1))
+            ]
+        )
+        n_consumed_events_list = []
+
+        def get_simple_event_generator():
+            for simple_event in sequential_event:
+                n_consumed_events_list.append(None)
+                yield simple_event
+
+        bar_iterator = converter.convert_bar_wise(get_simple_event_generator())
+        # 'd' is tied across the first bar line, so the first bar is only
+        # yielded when 'e' ends at the second bar line.
+        first_bar = next(bar_iterator)
+        self.assertEqual(len(n_consumed_events_list), 3)
+        self.assertEqual(
+            [abjad.lilypond(bar) for bar in (first_bar, *bar_iterator)],
+            [abjad.lilypond(bar) for bar in converter.convert(sequential_event)],
+        )
+
+    def test_aconvert(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event_tuple = tuple(
+            core_events.SequentialEvent(
+                [music_events.NoteLike(pitch, 0.75), music_events.NoteLike([], 0.25)]
+            )
+            for pitch in "c d e".split()
+        )
+
+        async def convert():
+            semaphore = asyncio.Semaphore(1)
+            with concurrent.futures.ThreadPoolExecutor(2) as executor:
+                return await asyncio.gather(
+                    *(
+                        converter.aconvert(sequential_event, executor, semaphore)
+                        for sequential_event in sequential_event_tuple
+                    )
+                )
+
+        for abjad_voice, sequential_event in zip(
+            asyncio.run(convert()), sequential_event_tuple
+        ):
+            self.assertEqual(
+                abjad.lilypond(abjad_voice),
+                abjad.lilypond(converter.convert(sequential_event)),
+            )
+
+    def test_aconvert_in_many_event_loops(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event = core_events.SequentialEvent([music_events.NoteLike("c", 1)])
+
+        async def convert():
+            # Both conversions wait for the lock of the converter
+            return await asyncio.gather(
+                converter.aconvert(sequential_event),
+                converter.aconvert(sequential_event),
+            )
+
+        for _ in range(2):
+            self.assertEqual(
+                [abjad.lilypond(abjad_voice) for abjad_voice in asyncio.run(convert())],
+                [abjad.lilypond(converter.convert(sequential_event))] * 2,
+            )
+
+    def test_aconvert_cancellation(self):
+        is_pre_processing = threading.Event()
+        can_finish_pre_processing = threading.Event()
+        post_process_routine = mock.Mock()
+
+        def pre_process_routine(*_):
+            is_pre_processing.set()
+            can_finish_pre_processing.wait()
+
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+            pre_process_abjad_container_routine_sequence=(pre_process_routine,),
+            post_process_abjad_container_routine_sequence=(post_process_routine,),
+        )
+
+        async def cancel():
+            task = asyncio.create_task(
+                converter.aconvert(
+                    core_events.SequentialEvent([music_events.NoteLike("c", 1)])
+                )
+            )
+            await asyncio.get_running_loop().run_in_executor(
+                None, is_pre_processing.wait
+            )
+            task.cancel()
+            can_finish_pre_processing.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+        post_process_routine.assert_not_called()
+
     def test_convert(self):
         # TODO(improve readability of conversion method!)
         expected_abjad_voice = abjad.Voice(
@@ -646,6 +1796,95 @@ class SequentialEventToAbjadVoiceTest(unittest.TestCase):
         # remove test file
         os.remove(new_png_file_path)
 
+    def test_grace_note_converters_are_reused(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        sequential_event_to_convert = core_events.SequentialEvent(
+            [
+                music_events.NoteLike(
+                    pitch,
+                    1,
+                    grace_note_sequential_event=core_events.SequentialEvent(
+                        [music_events.NoteLike("d", 0.125)]
+                    ),
+                    after_grace_note_sequential_event=core_events.SequentialEvent(
+                        [music_events.NoteLike("e", 0.125)]
+                    ),
+                )
+                for pitch in "c f g".split()
+            ]
+        )
+        with mock.patch.object(
+            building,
+            "_GraceNotesToAbjadVoiceConverter",
+            wraps=building._GraceNotesToAbjadVoiceConverter,
+        ) as grace_notes_converter_class:
+            abjad_voice = converter.convert(sequential_event_to_convert)
+            converter.convert(sequential_event_to_convert)
+        # One converter for grace notes and one for after grace notes
+        self.assertEqual(grace_notes_converter_class.call_count, 2)
+        self.assertEqual(
+            len(abjad.select(abjad_voice).components(abjad.BeforeGraceContainer)), 3
+        )
+        self.assertEqual(
+            len(abjad.select(abjad_voice).components(abjad.AfterGraceContainer)), 3
+        )
+
+    def test_grace_note_chords_and_rests(self):
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        note_like = music_events.NoteLike(
+            "c",
+            1,
+            grace_note_sequential_event=core_events.SequentialEvent(
+                [
+                    music_events.NoteLike(["d", "f"], 0.125),
+                    music_events.NoteLike([], 0.0625),
+                    music_events.NoteLike([], 0.0625),
+                    music_events.NoteLike("e", 0.125),
+                ]
+            ),
+        )
+        note_like.grace_note_sequential_event[
+            0
+        ].playing_indicator_collection.articulation.name = "."
+        # Rests are tied and written as notes
+        self.assertEqual(
+            abjad.lilypond(
+                abjad.select(
+                    converter.convert(core_events.SequentialEvent([note_like]))
+                ).components(abjad.BeforeGraceContainer)[0]
+            ),
+            "\\grace {\n    <d' f'>8\n    - \\staccato\n    c8\n    e'8\n}",
+        )
+
+    def test_custom_pitch_converter(self):
+        # Custom pitch converters don't need to provide 'convert_many'
+        class OctaveDownConverter(object):
+            def convert(self, pitch_to_convert):
+                return abjad.NamedPitch(pitch_to_convert.name).transpose(-12)
+
+        converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+            mutwo_pitch_to_abjad_pitch=OctaveDownConverter(),
+        )
+        note_like = music_events.NoteLike(
+            ["c", "e"],
+            1,
+            grace_note_sequential_event=core_events.SequentialEvent(
+                [music_events.NoteLike("d", 0.125)]
+            ),
+        )
+        grace_note, chord = abjad.select(
+            converter.convert(core_events.SequentialEvent([note_like]))
+        ).leaves(grace=None)
+        self.assertEqual(grace_note.written_pitch, abjad.NamedPitch("d"))
+        self.assertEqual(
+            tuple(chord.written_pitches), (abjad.NamedPitch("c"), abjad.NamedPitch("e"))
+        )
+
     def test_grace_note_sequential_event_and_after_grace_note_sequential_event(self):
         # an integration test (testing if the rendered png
         # is equal to the previously rendered and manually checked png)
@@ -900,6 +2139,94 @@ class SequentialEventToAbjadVoiceTest(unittest.TestCase):
         os.remove(new_png_file_path)
 
 
+class IncrementalSequentialEventToAbjadVoiceTest(unittest.TestCase):
+    def setUp(self):
+        self.converter = abjad_converters.IncrementalSequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        self.reference_converter = abjad_converters.SequentialEventToAbjadVoice(
+            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+        )
+        self.sequential_event = core_events.SequentialEvent(
+            [
+                music_events.NoteLike(pitch, duration)
+                for pitch, duration in zip(
+                    "c d e f g a b c".split(), (0.75, 0.5, 0.5, 0.25, 1, 0.5, 0.5, 1)
+                )
+            ]
+        )
+        for nth_event, simple_event in enumerate(self.sequential_event):
+            simple_event.lyric = music_parameters.DirectLyric(f"la{nth_event}")
+
+    def _test_convert(self, n_converted_bars: int, n_reused_bars: int):
+        n_converted_bars_before = self.converter.n_converted_bars
+        n_reused_bars_before = self.converter.n_reused_bars
+        self.assertEqual(
+            abjad.lilypond(self.converter.convert(self.sequential_event)),
+            abjad.lilypond(self.reference_converter.convert(self.sequential_event)),
+        )
+        self.assertEqual(
+            self.converter.n_converted_bars - n_converted_bars_before,
+            n_converted_bars,
+        )
+        self.assertEqual(
+            self.converter.n_reused_bars - n_reused_bars_before, n_reused_bars
+        )
+
+    def test_convert(self):
+        # Bars: (1, 2) 3 4 5
+        self._test_convert(5, 0)
+        self._test_convert(0, 5)
+        # Change pitch of tied note
+        self.sequential_event[1].pitch_list = "a"
+        self._test_convert(2, 3)
+        # Change duration of last note
+        self.sequential_event[7].duration = 0.5
+        self._test_convert(1, 4)
+
+    def test_convert_with_changed_toggle_attachment(self):
+        self._test_convert(5, 0)
+        # The dynamic of the next bar has to be written now
+        self.sequential_event[4].volume = music_parameters.WesternVolume("p")
+        self._test_convert(2, 3)
+        self.sequential_event[4].volume = music_parameters.WesternVolume("mf")
+        self._test_convert(2, 3)
+
+    def test_convert_with_attribute_ignored_by_equality(self):
+        self.sequential_event[4].pitch_list = [
+            music_parameters.JustIntonationPitch("3/2", concert_pitch=440)
+        ]
+        self._test_convert(5, 0)
+        # Just intonation pitches which only differ in their concert
+        # pitch are equal, but they may be notated differently.
+        self.sequential_event[4].pitch_list = [
+            music_parameters.JustIntonationPitch("3/2", concert_pitch=442)
+        ]
+        self._test_convert(1, 4)
+
+    def test_convert_with_rests_across_bar_lines(self):
+        for nth_event in (2, 3, 4):
+            self.sequential_event[nth_event].pitch_list = []
+        self.sequential_event[2].playing_indicator_collection.articulation.name = "."
+        # Bars: (1, 2, 3) 4 5
+        self._test_convert(5, 0)
+        # Bars: (1, 2, 3, 4) 5
+        self.sequential_event[5].pitch_list = []
+        self._test_convert(4, 1)
+
+    def test_clear(self):
+        self._test_convert(5, 0)
+        self.converter.clear()
+        self.assertEqual(self.converter.n_converted_bars, 0)
+        self.assertEqual(self.converter.n_reused_bars, 0)
+        self._test_convert(5, 0)
+
+    def test_returned_bars_are_copies(self):
+        abjad_voice = self.converter.convert(self.sequential_event)
+        abjad.mutate.transpose(abjad_voice, 12)
+        self._test_convert(0, 5)
+
+
 class NestedComplexEventToAbjadContainerTest(unittest.TestCase):
     def test_nested_conversion(self):
         # an integration test (testing if the rendered png
@@ -1030,6 +2357,83 @@ class NestedComplexEventToAbjadContainerTest(unittest.TestCase):
         # remove test file
         os.remove(new_png_file_path)
 
+    def test_parallel_conversion(self):
+        nested_event = core_events.TaggedSimultaneousEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [music_events.NoteLike(pitch, 0.5), music_events.NoteLike([], 1.5)],
+                    tag=f"Voice {pitch}",
+                )
+                for pitch in "c e g".split()
+            ],
+            tag="Staff",
+        )
+
+        def make_converter(n_workers: int):
+            return abjad_converters.NestedComplexEventToAbjadContainer(
+                abjad_converters.CycleBasedNestedComplexEventToComplexEventToAbjadContainers(
+                    [
+                        abjad_converters.SequentialEventToAbjadVoice(
+                            abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer(),
+                            complex_event_to_abjad_container_name=lambda complex_event: complex_event.tag,
+                            post_process_abjad_container_routine_sequence=(
+                                abjad_converters.SetStaffSize(-3),
+                            ),
+                        )
+                    ]
+                ),
+                abjad.Staff,
+                "Staff",
+                n_workers=n_workers,
+            )
+
+        abjad_staff = make_converter(3).convert(nested_event)
+        self.assertEqual(
+            abjad.lilypond(asyncio.run(make_converter(1).aconvert(nested_event))),
+            abjad.lilypond(abjad_staff),
+        )
+        self.assertEqual(
+            [abjad_voice.name for abjad_voice in abjad_staff],
+            ["Voice c", "Voice e", "Voice g"],
+        )
+        self.assertEqual(
+            abjad.lilypond(abjad_staff),
+            abjad.lilypond(make_converter(1).convert(nested_event)),
+        )
+
+    def test_parallel_conversion_with_invalid_child(self):
+        converter = abjad_converters.NestedComplexEventToAbjadContainer(
+            abjad_converters.CycleBasedNestedComplexEventToComplexEventToAbjadContainers(
+                [
+                    abjad_converters.SequentialEventToAbjadVoice(
+                        abjad_converters.LeafMakerSequentialEventToQuantizedAbjadContainer()
+                    )
+                ]
+            ),
+            abjad.Staff,
+            "Staff",
+            n_workers=2,
+        )
+        # Converters with default arguments can be sent to
+        # worker processes which aren't forked.
+        pickle.loads(pickle.dumps(converter))
+        nested_event = core_events.TaggedSimultaneousEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [music_events.NoteLike("c", duration)], tag=tag
+                )
+                # Negative durations can't be converted
+                for duration, tag in ((1, "Voice 0"), (-1, "Voice 1"))
+            ],
+            tag="Staff",
+        )
+        with self.assertRaisesRegex(
+            building.ChildConversionError, "child 1 .*Voice 1"
+        ) as context:
+            converter.convert(nested_event)
+        self.assertEqual(context.exception.nth_child, 1)
+        self.assertIsNotNone(context.exception.__cause__)
+
 
 if __name__ == "__main__":
     unittest.main()